@@ -0,0 +1,148 @@
+"""
+Offline end-to-end benchmark against the local mock QuillBot page.
+
+Starts benchmarks/mock_quillbot.py in-process, points a Quillbot session at it via
+`base_url`, runs a set of synthetic documents through it and reports per-chunk latency
+percentiles, documents per minute, peak browser RSS, per-phase timings and WebDriver
+commands issued (from `bot.metrics`).
+
+Usage:
+    python benchmarks/bench_mock.py --docs 5 --words 400 --latency 0.5 --jitter 0.2
+    python benchmarks/bench_mock.py --tool humanize --mode Advanced --parallel-tabs 3
+    python benchmarks/bench_mock.py --lean
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from typing import List
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from mock_quillbot import MockConfig, start_mock_server  # noqa: E402
+
+WORDS = (
+    "the quick brown fox jumps over lazy dog while researchers measure latency throughput "
+    "and memory across several browser sessions running synthetic documents through a mock "
+    "paraphrasing service that answers after configurable delays"
+).split()
+
+
+def make_document(words: int, rng: random.Random) -> str:
+    """Builds a synthetic document of roughly `words` words in 8-20 word sentences."""
+    sentences = []
+    remaining = words
+    while remaining > 0:
+        n = min(remaining, rng.randint(8, 20))
+        sentence = " ".join(rng.choice(WORDS) for _ in range(n))
+        sentences.append(sentence[0].upper() + sentence[1:] + ".")
+        remaining -= n
+    return " ".join(sentences)
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    k = (len(ordered) - 1) * pct / 100
+    lo, hi = int(k), min(int(k) + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=3, help="Number of synthetic documents")
+    parser.add_argument("--words", type=int, default=300, help="Words per document")
+    parser.add_argument("--latency", type=float, default=0.5, help="Mock API latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.1, help="Uniform +/- jitter in seconds")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of mock requests that fail")
+    parser.add_argument("--tool", choices=["paraphrase", "humanize"], default="paraphrase")
+    parser.add_argument("--mode", default="Basic", help="Humanizer mode")
+    parser.add_argument("--parallel-tabs", type=int, default=1)
+    parser.add_argument("--input-method", choices=["paste", "cdp", "keys"], default="paste")
+    parser.add_argument("--output-capture", choices=["dom", "network"], default="dom")
+    parser.add_argument("--output-timeout", type=float, default=15.0)
+    parser.add_argument("--settle-time", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--word-limit", type=int, default=125, help="Mock input word limit, detected by the bot (0 for none)")
+    parser.add_argument("--lean", action="store_true", help="Run the browser in lean mode")
+    parser.add_argument("--recycle-after-chunks", type=int, help="Restart the browser after this many chunks")
+    parser.add_argument("--driver-path", help="Explicit chromedriver path")
+    parser.add_argument("--headless", action=argparse.BooleanOptionalAction, default=True)
+    args = parser.parse_args()
+
+    from quillbot.bot import Quillbot
+
+    config = MockConfig(args.latency, args.jitter, args.failure_rate, seed=args.seed, word_limit=args.word_limit)
+    httpd = start_mock_server(config)
+    base_url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    print(f"Mock QuillBot at {base_url}")
+
+    rng = random.Random(args.seed)
+    documents = [make_document(args.words, rng) for _ in range(args.docs)]
+
+    bot = Quillbot(
+        headless=args.headless,
+        output_timeout=args.output_timeout,
+        settle_time=args.settle_time,
+        input_method=args.input_method,
+        output_capture=args.output_capture,
+        driver_path=args.driver_path,
+        base_url=base_url,
+        lean=args.lean,
+        recycle_after_chunks=args.recycle_after_chunks,
+        # The mock runs on a new port each time, so there is nothing to cache.
+        word_limit_cache=None
+    )
+    print(f"Words per chunk: {bot.word_limit_for(args.tool, args.mode)}")
+
+    latencies: List[float] = []
+    failed = 0
+    peak_rss = 0
+    start = time.perf_counter()
+    try:
+        for n, document in enumerate(documents, 1):
+            if args.tool == "paraphrase":
+                results = bot.iter_paraphrase(document, parallel_tabs=args.parallel_tabs)
+            else:
+                results = bot.iter_humanize(document, mode=args.mode, parallel_tabs=args.parallel_tabs)
+            for result in results:
+                latencies.append(result.seconds)
+                if result.output is None:
+                    failed += 1
+            peak_rss = max(peak_rss, bot.browser_rss() or 0)
+            print(f"document {n}/{len(documents)} done")
+    finally:
+        elapsed = time.perf_counter() - start
+        bot.close()
+        httpd.shutdown()
+
+    print()
+    print(f"chunks                   {len(latencies):8d}  ({failed} failed)")
+    print(f"chunk latency p50        {percentile(latencies, 50):8.2f} s")
+    print(f"chunk latency p90        {percentile(latencies, 90):8.2f} s")
+    print(f"chunk latency p99        {percentile(latencies, 99):8.2f} s")
+    if latencies:
+        print(f"chunk latency mean       {statistics.mean(latencies):8.2f} s")
+    print(f"documents per minute     {len(documents) / elapsed * 60:8.2f}")
+    print(f"peak browser RSS         {peak_rss / 2 ** 20:8.1f} MiB" if peak_rss else "peak browser RSS              n/a")
+    snapshot = bot.metrics.snapshot()
+    print("phase means")
+    for phase, stats in snapshot["phases"].items():
+        print(f"  {phase:<22} {stats['mean'] * 1000:8.1f} ms  (x{stats['count']})")
+    commands = Counter(snapshot["commands"])
+    print(f"WebDriver commands       {sum(commands.values()):8d}  ({sum(commands.values()) / max(len(latencies), 1):.1f} per chunk)")
+    for command, count in commands.most_common(8):
+        print(f"  {command:<22} {count:8d}")
+    if snapshot["retries"]:
+        print(f"retries                  {snapshot['retries']}")
+    print(f"mock stats               {config.stats}")
+
+
+if __name__ == "__main__":
+    main()
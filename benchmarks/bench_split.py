@@ -0,0 +1,130 @@
+"""
+Benchmark for quillbot.text.split_text on large inputs.
+
+Builds a synthetic document of the requested size from input/paraphrase.txt (plus some
+very long sentences), splits it with the current splitter and with the previous
+implementation, and reports throughput, chunk counts and the largest chunk.
+
+With --check N it instead splits N random documents at random limits and verifies that
+no chunk exceeds the limit and no words are lost or reordered (exit status 1 if any do).
+
+Usage:
+    python benchmarks/bench_split.py --size-mb 4 --limit 125
+    python benchmarks/bench_split.py --check 2000
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from quillbot.text import split_problems, split_text
+
+WORD_RE = re.compile(r'\b[\w\']+\b')
+
+
+def legacy_split_text(text, limit=125):
+    """The splitter as it was before the single-pass rewrite, kept for comparison."""
+    words = re.findall(r'\b[\w\']+\b', text)
+    if len(words) <= limit:
+        return [text]
+    chunks = []
+    current_word_count = 0
+    sentences = re.split(r'(?<=[.!?])\s+', text)
+    current_chunk_str = ""
+    for sentence in sentences:
+        sentence_word_count = len(re.findall(r'\b[\w\']+\b', sentence))
+        if current_word_count + sentence_word_count <= limit:
+            current_chunk_str += sentence + " "
+            current_word_count += sentence_word_count
+        else:
+            if sentence_word_count > limit:
+                if current_chunk_str:
+                    chunks.append(current_chunk_str.strip())
+                chunks.append(sentence.strip())
+                current_chunk_str = ""
+                current_word_count = 0
+            else:
+                chunks.append(current_chunk_str.strip())
+                current_chunk_str = sentence + " "
+                current_word_count = sentence_word_count
+    if current_chunk_str:
+        chunks.append(current_chunk_str.strip())
+    return chunks
+
+
+def build_document(size_mb: float) -> str:
+    sample_file = os.path.join(os.path.dirname(__file__), '..', 'input', 'paraphrase.txt')
+    with open(sample_file, 'r', encoding='utf-8') as f:
+        sample = f.read().strip()
+    long_sentence = ", ".join(["automation reduces manual effort across every device"] * 40) + "."
+    block = sample + "\n\n" + long_sentence + "\n\n"
+    target = int(size_mb * 1024 * 1024)
+    return block * max(1, target // len(block))
+
+
+def random_document(rng: random.Random) -> str:
+    """A document mixing short and over-long sentences, clause marks, line breaks and odd spacing."""
+    vocabulary = ["alpha", "beta's", "gamma", "don't", "x", "42", "naïve", "co-op", "end", "e.g"]
+    sentences = []
+    for _ in range(rng.randint(0, 30)):
+        words = [rng.choice(vocabulary) for _ in range(rng.choice([1, 3, 8, 20, 60, 200]))]
+        for k in range(len(words) - 1):
+            if rng.random() < 0.1:
+                words[k] += rng.choice([",", ";", ":", " \u2013", " \u2014"])
+        sentences.append(" ".join(words) + rng.choice([".", "!", "?", "", "..."]))
+    return "".join(s + rng.choice([" ", "  ", "\n", "\n\n", "\t"]) for s in sentences)
+
+
+def check(cases: int, seed: int) -> int:
+    rng = random.Random(seed)
+    failures = 0
+    for case in range(cases):
+        text = random_document(rng)
+        limit = rng.choice([1, 2, 5, 17, 50, 125, 1000])
+        problems = split_problems(text, split_text(text, limit), limit)
+        if problems:
+            failures += 1
+            print(f"case {case} (limit {limit}): {'; '.join(problems)}")
+    print(f"{cases} cases, {failures} failed")
+    return 1 if failures else 0
+
+
+def measure(name, func, text, limit, repeat):
+    best = float("inf")
+    chunks = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        chunks = func(text, limit)
+        best = min(best, time.perf_counter() - start)
+    counts = [len(WORD_RE.findall(c)) for c in chunks]
+    mb = len(text.encode('utf-8')) / (1024 * 1024)
+    print(
+        f"{name:8s} {best:8.3f}s  {mb / best:7.1f} MB/s  chunks={len(chunks):6d}  "
+        f"max_words={max(counts):5d}  over_limit={sum(1 for c in counts if c > limit)}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=4.0)
+    parser.add_argument("--limit", type=int, default=125)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--check", type=int, metavar="N", help="Verify the split guarantees on N random documents")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.check:
+        sys.exit(check(args.check, args.seed))
+
+    text = build_document(args.size_mb)
+    print(f"Document: {len(text) / (1024 * 1024):.1f} MB, {len(WORD_RE.findall(text))} words, limit={args.limit}")
+    measure("current", split_text, text, args.limit, args.repeat)
+    measure("legacy", legacy_split_text, text, args.limit, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
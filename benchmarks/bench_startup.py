@@ -0,0 +1,78 @@
+"""
+Startup benchmark: import cost and time until the paraphraser page is ready.
+
+Measures, in fresh interpreters, how long `import quillbot` and `import quillbot.bot` take,
+then how long chromedriver resolution, the Chrome launch and the first page load take.
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --url http://127.0.0.1:8000/paraphrasing-tool
+    python benchmarks/bench_startup.py --skip-browser
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+
+
+def time_import(module: str, repeat: int) -> float:
+    """Median wall time of importing `module` in a fresh interpreter, in seconds."""
+    code = (
+        "import time; t = time.perf_counter(); "
+        f"import {module}; "
+        "print(time.perf_counter() - t)"
+    )
+    samples = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+        samples.append(float(out.stdout.strip()))
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per import measurement")
+    parser.add_argument("--url", help="Page to load instead of the live paraphrasing tool")
+    parser.add_argument("--driver-path", help="Explicit chromedriver path")
+    parser.add_argument("--skip-browser", action="store_true", help="Only measure imports")
+    parser.add_argument("--lean", action="store_true", help="Launch the browser in lean mode")
+    parser.add_argument("--headless", action=argparse.BooleanOptionalAction, default=True)
+    args = parser.parse_args()
+
+    print(f"import quillbot          {time_import('quillbot', args.repeat) * 1000:8.1f} ms")
+    print(f"import quillbot.bot      {time_import('quillbot.bot', args.repeat) * 1000:8.1f} ms")
+    if args.skip_browser:
+        return
+
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+
+    from quillbot.bot import PARAPHRASER_URL, Quillbot
+    from quillbot.driver import resolve_driver_path
+
+    start = time.perf_counter()
+    driver_path = resolve_driver_path(args.driver_path)
+    print(f"resolve chromedriver     {(time.perf_counter() - start) * 1000:8.1f} ms  ({driver_path or 'Selenium Manager'})")
+
+    start = time.perf_counter()
+    bot = Quillbot(headless=args.headless, driver_path=driver_path, lean=args.lean)
+    launched = time.perf_counter()
+    try:
+        bot.driver.get(args.url or PARAPHRASER_URL)
+        bot.wait.until(EC.presence_of_element_located((By.ID, "paraphraser-input-box")))
+        ready = time.perf_counter()
+    finally:
+        bot.close()
+
+    print(f"launch Chrome            {(launched - start) * 1000:8.1f} ms")
+    print(f"first page ready         {(ready - launched) * 1000:8.1f} ms")
+    print(f"time to first ready page {(ready - start) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""
+Local mock of QuillBot's paraphrasing and humanizer pages for offline benchmarking.
+
+Serves /paraphrasing-tool and /ai-humanizer with the same DOM contract the bot relies on
+(#paraphraser-input-box, #paraphraser-output-box, the Paraphrase/Humanize buttons and the
+#Paraphraser-mode-tab-0/1 tabs). Clicking the button POSTs the text to a JSON endpoint
+(/api/paraphrase or /api/humanize) that answers after a configurable latency, with jitter
+and a failure rate, and the page then renders the result progressively. A word counter
+("12/125 Words", or "12 Words" without a limit) shows the configured limit, and the API
+rejects longer inputs like the real free tier.
+
+Usage:
+    python benchmarks/mock_quillbot.py --port 8000 --latency 2 --jitter 0.5 --failure-rate 0.05
+"""
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Mock QuillBot - __TITLE__</title>
+<link rel="stylesheet" href="/static/fonts.css">
+<link rel="preload" href="/static/editor.woff2" as="font" type="font/woff2" crossorigin>
+<style>
+  body { font-family: sans-serif; margin: 40px; }
+  #paraphraser-input-box, #paraphraser-output-box { border: 1px solid #ccc; min-height: 120px; padding: 8px; margin: 8px 0; }
+  [role=tab][aria-selected=true] { font-weight: bold; }
+</style>
+</head>
+<body>
+<img src="/static/banner.png" width="1" height="1" alt="">
+<div role="tablist" style="display: __TABS__">
+  <button role="tab" id="Paraphraser-mode-tab-0" aria-selected="true">Basic</button>
+  <button role="tab" id="Paraphraser-mode-tab-1" aria-selected="false">Advanced</button>
+</div>
+<div id="paraphraser-input-box" contenteditable="true"></div>
+<div class="word-count"><span id="word-count">0</span>__LIMIT_TEXT__ Words</div>
+<button class="MuiButton-root MuiButton-containedPrimary" id="action" disabled>__BUTTON__</button>
+<div id="paraphraser-output-box"><div contenteditable="true"></div></div>
+<script>
+(function () {
+  var tool = "__TOOL__";
+  var mode = "Basic";
+  var input = document.getElementById("paraphraser-input-box");
+  var button = document.getElementById("action");
+  var output = document.querySelector("#paraphraser-output-box div");
+
+  var counter = document.getElementById("word-count");
+  function sync() {
+    var text = input.innerText.trim();
+    counter.textContent = text ? text.split(/\s+/).length : 0;
+    button.disabled = !text;
+  }
+  input.addEventListener("input", sync);
+  input.addEventListener("paste", function (e) {
+    e.preventDefault();
+    var text = (e.clipboardData || window.clipboardData).getData("text/plain");
+    document.execCommand("insertText", false, text);
+    sync();
+  });
+
+  document.querySelectorAll("[role=tab]").forEach(function (tab, i) {
+    tab.addEventListener("click", function () {
+      document.querySelectorAll("[role=tab]").forEach(function (t) { t.setAttribute("aria-selected", "false"); });
+      tab.setAttribute("aria-selected", "true");
+      mode = i === 0 ? "Basic" : "Advanced";
+    });
+  });
+
+  button.addEventListener("click", function () {
+    if (button.disabled) return;
+    button.disabled = true;
+    button.setAttribute("aria-busy", "true");
+    output.innerText = "";
+    fetch("/api/" + tool, {
+      method: "POST",
+      headers: {"Content-Type": "application/json"},
+      body: JSON.stringify({text: input.innerText, mode: mode})
+    }).then(function (r) {
+      if (!r.ok) throw new Error("HTTP " + r.status);
+      return r.json();
+    }).then(function (data) {
+      // Render in a few steps, like the real editor filling in.
+      var words = data.text.split(" ");
+      var steps = __RENDER_STEPS__, step = 0;
+      function render() {
+        step += 1;
+        output.innerText = words.slice(0, Math.ceil(words.length * step / steps)).join(" ");
+        if (step < steps) setTimeout(render, __RENDER_INTERVAL__);
+        else { button.removeAttribute("aria-busy"); sync(); }
+      }
+      render();
+    }).catch(function () {
+      button.removeAttribute("aria-busy");
+      sync();
+    });
+  });
+})();
+</script>
+</body>
+</html>
+"""
+
+TOOLS = {
+    "/paraphrasing-tool": ("paraphrase", "Paraphrase", "Paraphrasing Tool", "none"),
+    "/ai-humanizer": ("humanize", "Humanize", "AI Humanizer", "block"),
+}
+
+
+class MockConfig:
+    """Behaviour of the mock API."""
+
+    def __init__(
+        self,
+        latency: float = 1.0,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        render_steps: int = 3,
+        render_interval_ms: int = 100,
+        seed: Optional[int] = None,
+        word_limit: int = 125
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.render_steps = max(1, render_steps)
+        self.render_interval_ms = render_interval_ms
+        # 0 means no limit.
+        self.word_limit = word_limit
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats: Dict[str, int] = {"pages": 0, "requests": 0, "failures": 0, "static": 0}
+
+    def count(self, key: str):
+        with self.lock:
+            self.stats[key] += 1
+
+
+def transform(text: str, tool: str, mode: str) -> str:
+    """Deterministic stand-in for the rewrite: reverses word order within each sentence."""
+    sentences = [s for s in text.replace("\n", " ").split(". ") if s.strip()]
+    rewritten = [" ".join(reversed(s.strip().rstrip(".").split())) for s in sentences]
+    prefix = "" if tool == "paraphrase" else f"({mode}) "
+    return prefix + ". ".join(rewritten) + "."
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    config: MockConfig
+
+    def _send(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path in TOOLS:
+            tool, button, title, tabs = TOOLS[path]
+            self.config.count("pages")
+            page = (
+                PAGE.replace("__TOOL__", tool)
+                .replace("__BUTTON__", button)
+                .replace("__TITLE__", title)
+                .replace("__TABS__", tabs)
+                .replace("__RENDER_STEPS__", str(self.config.render_steps))
+                .replace("__RENDER_INTERVAL__", str(self.config.render_interval_ms))
+                .replace("__LIMIT_TEXT__", f"/{self.config.word_limit}" if self.config.word_limit else "")
+            )
+            return self._send(200, page.encode("utf-8"), "text/html; charset=utf-8")
+        if path.startswith("/static/"):
+            # Stand-ins for heavy assets, so resource blocking (lean mode) can be observed.
+            self.config.count("static")
+            content_type = {".css": "text/css", ".woff2": "font/woff2"}.get(os.path.splitext(path)[1], "image/png")
+            return self._send(200, b"/* mock asset */", content_type)
+        if path == "/stats":
+            with self.config.lock:
+                return self._send(200, json.dumps(self.config.stats).encode("utf-8"), "application/json")
+        self._send(404, b"Not found", "text/plain")
+
+    def do_POST(self):
+        path = self.path.split("?", 1)[0]
+        if path not in ("/api/paraphrase", "/api/humanize"):
+            return self._send(404, b"Not found", "text/plain")
+        length = int(self.headers.get("Content-Length") or 0)
+        payload: Dict[str, Any] = json.loads(self.rfile.read(length) or b"{}")
+        self.config.count("requests")
+
+        cfg = self.config
+        with cfg.lock:
+            delay = max(0.0, cfg.latency + cfg.random.uniform(-cfg.jitter, cfg.jitter))
+            fail = cfg.random.random() < cfg.failure_rate
+        time.sleep(delay)
+        if fail:
+            self.config.count("failures")
+            return self._send(500, json.dumps({"error": "mock failure"}).encode("utf-8"), "application/json")
+
+        if cfg.word_limit and len(payload.get("text", "").split()) > cfg.word_limit:
+            self.config.count("failures")
+            return self._send(400, json.dumps({"error": "word limit exceeded"}).encode("utf-8"), "application/json")
+
+        tool = path.rsplit("/", 1)[1]
+        text = transform(payload.get("text", ""), tool, payload.get("mode", "Basic"))
+        self._send(200, json.dumps({"text": text}).encode("utf-8"), "application/json")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_mock_server(config: Optional[MockConfig] = None, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """
+    Starts the mock in a background thread.
+
+    Returns:
+        ThreadingHTTPServer: The running server; its URL is http://host:server.server_address[1].
+    """
+    handler = type("Handler", (MockHandler,), {"config": config or MockConfig()})
+    httpd = ThreadingHTTPServer((host, port), handler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=1.0, help="Seconds per API response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Uniform +/- jitter in seconds")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of requests that fail")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--word-limit", type=int, default=125, help="Input word limit (0 for none)")
+    args = parser.parse_args()
+
+    config = MockConfig(args.latency, args.jitter, args.failure_rate, seed=args.seed, word_limit=args.word_limit)
+    httpd = start_mock_server(config, args.host, args.port)
+    print(f"Mock QuillBot at http://{args.host}:{httpd.server_address[1]} (Ctrl+C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        httpd.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -46,20 +46,19 @@ def main():
     try:
         # 1. Paraphrasing Example
         # Read input text from file
-        # Note: Text is read as plain text, so markdown syntax (like *, **, ----) 
-        # will be preserved in the text and sent to Quillbot as-is
+        # Note: The input is markdown. With markdown=True only the prose is sent to
+        # Quillbot; headings, bullets and bold labels are kept as they are
         input_file = os.path.join(os.path.dirname(__file__), '..', 'input', 'paraphrase.txt')
         input_file = os.path.abspath(input_file)
         
         if not os.path.exists(input_file):
             raise FileNotFoundError(f"Input file not found: {input_file}")
         
-        # Read file as plain text - markdown syntax is treated as regular text characters
         with open(input_file, 'r', encoding='utf-8') as f:
             text = f.read().strip()
         
         print(f"\n--- Paraphrasing ---\nInput: {text}")
-        res = bot.paraphrase(text)
+        res = bot.paraphrase(text, markdown=True)
         print(f"Result: {res}")
         
         # Save result to file
@@ -1,3 +1,42 @@
-from .bot import Quillbot
+"""
+Selenium automation for Quillbot's Paraphrasing and AI Humanizer tools.
 
-__all__ = ['Quillbot']
+Submodules are imported on first attribute access, so `import quillbot` stays cheap and
+does not load Selenium until a browser is actually needed.
+"""
+import importlib
+
+_EXPORTS = {
+    'Quillbot': '.bot',
+    'ChunkResult': '.bot',
+    'ChunkOutcome': '.bot',
+    'ChunkTask': '.bot',
+    'QuillbotPool': '.pool',
+    'ChunkCache': '.cache',
+    'BotMetrics': '.metrics',
+    'ConcurrencyController': '.controller',
+    'JobJournal': '.journal',
+    'ProcessReport': '.journal',
+    'IncompleteOutputError': '.journal',
+    'BatchResult': '.batch',
+    'paraphrase_many': '.batch',
+    'humanize_many': '.batch',
+    'iter_paraphrase_many': '.batch',
+    'iter_humanize_many': '.batch',
+    'AsyncQuillbot': '.async_bot',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,219 @@
+import argparse
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+from .batch_io import DEFAULT_EXTENSIONS
+
+
+def _add_bot_arguments(parser: argparse.ArgumentParser):
+    """Options shared by every command that launches browsers."""
+    parser.add_argument(
+        "--headless",
+        action=argparse.BooleanOptionalAction,
+        default=os.getenv("HEADLESS", "True").lower() == "true",
+        help="Run Chrome headless (env: HEADLESS)",
+    )
+    parser.add_argument(
+        "--user-data-dir",
+        default=os.getenv("CHROME_USER_DATA_DIR"),
+        help="Chrome User Data directory (env: CHROME_USER_DATA_DIR)",
+    )
+    parser.add_argument(
+        "--profile-directory",
+        default=os.getenv("CHROME_PROFILE_DIR", "Default"),
+        help="Chrome profile directory name (env: CHROME_PROFILE_DIR)",
+    )
+    parser.add_argument(
+        "--copy-profile",
+        action=argparse.BooleanOptionalAction,
+        default=os.getenv("COPY_PROFILE", "False").lower() == "true",
+        help="Copy the profile to a temp directory first (env: COPY_PROFILE)",
+    )
+    parser.add_argument(
+        "--lean",
+        action=argparse.BooleanOptionalAction,
+        default=os.getenv("LEAN", "False").lower() == "true",
+        help="Block images, fonts, media and trackers and use eager page loads (env: LEAN)",
+    )
+    parser.add_argument("--cache", help="Path to a SQLite chunk cache")
+    parser.add_argument("--recycle-after-chunks", type=int, help="Restart each browser after this many chunks")
+    parser.add_argument("--recycle-rss-mb", type=float, help="Restart a browser above this resident memory")
+    parser.add_argument("--recycle-after-failures", type=int, help="Restart a browser after this many failures in a row")
+    parser.add_argument("--word-limit", type=int, help="Words per chunk, instead of detecting the account's limit")
+    parser.add_argument(
+        "--output-capture",
+        choices=["dom", "network"],
+        default=os.getenv("OUTPUT_CAPTURE", "dom"),
+        help="Read results from the output box or from the API response (env: OUTPUT_CAPTURE)",
+    )
+    parser.add_argument("--retries", type=int, default=2, help="Extra attempts for a failed chunk, with exponential backoff")
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Adapt the number of chunks in flight to QuillBot's latency and errors (AIMD)",
+    )
+    parser.add_argument("--rpm", type=float, help="Ceiling on chunks started per minute, across all browsers")
+    parser.add_argument("--latency-target", type=float, help="With --adaptive, back off when a chunk takes longer")
+    parser.add_argument("--metrics-log", help="Append per-page and per-chunk timing events to this JSON-lines file")
+
+
+def _bot_kwargs(args: argparse.Namespace, open_metrics: bool = True) -> Dict[str, Any]:
+    """Quillbot keyword arguments from the shared options; `open_metrics=False` leaves `--metrics-log` to the caller."""
+    kwargs = {
+        "headless": args.headless,
+        "user_data_dir": args.user_data_dir,
+        "profile_directory": args.profile_directory,
+        "copy_profile": args.copy_profile,
+        "lean": args.lean,
+        "cache": args.cache,
+        "recycle_after_chunks": args.recycle_after_chunks,
+        "recycle_rss_mb": args.recycle_rss_mb,
+        "recycle_after_failures": args.recycle_after_failures,
+        "retries": args.retries,
+        "word_limit": args.word_limit,
+        "output_capture": args.output_capture,
+    }
+    if args.metrics_log and open_metrics:
+        from .metrics import BotMetrics
+
+        kwargs["metrics"] = BotMetrics(json_log=args.metrics_log)
+    if args.adaptive or args.rpm:
+        from .controller import ConcurrencyController
+
+        # At most one chunk in flight per browser; without --adaptive the limit stays there.
+        browsers = max(1, getattr(args, "workers", 1))
+        kwargs["controller"] = ConcurrencyController(
+            max_concurrency=browsers,
+            min_concurrency=1 if args.adaptive else browsers,
+            rpm=args.rpm,
+            latency_target=args.latency_target,
+        )
+    return kwargs
+
+
+def _cmd_serve(args: argparse.Namespace):
+    from .server import serve
+
+    serve(
+        host=args.host,
+        port=args.port,
+        unix_socket=args.unix_socket,
+        workers=args.workers,
+        queue_size=args.queue_size,
+        **_bot_kwargs(args),
+    )
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m" if hours else f"{minutes}m{seconds:02d}s"
+
+
+def _cmd_batch(args: argparse.Namespace) -> int:
+    import time
+
+    from .batch import _iter_many
+    from .batch_io import BatchWriter, collect_items
+
+    try:
+        items = collect_items(args.inputs, args.extensions.split(","), args.text_field, args.id_field)
+        writer = BatchWriter(args.output, args.suffix)
+        writer.check(items)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 2
+    skipped = 0
+    if args.resume:
+        done = writer.completed()
+        before = len(items)
+        items = [item for item in items if item.id not in done]
+        skipped = before - len(items)
+    print(f"Batch: {len(items)} documents to process, {skipped} already done, {args.workers} workers")
+
+    # Each worker process appends to the log itself, so the parent never opens it.
+    bot_kwargs = _bot_kwargs(args, open_metrics=False)
+    if args.metrics_log:
+        bot_kwargs["metrics_log"] = args.metrics_log
+    controller = bot_kwargs.get("controller")
+
+    started = time.monotonic()
+    chunks_done = [0, 0]
+
+    def progress(done: int, total: int):
+        chunks_done[0], chunks_done[1] = done, total
+
+    finished = failed = words = 0
+    try:
+        results = _iter_many([item.text for item in items], args.tool, args.mode, args.workers, bot_kwargs, progress)
+        for res in results:
+            item = items[res.index]
+            writer.write(item, res.result, res.success, res.error)
+            finished += 1
+            words += len(item.text.split())
+            if not res.success:
+                failed += 1
+            elapsed = max(time.monotonic() - started, 1e-6)
+            rate = finished / elapsed
+            eta = (len(items) - finished) / rate if rate else 0.0
+            status = "ok" if res.success else f"FAILED ({res.error})"
+            concurrency = ""
+            if controller is not None:
+                state = controller.snapshot()
+                concurrency = f", in flight {state['in_flight']}/{state['limit']}"
+            print(
+                f"[{finished}/{len(items)}] {item.id} {status} | "
+                f"chunks {chunks_done[0]}/{chunks_done[1]}, {rate * 60:.1f} docs/min, "
+                f"{words / elapsed * 60:.0f} words/min{concurrency}, ETA {_format_duration(eta)}"
+            )
+    finally:
+        writer.close()
+
+    elapsed = time.monotonic() - started
+    print(
+        f"Batch finished in {_format_duration(elapsed)}: {finished - failed} succeeded, "
+        f"{failed} failed, {skipped} skipped"
+    )
+    if failed:
+        print("Rerun with --resume to retry only the failed documents")
+    return 1 if failed else 0
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(prog="python -m quillbot", description="Quillbot automation tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="Run a local HTTP daemon with warm browser sessions")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--unix-socket", help="Listen on a Unix socket instead of TCP")
+    serve.add_argument("--workers", type=int, default=1, help="Warm browsers / concurrent jobs")
+    serve.add_argument("--queue-size", type=int, default=100, help="Queued jobs before HTTP 429")
+    _add_bot_arguments(serve)
+    serve.set_defaults(func=_cmd_serve)
+
+    batch = commands.add_parser("batch", help="Process many documents with several browsers")
+    batch.add_argument(
+        "inputs",
+        nargs="+",
+        help="Directories, files, glob patterns, JSONL files, or - for JSONL on stdin",
+    )
+    batch.add_argument("-o", "--output", required=True, help="Output directory, or a .jsonl file")
+    batch.add_argument("--tool", choices=["paraphrase", "humanize"], default="paraphrase")
+    batch.add_argument("--mode", default="Basic", help="Humanizer mode")
+    batch.add_argument("--workers", type=int, default=2, help="Worker processes (browsers)")
+    batch.add_argument("--resume", action="store_true", help="Skip documents that already have a successful output")
+    batch.add_argument("--extensions", default=",".join(DEFAULT_EXTENSIONS), help="File types read from directories")
+    batch.add_argument("--suffix", default="", help="Appended to output file names in directory mode")
+    batch.add_argument("--text-field", default="text", help="Text field of JSONL input")
+    batch.add_argument("--id-field", default="id", help="Id field of JSONL input")
+    _add_bot_arguments(batch)
+    batch.set_defaults(func=_cmd_batch)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
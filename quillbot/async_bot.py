@@ -0,0 +1,175 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from .text import split_text
+from .cache import ChunkCache
+from .controller import ConcurrencyController
+from .journal import ChunkFailure, IncompleteOutputError, ProcessReport
+from .limits import limit_key, word_limit_from_kwargs
+from .metrics import BotMetrics
+from .pool import QuillbotPool
+
+T = TypeVar("T")
+
+
+class AsyncQuillbot:
+    """
+    asyncio front-end for Quillbot.
+
+    Browser sessions come from a QuillbotPool of at most `max_sessions` browsers and every
+    WebDriver call runs on a dedicated thread pool, so the event loop never blocks. Waiting
+    for output is done with `asyncio.sleep` between probes, which lets any number of
+    in-flight requests share one process; excess requests queue on a semaphore.
+    """
+
+    def __init__(self, max_sessions: int = 2, warm_sessions: int = 0, **bot_kwargs: Any):
+        """
+        Initialize the async client. Browsers are launched lazily unless `warm_sessions` > 0.
+
+        Args:
+            max_sessions (int): Maximum number of concurrent browser sessions.
+            warm_sessions (int): Sessions to launch up front.
+            **bot_kwargs: Keyword arguments forwarded to Quillbot. A `cache` path is opened
+                once and shared by all sessions, as is `metrics` (created if not given).
+        """
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be >= 1")
+        self.max_sessions = max_sessions
+        cache = bot_kwargs.get("cache")
+        if isinstance(cache, str):
+            # Open once and share the instance between all sessions.
+            bot_kwargs["cache"] = ChunkCache(cache)
+        self.cache: Optional[ChunkCache] = bot_kwargs.get("cache")
+        # One metrics store for all sessions, so totals cover the whole client.
+        self.metrics: BotMetrics = bot_kwargs.setdefault("metrics", BotMetrics())
+        if isinstance(bot_kwargs.get("controller"), ConcurrencyController):
+            bot_kwargs["controller"].attach(self.metrics)
+        self._executor = ThreadPoolExecutor(max_workers=max_sessions, thread_name_prefix="quillbot")
+        self._pool = QuillbotPool(size=warm_sessions, max_size=max_sessions, **bot_kwargs)
+        self._bot_kwargs = bot_kwargs
+        # Word limits reported by the sessions, so later documents are cut right up front.
+        self._word_limits: Dict[str, int] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # Outcome of the most recently finished paraphrase()/humanize() call.
+        self.last_report: Optional[ProcessReport] = None
+
+    async def _call(self, func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Created lazily so it binds to the running loop.
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_sessions)
+        return self._semaphore
+
+    async def _cached(self, chunks: List[str], tool: str, mode: str) -> List[Optional[str]]:
+        """Outputs known without a browser: cache hits, and blank chunks as they are."""
+        cache_mode = mode if tool == "humanize" else ""
+        return [
+            c if not c.strip() else None if self.cache is None else await self._call(self.cache.get, tool, cache_mode, c)
+            for c in chunks
+        ]
+
+    async def _run(self, text: str, tool: str, mode: str = "Basic", strict: bool = False) -> str:
+        """
+        Processes one document. Failed chunks keep their original text; the outcome is
+        stored in `last_report` and a summary is printed if chunks failed.
+
+        Raises:
+            IncompleteOutputError: In strict mode, if any chunk failed.
+        """
+        key = limit_key(tool, mode)
+        limit = self._word_limits.get(key) or word_limit_from_kwargs(tool, mode, self._bot_kwargs)
+        chunks = split_text(text, limit)
+        outputs: List[Optional[str]] = []
+        report = ProcessReport(total=len(chunks))
+
+        # Serve the whole document from cache when possible, without taking a session.
+        cached = await self._cached(chunks, tool, mode)
+        if all(o is not None for o in cached):
+            self.last_report = report
+            return " ".join(o for o in cached if o).strip()
+
+        async with self._get_semaphore():
+            bot = await self._call(self._pool.checkout)
+            failed = False
+            try:
+                # The session may know (or detect) a different limit for its account.
+                self._word_limits[key] = await self._call(bot.word_limit_for, tool, mode)
+                if self._word_limits[key] != limit:
+                    chunks = split_text(text, self._word_limits[key])
+                    report.total = len(chunks)
+                    cached = await self._cached(chunks, tool, mode)
+                for i, chunk in enumerate(chunks):
+                    if cached[i] is not None:
+                        outputs.append(cached[i])
+                        continue
+                    task = bot.chunk_task(tool, mode, chunk, i)
+                    try:
+                        # Each step is one short WebDriver call; backoff and output waits
+                        # happen here, between steps.
+                        while not await self._call(task.step):
+                            await asyncio.sleep(bot.poll_interval)
+                    except BaseException:
+                        # Cancelled: free the slot without counting the chunk as failed.
+                        task.abandon()
+                        raise
+                    if task.output is None:
+                        report.failures.append(ChunkFailure(i, chunk, task.attempts, task.error or "No output received"))
+                    # A failed chunk keeps its input text so the document stays whole.
+                    outputs.append(task.output if task.output is not None else chunk)
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                await self._call(self._pool.checkin, bot, failed)
+
+        result = " ".join(o for o in outputs if o).strip()
+        self.last_report = report
+        if not report.complete:
+            print(report.summary())
+            if strict:
+                raise IncompleteOutputError(report, result)
+        return result
+
+    async def paraphrase(self, text: str, strict: bool = False) -> str:
+        """
+        Paraphrases the given text without blocking the event loop.
+
+        Args:
+            text (str): Input text.
+            strict (bool): Raise IncompleteOutputError instead of returning partial output.
+
+        Returns:
+            str: Paraphrased text, with the original text of failed chunks. See
+            `last_report` for failed chunks.
+        """
+        return await self._run(text, "paraphrase", strict=strict)
+
+    async def humanize(self, text: str, mode: str = "Basic", strict: bool = False) -> str:
+        """
+        Humanizes the given text without blocking the event loop.
+
+        Args:
+            text (str): Input text.
+            mode (str): "Basic" or "Advanced". Note: Advanced requires a logged-in session.
+            strict (bool): Raise IncompleteOutputError instead of returning partial output.
+
+        Returns:
+            str: Humanized text, with the original text of failed chunks. See
+            `last_report` for failed chunks.
+        """
+        return await self._run(text, "humanize", mode, strict)
+
+    async def close(self):
+        """Closes all browser sessions and the worker threads."""
+        await self._call(self._pool.close)
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> "AsyncQuillbot":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -0,0 +1,307 @@
+import multiprocessing
+import queue
+import threading
+from dataclasses import dataclass, field
+from multiprocessing.managers import BaseManager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from .cache import ChunkCache
+from .controller import ConcurrencyController
+from .limits import word_limit_from_kwargs
+from .text import split_text
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one input document in a batch run."""
+
+    index: int
+    text: str
+    result: Optional[str] = None
+    success: bool = False
+    error: Optional[str] = None
+    failed_chunks: List[int] = field(default_factory=list)
+
+
+class _ControllerManager(BaseManager):
+    """Serves the parent's ConcurrencyController to the worker processes."""
+
+
+_shared_controller: Optional[ConcurrencyController] = None
+_ControllerManager.register("controller", callable=lambda: _shared_controller)
+
+
+def _share_controller(controller: ConcurrencyController):
+    """Starts a manager server thread in this process that exposes `controller` to workers."""
+    global _shared_controller
+    _shared_controller = controller
+    manager = _ControllerManager(address=("127.0.0.1", 0), authkey=multiprocessing.current_process().authkey)
+    server = manager.get_server()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _worker_kwargs(bot_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Replaces Quillbot arguments that cannot be sent to a worker process with ones that can:
+    a ChunkCache becomes its path and a BotMetrics its `json_log` path.
+
+    Raises:
+        ValueError: For a BotMetrics without a `json_log` path, which workers cannot share.
+    """
+    from .metrics import BotMetrics
+
+    kwargs = dict(bot_kwargs)
+    if isinstance(kwargs.get("cache"), ChunkCache):
+        kwargs["cache"] = kwargs["cache"].path
+    metrics = kwargs.get("metrics")
+    if isinstance(metrics, BotMetrics):
+        if not metrics.json_log_path:
+            raise ValueError(
+                "metrics cannot be shared with batch worker processes; "
+                "use BotMetrics(json_log=path) or pass metrics_log=path"
+            )
+        del kwargs["metrics"]
+        kwargs.setdefault("metrics_log", metrics.json_log_path)
+    return kwargs
+
+
+def _worker(tasks, results, bot_kwargs: Dict[str, Any]):
+    """
+    Worker process body. Owns one Quillbot and pulls chunks from the shared task queue
+    until it receives a None sentinel, so idle workers naturally steal remaining work.
+    """
+    from .bot import Quillbot
+
+    controller_address = bot_kwargs.pop("controller_address", None)
+    if controller_address:
+        manager = _ControllerManager(address=controller_address, authkey=multiprocessing.current_process().authkey)
+        manager.connect()
+        bot_kwargs["controller"] = manager.controller()
+    metrics_log = bot_kwargs.pop("metrics_log", None)
+    if metrics_log:
+        from .metrics import BotMetrics
+
+        # BotMetrics cannot cross the process boundary; each worker appends to the same file.
+        bot_kwargs["metrics"] = BotMetrics(json_log=metrics_log)
+    try:
+        bot = Quillbot(**bot_kwargs)
+    except Exception as e:
+        results.put(("worker_failed", None, None, None, f"Could not start browser: {e}"))
+        return
+
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            doc_index, chunk_index, tool, mode, chunk = task
+            outcome = bot.process_chunk(tool, mode, chunk, chunk_index)
+            results.put(("chunk", doc_index, chunk_index, outcome.output, outcome.error))
+    finally:
+        bot.close()
+
+
+def _finish_result(res: BatchResult, chunk_outputs: List[Optional[str]], doc_errors: Dict[int, str]) -> BatchResult:
+    res.result = " ".join(o for o in chunk_outputs if o).strip()
+    res.failed_chunks = sorted(doc_errors)
+    res.success = not doc_errors
+    if doc_errors:
+        res.error = "; ".join(f"chunk {i+1}: {doc_errors[i]}" for i in res.failed_chunks)
+    return res
+
+
+def _iter_many(
+    texts: Sequence[str],
+    tool: str,
+    mode: str,
+    workers: int,
+    bot_kwargs: Dict[str, Any],
+    progress: Optional[Callable[[int, int], None]] = None
+) -> Iterator[BatchResult]:
+    """
+    Yields each document's BatchResult as soon as all of its chunks are back.
+
+    Chunks are queued in document order, so documents finish roughly in input order.
+    `progress(done_chunks, total_chunks)` replaces the default progress print.
+    """
+    bot_kwargs = _worker_kwargs(bot_kwargs)
+    # Chunks are cut here, before any browser exists, so only a configured or previously
+    # detected (cached) word limit can be used.
+    limit = word_limit_from_kwargs(tool, mode, bot_kwargs)
+    chunk_lists = [split_text(t, limit) if t and t.strip() else [] for t in texts]
+    outputs: List[List[Optional[str]]] = [[None] * len(c) for c in chunk_lists]
+    errors: List[Dict[int, str]] = [{} for _ in texts]
+    remaining = [len(c) for c in chunk_lists]
+    total = sum(remaining)
+
+    for doc_index, count in enumerate(remaining):
+        if not count:
+            yield _finish_result(BatchResult(index=doc_index, text=texts[doc_index]), [], {})
+    if not total:
+        return
+
+    server = None
+    if isinstance(bot_kwargs.get("controller"), ConcurrencyController):
+        # The controller holds locks, so workers reach the parent's instance through a proxy.
+        server = _share_controller(bot_kwargs["controller"])
+        bot_kwargs = {k: v for k, v in bot_kwargs.items() if k != "controller"}
+        bot_kwargs["controller_address"] = server.address
+
+    ctx = multiprocessing.get_context("spawn")
+    tasks = ctx.Queue()
+    result_queue = ctx.Queue()
+    workers = max(1, min(workers, total))
+
+    for doc_index, chunks in enumerate(chunk_lists):
+        for chunk_index, chunk in enumerate(chunks):
+            tasks.put((doc_index, chunk_index, tool, mode, chunk))
+    for _ in range(workers):
+        tasks.put(None)
+
+    procs = [ctx.Process(target=_worker, args=(tasks, result_queue, bot_kwargs), daemon=True) for _ in range(workers)]
+    for p in procs:
+        p.start()
+
+    received = 0
+    failed_workers = 0
+    last_error = "Worker exited unexpectedly"
+    try:
+        while received < total:
+            try:
+                kind, doc_index, chunk_index, output, error = result_queue.get(timeout=1.0)
+            except queue.Empty:
+                if not any(p.is_alive() for p in procs):
+                    break
+                continue
+            if kind == "worker_failed":
+                failed_workers += 1
+                last_error = error
+                print(f"Batch worker failed: {error}")
+                if failed_workers == workers:
+                    break
+                continue
+            received += 1
+            outputs[doc_index][chunk_index] = output
+            if error:
+                errors[doc_index][chunk_index] = error
+            if progress:
+                progress(received, total)
+            else:
+                print(f"Batch progress: {received}/{total} chunks")
+            remaining[doc_index] -= 1
+            if not remaining[doc_index]:
+                yield _finish_result(BatchResult(index=doc_index, text=texts[doc_index]), outputs[doc_index], errors[doc_index])
+    finally:
+        for p in procs:
+            p.join(timeout=5)
+            if p.is_alive():
+                p.terminate()
+        if server is not None and getattr(server, "stop_event", None):
+            server.stop_event.set()
+
+    # Anything never reported back is marked as failed.
+    for doc_index, count in enumerate(remaining):
+        if not count:
+            continue
+        for chunk_index, output in enumerate(outputs[doc_index]):
+            if output is None and chunk_index not in errors[doc_index]:
+                errors[doc_index][chunk_index] = last_error
+        yield _finish_result(BatchResult(index=doc_index, text=texts[doc_index]), outputs[doc_index], errors[doc_index])
+
+
+def _run_many(
+    texts: Sequence[str],
+    tool: str,
+    mode: str,
+    workers: int,
+    bot_kwargs: Dict[str, Any]
+) -> List[BatchResult]:
+    results = list(_iter_many(texts, tool, mode, workers, bot_kwargs))
+    return sorted(results, key=lambda r: r.index)
+
+
+def paraphrase_many(texts: Sequence[str], workers: int = 2, **bot_kwargs: Any) -> List[BatchResult]:
+    """
+    Paraphrases many documents using a pool of worker processes, each with its own browser.
+
+    Documents are split into chunks up front and all chunks go into one shared queue, so
+    a worker that finishes early picks up chunks from other documents.
+
+    Each worker builds its own Quillbot: a `cache` ChunkCache is reopened from its path,
+    and a `metrics` BotMetrics must have a `json_log` path, which every worker appends to.
+
+    Args:
+        texts (Sequence[str]): Input documents.
+        workers (int): Number of worker processes (browsers).
+        **bot_kwargs: Keyword arguments forwarded to Quillbot in each worker.
+
+    Returns:
+        List[BatchResult]: One result per input, in input order.
+    """
+    return _run_many(texts, "paraphrase", "Basic", workers, bot_kwargs)
+
+
+def humanize_many(
+    texts: Sequence[str],
+    mode: str = "Basic",
+    workers: int = 2,
+    **bot_kwargs: Any
+) -> List[BatchResult]:
+    """
+    Humanizes many documents using a pool of worker processes, each with its own browser.
+
+    Args:
+        texts (Sequence[str]): Input documents.
+        mode (str): "Basic" or "Advanced".
+        workers (int): Number of worker processes (browsers).
+        **bot_kwargs: Keyword arguments forwarded to Quillbot in each worker.
+
+    Returns:
+        List[BatchResult]: One result per input, in input order.
+    """
+    return _run_many(texts, "humanize", mode, workers, bot_kwargs)
+
+
+def iter_paraphrase_many(
+    texts: Sequence[str],
+    workers: int = 2,
+    progress: Optional[Callable[[int, int], None]] = None,
+    **bot_kwargs: Any
+) -> Iterator[BatchResult]:
+    """
+    Like `paraphrase_many`, but yields each document's result as soon as it is finished.
+
+    Args:
+        texts (Sequence[str]): Input documents.
+        workers (int): Number of worker processes (browsers).
+        progress (callable, optional): Called with `(done_chunks, total_chunks)` after every chunk.
+        **bot_kwargs: Keyword arguments forwarded to Quillbot in each worker.
+
+    Yields:
+        BatchResult: One per input, in completion order; `index` gives the input position.
+    """
+    yield from _iter_many(texts, "paraphrase", "Basic", workers, bot_kwargs, progress)
+
+
+def iter_humanize_many(
+    texts: Sequence[str],
+    mode: str = "Basic",
+    workers: int = 2,
+    progress: Optional[Callable[[int, int], None]] = None,
+    **bot_kwargs: Any
+) -> Iterator[BatchResult]:
+    """
+    Like `humanize_many`, but yields each document's result as soon as it is finished.
+
+    Args:
+        texts (Sequence[str]): Input documents.
+        mode (str): "Basic" or "Advanced".
+        workers (int): Number of worker processes (browsers).
+        progress (callable, optional): Called with `(done_chunks, total_chunks)` after every chunk.
+        **bot_kwargs: Keyword arguments forwarded to Quillbot in each worker.
+
+    Yields:
+        BatchResult: One per input, in completion order; `index` gives the input position.
+    """
+    yield from _iter_many(texts, "humanize", mode, workers, bot_kwargs, progress)
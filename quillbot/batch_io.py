@@ -0,0 +1,191 @@
+import glob
+import json
+import os
+import sys
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set
+
+# File types picked up when an input is a directory.
+DEFAULT_EXTENSIONS = (".txt", ".md")
+
+
+@dataclass
+class BatchItem:
+    """One input document of a batch job."""
+
+    id: str
+    text: str
+
+
+def _read_file(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read().strip()
+
+
+def _read_jsonl(stream: Iterable[str], source: str, text_field: str, id_field: str) -> List[BatchItem]:
+    items = []
+    for line_number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entry = json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"{source}:{line_number}: invalid JSON ({e})")
+        if isinstance(entry, str):
+            entry = {text_field: entry}
+        if not isinstance(entry, dict) or not isinstance(entry.get(text_field), str):
+            raise ValueError(f"{source}:{line_number}: expected an object with a string '{text_field}' field")
+        item_id = entry.get(id_field)
+        items.append(BatchItem(str(item_id) if item_id is not None else f"{source}:{line_number}", entry[text_field]))
+    return items
+
+
+def collect_items(
+    inputs: List[str],
+    extensions: Iterable[str] = DEFAULT_EXTENSIONS,
+    text_field: str = "text",
+    id_field: str = "id"
+) -> List[BatchItem]:
+    """
+    Expands batch inputs into documents.
+
+    Each input may be a directory (files with one of `extensions`, recursively; the id is
+    the path relative to the directory), a JSONL file or "-" for JSONL on stdin (one
+    object per line with `text_field` and an optional `id_field`), or a file path or glob
+    pattern (the id is the file name).
+
+    Raises:
+        ValueError: If an input matches nothing, is malformed or two documents share an id.
+    """
+    extensions = tuple(e.lower() for e in extensions)
+    items: List[BatchItem] = []
+    for source in inputs:
+        if source == "-":
+            items.extend(_read_jsonl(sys.stdin, "stdin", text_field, id_field))
+        elif os.path.isdir(source):
+            found = []
+            for root, _, files in os.walk(source):
+                for name in files:
+                    if name.lower().endswith(extensions):
+                        path = os.path.join(root, name)
+                        found.append((os.path.relpath(path, source), path))
+            for item_id, path in sorted(found):
+                items.append(BatchItem(item_id, _read_file(path)))
+        elif source.lower().endswith(".jsonl") and os.path.isfile(source):
+            with open(source, "r", encoding="utf-8") as f:
+                items.extend(_read_jsonl(f, os.path.basename(source), text_field, id_field))
+        else:
+            paths = sorted(p for p in glob.glob(source, recursive=True) if os.path.isfile(p))
+            if not paths:
+                raise ValueError(f"No input files match {source}")
+            items.extend(BatchItem(os.path.basename(p), _read_file(p)) for p in paths)
+
+    seen: Set[str] = set()
+    for item in items:
+        if item.id in seen:
+            raise ValueError(f"Duplicate document id {item.id!r}")
+        seen.add(item.id)
+    return items
+
+
+class BatchWriter:
+    """
+    Writes batch results as they finish, either as one file per document into a
+    directory or as lines of a JSONL file (any path ending in ".jsonl").
+
+    In directory mode only successful documents are written, so a failed one has no
+    output file and is picked up again by a resumed run. In JSONL mode every result is
+    appended with its `success` flag and error; the last line for an id wins.
+    """
+
+    def __init__(self, path: str, suffix: str = ""):
+        """
+        Args:
+            path (str): Output directory or JSONL file.
+            suffix (str): Appended to the file name of each output in directory mode.
+        """
+        self.path = os.path.expanduser(path)
+        self.suffix = suffix
+        self.jsonl = self.path.lower().endswith(".jsonl")
+        self._file = None
+        if self.jsonl:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        else:
+            os.makedirs(self.path, exist_ok=True)
+
+    def _output_path(self, item_id: str) -> str:
+        """
+        Maps a document id to its file under the output directory.
+
+        Raises:
+            ValueError: If the id is absolute or contains "..", so its file would not be
+                inside the output directory.
+        """
+        parts = item_id.replace("\\", "/").split("/")
+        if not item_id or os.path.isabs(item_id) or os.path.splitdrive(item_id)[0] or ".." in parts:
+            raise ValueError(
+                f"Document id {item_id!r} cannot be used as an output file name in directory mode; "
+                "ids must be relative paths without '..'"
+            )
+        return os.path.join(self.path, item_id + self.suffix)
+
+    def check(self, items: Iterable[BatchItem]):
+        """
+        Verifies up front that every document can be written, before any work is done.
+
+        Raises:
+            ValueError: For the first id that `write` would reject.
+        """
+        if not self.jsonl:
+            for item in items:
+                self._output_path(item.id)
+
+    def completed(self) -> Set[str]:
+        """Returns the ids that already have a successful result."""
+        if not self.jsonl:
+            done = set()
+            for root, _, files in os.walk(self.path):
+                for name in files:
+                    relative = os.path.relpath(os.path.join(root, name), self.path)
+                    if self.suffix and not relative.endswith(self.suffix):
+                        continue
+                    done.add(relative[:len(relative) - len(self.suffix)] if self.suffix else relative)
+            return done
+
+        latest: Dict[str, bool] = {}
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    latest[str(entry.get("id"))] = bool(entry.get("success"))
+        return {item_id for item_id, success in latest.items() if success}
+
+    def write(self, item: BatchItem, result: Optional[str], success: bool, error: Optional[str] = None):
+        """Stores one finished document."""
+        if self.jsonl:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            entry = {"id": item.id, "success": success, "result": result}
+            if error:
+                entry["error"] = error
+            self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._file.flush()
+            return
+        if not success:
+            return
+        path = self._output_path(item.id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temp file first so an interrupted job never leaves a partial output.
+        tmp = path + ".part"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(result or "")
+        os.replace(tmp, path)
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
@@ -1,9 +1,7 @@
-import os
-import re
 import time
 import shutil
-import tempfile
-from typing import List, Optional, Union
+from contextlib import nullcontext
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -12,7 +10,590 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.action_chains import ActionChains
-from webdriver_manager.chrome import ChromeDriverManager
+
+from .cache import ChunkCache
+from .driver import resolve_driver_path
+from .profile import ProfileSnapshotManager
+from .resources import process_tree_rss
+from .controller import ConcurrencyController
+from .journal import ChunkFailure, IncompleteOutputError, JobJournal, ProcessReport
+from .limits import (
+    DEFAULT_LIMITS_FILE,
+    DEFAULT_WORD_LIMIT,
+    UNLIMITED_WORD_LIMIT,
+    WORD_LIMIT_JS,
+    WordLimit,
+    WordLimitCache,
+    configured_limit,
+    limit_key,
+    profile_key,
+)
+from .metrics import BotMetrics, PhaseTimer
+from .markdown import MarkdownDocument, join_group, pack_spans, split_group_output
+from .network import (
+    NETWORK_RESPONSE_PATTERNS,
+    OUTPUT_CAPTURES,
+    ResponseExtractor,
+    ResponseWatcher,
+    enable_performance_log,
+    extract_response_text,
+)
+from .text import split_text
+
+
+BASE_URL = "https://quillbot.com"
+PARAPHRASER_PATH = "/paraphrasing-tool"
+HUMANIZER_PATH = "/ai-humanizer"
+PARAPHRASER_URL = BASE_URL + PARAPHRASER_PATH
+HUMANIZER_URL = BASE_URL + HUMANIZER_PATH
+
+# Installs (once per page) a MutationObserver on the output box and reports its text
+# together with how many mutations happened, how long ago the last one was, whether the
+# last clicked action button still shows QuillBot's busy state, and the text the box held
+# when that button was clicked.
+_OUTPUT_PROBE_FN = """
+function __qbOutputText(box) {
+var text = box.innerText || '';
+if (!text.trim()) {
+    var child = box.querySelector("div[contenteditable='true']");
+    if (child) text = child.innerText || '';
+}
+return text;
+}
+function __qbProbe(reset) {
+var box = document.getElementById('paraphraser-output-box');
+if (!box) return null;
+if (window.__qbOutputTarget !== box) {
+    if (window.__qbOutputObserver) window.__qbOutputObserver.disconnect();
+    window.__qbOutputTarget = box;
+    // A freshly rendered box counts as a change.
+    window.__qbMutations = 1;
+    window.__qbLastMutation = performance.now();
+    window.__qbOutputObserver = new MutationObserver(function () {
+        window.__qbMutations += 1;
+        window.__qbLastMutation = performance.now();
+    });
+    window.__qbOutputObserver.observe(box, {childList: true, subtree: true, characterData: true});
+}
+if (reset) {
+    window.__qbMutations = 0;
+    window.__qbLastMutation = performance.now();
+}
+var text = __qbOutputText(box);
+var button = window.__qbButton;
+var busy = !!(button && button.isConnected && (
+    button.getAttribute('aria-busy') === 'true' ||
+    button.querySelector("[role='progressbar'], .MuiCircularProgress-root")
+));
+return {
+    text: text,
+    mutations: window.__qbMutations,
+    idle: (performance.now() - window.__qbLastMutation) / 1000,
+    busy: busy,
+    before: window.__qbBefore || ''
+};
+}
+"""
+_OUTPUT_PROBE_JS = _OUTPUT_PROBE_FN + "return __qbProbe(arguments[0]);"
+
+# Finds the first visible button whose text contains the label (falling back to a CSS
+# selector), resets the output probe and clicks it, all in one round trip. A disabled
+# button is reported instead of clicked so the caller can wait for it to enable.
+_CLICK_BUTTON_JS = _OUTPUT_PROBE_FN + """
+var label = arguments[0], css = arguments[1];
+function visible(el) {
+    if (!el.getClientRects().length) return false;
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none';
+}
+function find(nodes) {
+    for (var i = 0; i < nodes.length; i++) {
+        if ((nodes[i].textContent || '').indexOf(label) !== -1 && visible(nodes[i])) return nodes[i];
+    }
+    return null;
+}
+var via = 'text';
+var button = find(document.getElementsByTagName('button'));
+if (!button && css) {
+    button = find(document.querySelectorAll(css));
+    via = 'css';
+}
+if (!button) return {found: false};
+if (button.disabled || button.getAttribute('aria-disabled') === 'true') {
+    return {found: true, disabled: true, via: via};
+}
+button.scrollIntoView({block: 'center'});
+var outputBox = document.getElementById('paraphraser-output-box');
+window.__qbBefore = outputBox ? __qbOutputText(outputBox) : '';
+__qbProbe(true);
+window.__qbButton = button;
+button.click();
+return {found: true, clicked: true, via: via};
+"""
+
+_CLEAR_INPUT_JS = """
+var el = document.getElementById('paraphraser-input-box');
+if (!el) return false;
+el.scrollIntoView({block: 'center'});
+el.textContent = '';
+el.innerHTML = '';
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+return true;
+"""
+
+
+# Puts the whole chunk into the editor in one go: first as a synthetic paste (which the
+# React editor handles like a user paste), then via execCommand('insertText') if the paste
+# was ignored. Returns the resulting text so the caller can verify it landed.
+_PASTE_TEXT_JS = """
+var el = arguments[0] || document.getElementById('paraphraser-input-box'), text = arguments[1];
+if (!el) return null;
+el.scrollIntoView({block: 'center'});
+el.focus();
+var range = document.createRange();
+range.selectNodeContents(el);
+var sel = window.getSelection();
+sel.removeAllRanges();
+sel.addRange(range);
+var handled = false;
+try {
+    var data = new DataTransfer();
+    data.setData('text/plain', text);
+    var evt = new ClipboardEvent('paste', {clipboardData: data, bubbles: true, cancelable: true});
+    handled = !el.dispatchEvent(evt);
+} catch (e) {}
+if (!handled) {
+    document.execCommand('insertText', false, text);
+}
+el.dispatchEvent(new Event('input', {bubbles: true}));
+return el.innerText || '';
+"""
+
+_FOCUS_INPUT_JS = """
+var el = arguments[0] || document.getElementById('paraphraser-input-box');
+if (!el) return;
+el.scrollIntoView({block: 'center'});
+el.focus();
+var range = document.createRange();
+range.selectNodeContents(el);
+range.collapse(false);
+var sel = window.getSelection();
+sel.removeAllRanges();
+sel.addRange(range);
+"""
+
+INPUT_METHODS = ("paste", "cdp", "keys")
+
+# URL patterns blocked in lean mode, per resource type. CDP's Network.setBlockedURLs only
+# matches URLs, so resource types are approximated by file extension.
+RESOURCE_TYPE_PATTERNS = {
+    "image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico"],
+    "font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "media": ["*.mp4", "*.webm", "*.m3u8", "*.mp3", "*.ogg"],
+}
+LEAN_RESOURCE_TYPES = ("image", "font", "media")
+
+# Analytics, ads and session-recording hosts that the editor does not need.
+LEAN_BLOCKED_URLS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*facebook.net*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+    "*segment.io*",
+    "*cdn.segment.com*",
+    "*intercom.io*",
+]
+
+_INPUT_TEXT_JS = """
+var el = arguments[0] || document.getElementById('paraphraser-input-box');
+if (!el) return null;
+if (arguments[1]) el.dispatchEvent(new Event('input', {bubbles: true}));
+return el.innerText || '';
+"""
+
+# How long a disabled action button is given to enable after the text was entered.
+_BUTTON_ENABLE_TIMEOUT = 2.0
+
+# Tool behind each action button, for picking the API response to capture.
+_BUTTON_TOOLS = {"Paraphrase": "paraphrase", "Humanize": "humanize"}
+
+_LEAN_ARGUMENTS = [
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--mute-audio",
+]
+# Background tabs must keep running their timers for parallel_tabs and the pipeline,
+# whose tabs are polled while another one is in front; added to every session.
+_BACKGROUND_TAB_ARGUMENTS = [
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+]
+
+_MODE_TABS = {
+    "Basic": "#Paraphraser-mode-tab-0",
+    "Advanced": "#Paraphraser-mode-tab-1",
+}
+
+# Cheap check that the current tab still shows the expected tool (and mode tab) and is usable.
+_PAGE_READY_JS = """
+var path = arguments[0], modeTab = arguments[1];
+if (location.pathname.replace(/\\/+$/, '') !== path) return false;
+if (!document.getElementById('paraphraser-input-box')) return false;
+if (modeTab) {
+    var tab = document.querySelector(modeTab);
+    if (!tab || tab.getAttribute('aria-selected') !== 'true') return false;
+}
+return true;
+"""
+
+
+class ChunkResult(NamedTuple):
+    """Result of one chunk, as yielded by `iter_paraphrase()` / `iter_humanize()`."""
+
+    index: int
+    chunk: str
+    output: Optional[str]
+    seconds: float
+
+
+# A pipeline stage: a tool name, or a (tool, mode) pair such as ("humanize", "Advanced").
+Stage = Union[str, Tuple[str, str]]
+
+
+def _normalize_stages(stages: Sequence[Stage]) -> List[Tuple[str, str]]:
+    """Turns pipeline stages into (tool, mode) pairs, validating the tool names."""
+    normalized = []
+    for stage in stages:
+        tool, mode = (stage, "Basic") if isinstance(stage, str) else stage
+        if tool not in ("paraphrase", "humanize"):
+            raise ValueError(f"Unknown tool: {tool}")
+        normalized.append((tool, mode if tool == "humanize" else "Basic"))
+    if not normalized:
+        raise ValueError("A pipeline needs at least one stage")
+    return normalized
+
+
+class ChunkOutcome(NamedTuple):
+    """Result of one chunk after all of its attempts, as returned by `process_chunk()`."""
+
+    index: int
+    output: Optional[str]
+    seconds: float
+    attempts: int
+    error: Optional[str]
+
+
+class _OutputTracker:
+    """
+    Follows one submitted chunk until its output settles or times out.
+
+    Only text that differs from what the box held at the click counts as output, unless
+    the box was seen with other content (e.g. cleared) in between, so the previous
+    chunk's result is never returned for the next one.
+    """
+
+    def __init__(self, settle_time: float, timeout: float):
+        self.settle_time = settle_time
+        self.timeout = timeout
+        self.deadline = time.monotonic() + timeout
+        self.last_text = ""
+        self.stable_since = time.monotonic()
+        self.timed_out = False
+        # Whether the box has shown anything other than its pre-click text.
+        self.changed = False
+
+    def update(self, probe: Optional[dict]) -> bool:
+        """
+        Feeds one probe result into the tracker.
+
+        Returns:
+            bool: True once the output is final (settled or timed out).
+        """
+        probe = probe or {}
+        text = (probe.get("text") or "").strip()
+        now = time.monotonic()
+        if probe and text != (probe.get("before") or "").strip():
+            self.changed = True
+
+        if text != self.last_text:
+            self.last_text = text
+            self.stable_since = now
+        elif (
+            text
+            and self.changed
+            and not probe.get("busy")
+            and probe.get("mutations", 0) > 0
+            and now - self.stable_since >= self.settle_time
+            and probe.get("idle", 0) >= self.settle_time
+        ):
+            return True
+
+        if now >= self.deadline:
+            self.timed_out = True
+            return True
+        return False
+
+    @property
+    def result(self) -> Optional[str]:
+        """
+        The settled output, or None if the box never showed new text or timed out before
+        it settled; a partial render must not be cached or journaled as the result.
+        """
+        if self.timed_out:
+            if self.changed and self.last_text:
+                print(f"Output did not settle within {self.timeout}s, discarding the partial text")
+            else:
+                print(f"No new output within {self.timeout}s")
+            return None
+        if not (self.changed and self.last_text):
+            return None
+        return self.last_text
+
+
+def _phase(timer: Optional[PhaseTimer], name: str):
+    """Times a block as phase `name` of `timer`, or does nothing if there is no timer."""
+    return timer.phase(name) if timer else nullcontext()
+
+
+class ChunkTask:
+    """
+    One chunk on its way through a Quillbot session, advanced by `step()`.
+
+    A step either submits the chunk (entering it and clicking the button) or checks once
+    whether its output is final, so a caller can keep several tasks going at once, e.g.
+    one per tab, or wait between steps without blocking (`AsyncQuillbot`). An attempt that
+    produces no new output is retried up to `retries` times on a reloaded page, after
+    `retry_backoff` seconds, doubling up to `max_backoff`. Every attempt holds a slot of
+    the session's controller and is reported to it and to the recycling counters. A
+    successful output is stored in the cache.
+
+    The output is read from the API response in network capture (falling back to the
+    output box) or from the output box, once it differs from its text before the click,
+    the button no longer shows a busy state, and it has not mutated for `settle_time`
+    seconds. An attempt that has not settled after `output_timeout` seconds fails, even
+    if some new text is showing.
+
+    Create tasks with `Quillbot.chunk_task()`.
+    """
+
+    def __init__(
+        self,
+        bot: "Quillbot",
+        tool: str,
+        mode: str,
+        chunk: str,
+        index: int = 0,
+        prepare: Optional[Callable[[bool], None]] = None,
+        watch_response: bool = True,
+        recycle: bool = True
+    ):
+        """
+        Args:
+            bot (Quillbot): The session the chunk runs in.
+            tool (str): "paraphrase" or "humanize".
+            mode (str): Humanizer mode, ignored for paraphrase.
+            chunk (str): Input text.
+            index (int): Position of the chunk in its document, for metrics and messages.
+            prepare (callable, optional): Called with `force` before every attempt to make the
+                current tab show the tool; `force` is True after a failed attempt. Defaults
+                to loading the tool in the session's own tab, reusing the page if possible.
+            watch_response (bool): Read the API response in network capture. Tabs that are
+                switched away from while the chunk runs must pass False.
+            recycle (bool): Restart the browser before an attempt when it is due.
+        """
+        open_page, self.button_text, self.css_selector = bot._tool_spec(tool, mode)
+        self.bot = bot
+        self.tool = tool
+        self.mode = mode
+        self.chunk = chunk
+        self.index = index
+        self.prepare: Callable[[bool], None] = prepare or open_page
+        self.watch_response = watch_response
+        self.recycle = recycle
+        self._open_page = open_page
+        self.attempts = 0
+        self.output: Optional[str] = None
+        self.error: Optional[str] = None
+        self.done = False
+        self.timer: Optional[PhaseTimer] = None
+        # Extra fields for the chunk's metrics record.
+        self.fields: Dict[str, object] = {}
+        self.not_before = 0.0
+        # time.monotonic() of the first attempt.
+        self.started: Optional[float] = None
+        self._finished: Optional[float] = None
+        self._reload = False
+        self._slot_started: Optional[float] = None
+        self._submitted: Optional[float] = None
+        self._tracker: Optional[_OutputTracker] = None
+        self._watcher: Optional[ResponseWatcher] = None
+
+    @property
+    def running(self) -> bool:
+        """True while the chunk is submitted and its output is awaited."""
+        return self._submitted is not None
+
+    def ready(self) -> bool:
+        """True if the next `step()` may submit the chunk (not running, done or backing off)."""
+        return not self.done and not self.running and time.monotonic() >= self.not_before
+
+    def step(self, block: bool = False) -> bool:
+        """
+        Advances the task by one submit or one output check.
+
+        Args:
+            block (bool): Wait out the backoff delay and for a controller slot instead of
+                returning straight away.
+
+        Returns:
+            bool: True once the task is done, successfully or not.
+        """
+        if self.done:
+            return True
+        if self.running:
+            self._poll()
+            return self.done
+        bot = self.bot
+        if block:
+            time.sleep(max(0.0, self.not_before - time.monotonic()))
+            if not self._prepare():
+                return self.done
+            bot._acquire_slot()
+        else:
+            if time.monotonic() < self.not_before:
+                return False
+            if bot.controller is not None and not bot.controller.try_acquire():
+                return False
+            if not self._prepare(holding_slot=True):
+                return self.done
+        self._submit()
+        return self.done
+
+    def abandon(self):
+        """Gives back the controller slot of a running attempt that will not be finished."""
+        if self._slot_started is not None and self.bot.controller is not None:
+            self.bot.controller.cancel()
+        self._slot_started = None
+        self._submitted = None
+
+    def outcome(self) -> ChunkOutcome:
+        """Returns the task's result so far; final once `done` is True."""
+        seconds = (self._finished or time.monotonic()) - (self.started or time.monotonic())
+        return ChunkOutcome(self.index, self.output, seconds, self.attempts, self.error)
+
+    def _prepare(self, holding_slot: bool = False) -> bool:
+        """Starts an attempt and readies the page. Returns False if that already failed it."""
+        bot = self.bot
+        self.attempts += 1
+        if self.started is None:
+            self.started = time.monotonic()
+            self.timer = bot.metrics.start_chunk(self.tool, self.index)
+            self.timer.fields.update(self.fields)
+        self.timer.fields["attempts"] = self.attempts
+        if holding_slot:
+            self._slot_started = time.monotonic()
+        try:
+            if self.recycle:
+                bot._recycle_if_needed()
+            self.prepare(self._reload)
+            self._reload = False
+            return True
+        except Exception as e:
+            print(f"Error processing chunk {self.index+1}: {e}")
+            self._end_attempt(None, str(e))
+            return False
+
+    def _submit(self):
+        bot = self.bot
+        if self._slot_started is None:
+            self._slot_started = time.monotonic()
+        try:
+            if bot._submit_chunk(self.chunk, self.button_text, self.css_selector, self.timer, self.watch_response):
+                self._watcher, bot._response_watcher = bot._response_watcher, None
+                if self._watcher is None:
+                    self._tracker = _OutputTracker(bot.settle_time, bot.output_timeout)
+                self._submitted = time.monotonic()
+                return
+            error = f"{self.button_text} button not found"
+        except Exception as e:
+            print(f"Error processing chunk {self.index+1}: {e}")
+            error = str(e)
+        self._end_attempt(None, error)
+
+    def _poll(self):
+        bot = self.bot
+        if self._watcher is not None:
+            waited = time.monotonic() - self._submitted
+            try:
+                finished = self._watcher.poll() or waited >= bot.output_timeout
+            except Exception as e:
+                print(f"Error reading network events: {e}")
+                finished = True
+            if not finished:
+                return
+            watcher, self._watcher = self._watcher, None
+            handled, output = bot._response_output(watcher, self.timer, time.monotonic() - self._submitted)
+            if handled:
+                self._end_attempt(output, watcher.error)
+                return
+            # Nothing usable on the wire; wait for the output box instead.
+            self._tracker = _OutputTracker(bot.settle_time, bot.output_timeout)
+            self._submitted = time.monotonic()
+            return
+        try:
+            probe, last_probe = bot._timed_probe()
+            if not self._tracker.update(probe):
+                return
+            tracker, self._tracker = self._tracker, None
+            output = tracker.result
+            bot._record_output(self.timer, tracker, time.monotonic() - self._submitted, last_probe)
+        except Exception as e:
+            print(f"Error getting output: {e}")
+            self._tracker = None
+            self._end_attempt(None, str(e))
+            return
+        self._end_attempt(output, "Output timed out" if tracker.timed_out else None)
+
+    def _end_attempt(self, output: Optional[str], error: Optional[str]):
+        bot = self.bot
+        self._submitted = None
+        if self._slot_started is not None:
+            bot._release_slot(output is not None, self._slot_started)
+            self._slot_started = None
+        bot._record_chunk(output is not None)
+        if output is not None:
+            self.output, self.error = output, None
+            bot._cache_put(self.tool, self.mode, self.chunk, output)
+            self._finish()
+            return
+        self.error = error or "No output received"
+        # The page may be broken; reload it before the next attempt.
+        self._reload = True
+        if self.prepare is self._open_page:
+            # The session's own tab tracks what page it shows; a scheduler that set
+            # `prepare` tracks its tabs itself.
+            bot._invalidate_page()
+        if self.attempts <= bot.retries:
+            delay = bot._backoff(self.attempts)
+            print(f"Retrying chunk {self.index+1} in {delay:.1f}s (attempt {self.attempts + 1} of {bot.retries + 1})")
+            bot.metrics.count_retry("chunk")
+            self.not_before = time.monotonic() + delay
+            return
+        self._finish()
+
+    def _finish(self):
+        self.done = True
+        self._finished = time.monotonic()
+        self.timer.finish(self.output is not None)
 
 
 class Quillbot:
@@ -25,7 +606,34 @@ class Quillbot:
         headless: bool = True,
         user_data_dir: Optional[str] = None,
         profile_directory: str = "Default",
-        copy_profile: bool = False
+        copy_profile: bool = False,
+        output_timeout: float = 60.0,
+        settle_time: float = 1.0,
+        poll_interval: float = 0.25,
+        cache: Optional[Union[ChunkCache, str]] = None,
+        input_method: str = "paste",
+        driver_path: Optional[str] = None,
+        base_url: str = BASE_URL,
+        metrics: Optional[BotMetrics] = None,
+        page_max_age: Optional[float] = 1800.0,
+        lean: bool = False,
+        blocked_urls: Optional[Sequence[str]] = None,
+        blocked_resource_types: Sequence[str] = LEAN_RESOURCE_TYPES,
+        recycle_after_chunks: Optional[int] = None,
+        recycle_rss_mb: Optional[float] = None,
+        recycle_heap_mb: Optional[float] = None,
+        recycle_after_failures: Optional[int] = None,
+        memory_check_interval: float = 30.0,
+        retries: int = 2,
+        retry_backoff: float = 2.0,
+        max_backoff: float = 30.0,
+        word_limit: Optional[WordLimit] = None,
+        detect_word_limit: bool = True,
+        word_limit_cache: Optional[str] = DEFAULT_LIMITS_FILE,
+        controller: Optional[ConcurrencyController] = None,
+        output_capture: str = "dom",
+        response_patterns: Optional[Dict[str, Sequence[str]]] = None,
+        response_extractor: Optional[ResponseExtractor] = None
     ):
         """
         Initialize the Quillbot automation instance.
@@ -34,67 +642,187 @@ class Quillbot:
             headless (bool): Whether to run the browser in headless mode.
             user_data_dir (str, optional): Path to the Chrome User Data directory.
             profile_directory (str): Name of the Chrome profile directory (e.g., "Default").
-            copy_profile (bool): Whether to copy the profile to a temporary directory to avoid locking.
+            copy_profile (bool): Whether to run from a private copy of the profile to avoid locking.
+                Only the session files are copied, from a snapshot shared between instances.
+            output_timeout (float): Maximum seconds to wait for a result after clicking the button.
+            settle_time (float): Seconds the output must stay unchanged before it is considered final.
+            poll_interval (float): Seconds between checks of the output box.
+            cache (ChunkCache or str, optional): Result cache, or a path to open one at.
+                Cached chunks are returned without touching the browser.
+            input_method (str): How chunks are entered: "paste" (synthetic paste event),
+                "cdp" (DevTools Input.insertText) or "keys" (simulated typing).
+                The bulk methods fall back to typing if the text does not show up.
+            driver_path (str, optional): Path to chromedriver. When omitted, a driver cached
+                for the installed Chrome version is used and only downloaded if missing.
+            base_url (str): Site root, e.g. a local mock of QuillBot for benchmarking.
+            metrics (BotMetrics, optional): Where phase timings, WebDriver command counts and
+                retries are recorded. Pass one instance to several sessions to aggregate them.
+            page_max_age (float, optional): Seconds a loaded tool page is reused before it is
+                reloaded anyway. None reuses it until an error is seen.
+            lean (bool): Run a lighter browser: eager page loads, a smaller window, no extensions
+                or background networking, and blocked heavy resources and trackers.
+            blocked_urls (Sequence[str], optional): URL patterns (with `*` wildcards) to block in
+                lean mode. Defaults to LEAN_BLOCKED_URLS.
+            blocked_resource_types (Sequence[str]): Resource types to block in lean mode, from
+                "image", "font" and "media".
+            recycle_after_chunks (int, optional): Restart the browser after this many chunks.
+            recycle_rss_mb (float, optional): Restart once chromedriver, Chrome and its renderers
+                together use more resident memory than this.
+            recycle_heap_mb (float, optional): Restart once the page's JS heap exceeds this.
+            recycle_after_failures (int, optional): Restart after this many failed chunks in a row.
+            memory_check_interval (float): Minimum seconds between memory checks.
+            retries (int): Extra attempts for a chunk that fails, each on a reloaded page.
+            retry_backoff (float): Seconds before the first retry; doubles with every attempt.
+            max_backoff (float): Upper bound on the delay between attempts.
+            word_limit (int or dict, optional): Words per chunk, overriding detection. Either one
+                value or a dict keyed by tool ("humanize") or tool and mode ("humanize:Advanced").
+            detect_word_limit (bool): Read the account's limit from the tool page's word counter.
+                When False (or if nothing is found), DEFAULT_WORD_LIMIT is used.
+            word_limit_cache (str, optional): JSON file where detected limits are kept per profile,
+                so later sessions skip detection. None keeps them in memory only.
+            controller (ConcurrencyController, optional): Shared limit on in-flight chunks and
+                requests per minute. Every chunk attempt waits for a slot and reports its
+                outcome, so sessions sharing one controller back off together.
+            output_capture (str): How results are read: "dom" (wait for the output box to
+                settle) or "network" (take the text from the tool's API response as soon as
+                it completes, via Chrome's performance log). Network capture falls back to
+                the output box when no response matches; parallel tabs always use the box.
+            response_patterns (dict, optional): Regexes for the API request URLs per tool.
+                Defaults to NETWORK_RESPONSE_PATTERNS.
+            response_extractor (callable, optional): Returns the output text from a decoded
+                JSON response. Defaults to `extract_response_text`.
         """
+        if input_method not in INPUT_METHODS:
+            raise ValueError(f"input_method must be one of {INPUT_METHODS}")
+        if output_capture not in OUTPUT_CAPTURES:
+            raise ValueError(f"output_capture must be one of {OUTPUT_CAPTURES}")
         self.headless = headless
+        self.output_timeout = output_timeout
+        self.settle_time = settle_time
+        self.poll_interval = poll_interval
+        self.cache = ChunkCache(cache) if isinstance(cache, str) else cache
+        self.input_method = input_method
+        self.base_url = base_url.rstrip("/")
+        self.metrics = metrics or BotMetrics()
+        self.page_max_age = page_max_age
+        # (tool, mode) currently loaded in the main tab, or None if unknown.
+        self._page_state: Optional[Tuple[str, str]] = None
+        self._page_loaded_at = 0.0
+        self.lean = lean
+        self.blocked_urls: List[str] = []
+        if lean:
+            unknown = set(blocked_resource_types) - set(RESOURCE_TYPE_PATTERNS)
+            if unknown:
+                raise ValueError(f"Unknown resource types: {sorted(unknown)}")
+            self.blocked_urls = list(LEAN_BLOCKED_URLS if blocked_urls is None else blocked_urls)
+            for resource_type in blocked_resource_types:
+                self.blocked_urls.extend(RESOURCE_TYPE_PATTERNS[resource_type])
         self.temp_dir: Optional[str] = None
+        self._user_data_dir = user_data_dir
+        self._profile_directory = profile_directory
+        self._copy_profile = copy_profile
+        self._snapshots: Optional[ProfileSnapshotManager] = None
+        self._blocked_resource_types = tuple(blocked_resource_types)
+        self.recycle_after_chunks = recycle_after_chunks
+        self.recycle_rss_mb = recycle_rss_mb
+        self.recycle_heap_mb = recycle_heap_mb
+        self.recycle_after_failures = recycle_after_failures
+        self.memory_check_interval = memory_check_interval
+        self.retries = max(0, retries)
+        self.retry_backoff = retry_backoff
+        self.max_backoff = max_backoff
+        self.last_report: Optional[ProcessReport] = None
+        self.word_limit = word_limit
+        self.detect_word_limit = detect_word_limit
+        self._word_limit_cache = WordLimitCache(word_limit_cache) if word_limit_cache else None
+        self._word_limits: Dict[str, int] = {}
+        self.controller = controller
+        if isinstance(controller, ConcurrencyController):
+            # Manager proxies (batch workers) are reported by their owner instead.
+            controller.attach(self.metrics)
+        self.output_capture = output_capture
+        self.response_patterns = dict(NETWORK_RESPONSE_PATTERNS, **(response_patterns or {}))
+        self.response_extractor = response_extractor or extract_response_text
+        self._response_watcher: Optional[ResponseWatcher] = None
         
+        self._driver_path = resolve_driver_path(driver_path)
+        self.driver = None
+        self._start_driver()
+
+    def _profile_for_launch(self) -> Optional[str]:
+        """Returns the User Data directory for the next launch, cloning the snapshot if enabled."""
+        if not self._user_data_dir or not self._copy_profile:
+            return self._user_data_dir
+        try:
+            if self._snapshots is None:
+                self._snapshots = ProfileSnapshotManager(self._user_data_dir, self._profile_directory)
+            self.temp_dir = self._snapshots.create_instance()
+            print(f"Profile snapshot cloned to {self.temp_dir}")
+            return self.temp_dir
+        except Exception as e:
+            print(f"Error copying profile: {e}")
+            # Fallback to original if copy fails
+            return self._user_data_dir
+
+    def _chrome_options(self, user_data_dir: Optional[str]) -> Options:
         chrome_options = Options()
-        if headless:
+        if self.headless:
             chrome_options.add_argument("--headless=new")
         
         if user_data_dir:
-            final_user_data_dir = user_data_dir
+            chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+            chrome_options.add_argument(f"--profile-directory={self._profile_directory}")
             
-            if copy_profile:
-                print(f"Copying profile from {user_data_dir} to temp directory...")
-                self.temp_dir = tempfile.mkdtemp()
-                final_user_data_dir = self.temp_dir
-                
-                try:
-                    def ignore_patterns(path, names):
-                        ignored = [
-                            'Cache', 'Code Cache', 'GPUCache', 'ShaderCache', 
-                            'Service Worker', 'CacheStorage',
-                            'SingletonLock', 'SingletonSocket', 'SingletonCookie', 
-                            'RunningChromeVersion', 'lockfile'
-                        ]
-                        return [n for n in names if n in ignored]
-
-                    shutil.copytree(
-                        user_data_dir, 
-                        os.path.join(self.temp_dir, "User Data"), 
-                        ignore=ignore_patterns, 
-                        dirs_exist_ok=True
-                    )
-                    final_user_data_dir = os.path.join(self.temp_dir, "User Data")
-                    print(f"Profile copied to {final_user_data_dir}")
-                except Exception as e:
-                    print(f"Error copying profile: {e}")
-                    # Fallback to original if copy fails
-                    final_user_data_dir = user_data_dir
-
-            chrome_options.add_argument(f"--user-data-dir={final_user_data_dir}")
-            chrome_options.add_argument(f"--profile-directory={profile_directory}")
-            
-        chrome_options.add_argument("--window-size=1920,1080")
+        if self.lean:
+            # Return from driver.get() at DOMContentLoaded; the element waits cover the rest.
+            chrome_options.page_load_strategy = "eager"
+            for argument in _LEAN_ARGUMENTS:
+                chrome_options.add_argument(argument)
+            if "image" in self._blocked_resource_types:
+                chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_argument("--window-size=1280,800")
+        else:
+            chrome_options.add_argument("--window-size=1920,1080")
+        for argument in _BACKGROUND_TAB_ARGUMENTS:
+            chrome_options.add_argument(argument)
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         chrome_options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
-        
-        self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+        if self.output_capture == "network":
+            enable_performance_log(chrome_options)
+        return chrome_options
+
+    def _start_driver(self):
+        """Launches Chrome and resets all per-browser state."""
+        chrome_options = self._chrome_options(self._profile_for_launch())
+        service = Service(self._driver_path) if self._driver_path else Service()
+        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.metrics.instrument(self.driver)
+        self._apply_network_blocking()
+        if self.output_capture == "network":
+            try:
+                self.driver.execute_cdp_cmd("Network.enable", {})
+            except Exception as e:
+                print(f"Could not enable network events: {e}")
         self.wait = WebDriverWait(self.driver, 20)
+        
+        self._page_state = None
+        self._response_watcher = None
+        self._driver_chunks = 0
+        self._consecutive_failures = 0
+        self._memory_checked_at = time.monotonic()
 
-    def close(self):
-        """Closes the browser and cleans up temporary directories."""
+    def _stop_driver(self):
+        """Quits Chrome and removes its profile clone, if any."""
         if self.driver:
             try:
                 self.driver.quit()
             except Exception:
                 pass
+            self.driver = None
                 
         if self.temp_dir:
             try:
@@ -102,81 +830,223 @@ class Quillbot:
                 shutil.rmtree(self.temp_dir)
             except Exception as e:
                 print(f"Error cleaning up temp profile: {e}")
+            self.temp_dir = None
 
-    def _split_text(self, text: str, limit: int = 125) -> List[str]:
+    def restart(self, reason: str = "manual"):
         """
-        Splits text into chunks of at most `limit` words, respecting sentence boundaries where possible.
-        
+        Replaces the browser with a fresh one, keeping this object, its settings and the
+        profile snapshot. The new browser gets a new clone of the snapshot.
+
         Args:
-            text (str): The text to split.
-            limit (int): Maximum words per chunk.
-            
+            reason (str): Recorded in `metrics` as the restart reason.
+        """
+        print(f"Restarting browser ({reason})...")
+        self.metrics.count_restart(reason)
+        self._stop_driver()
+        self._start_driver()
+
+    def browser_rss(self) -> Optional[int]:
+        """Resident memory of chromedriver, Chrome and its renderers in bytes, if measurable."""
+        process = getattr(getattr(self.driver, "service", None), "process", None)
+        return process_tree_rss(getattr(process, "pid", None))
+
+    def _js_heap(self) -> Optional[int]:
+        """Used JS heap of the current page in bytes (Chrome only)."""
+        try:
+            return self.driver.execute_script(
+                "return performance.memory ? performance.memory.usedJSHeapSize : null;"
+            )
+        except Exception:
+            return None
+
+    def _record_chunk(self, success: bool):
+        """Feeds one chunk outcome into the recycling policy."""
+        self._driver_chunks += 1
+        self._consecutive_failures = 0 if success else self._consecutive_failures + 1
+
+    def _recycle_reason(self) -> Optional[str]:
+        """Returns why the browser should be restarted now, or None."""
+        if self.recycle_after_failures and self._consecutive_failures >= self.recycle_after_failures:
+            return "failures"
+        if self.recycle_after_chunks and self._driver_chunks >= self.recycle_after_chunks:
+            return "chunks"
+        if (self.recycle_rss_mb or self.recycle_heap_mb) and self._driver_chunks:
+            now = time.monotonic()
+            if now - self._memory_checked_at >= self.memory_check_interval:
+                self._memory_checked_at = now
+                if self.recycle_rss_mb:
+                    rss = self.browser_rss()
+                    if rss and rss > self.recycle_rss_mb * 2 ** 20:
+                        return "rss"
+                if self.recycle_heap_mb:
+                    heap = self._js_heap()
+                    if heap and heap > self.recycle_heap_mb * 2 ** 20:
+                        return "heap"
+        return None
+
+    def _recycle_if_needed(self) -> bool:
+        """
+        Restarts the browser if the recycling policy says so. Only call this between
+        chunks, when no other tabs are in use.
+
         Returns:
-            List[str]: A list of text chunks.
+            bool: True if the browser was restarted.
         """
-        words = re.findall(r'\b[\w\']+\b', text)
-        if len(words) <= limit:
-            return [text]
-        
-        chunks = []
-        current_word_count = 0
-        
-        # Split by sentence endings
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        
-        current_chunk_str = ""
-        
-        for sentence in sentences:
-            sentence_word_count = len(re.findall(r'\b[\w\']+\b', sentence))
-            
-            if current_word_count + sentence_word_count <= limit:
-                current_chunk_str += sentence + " "
-                current_word_count += sentence_word_count
-            else:
-                if sentence_word_count > limit:
-                    # Handle extremely long sentences by forcing a split
-                     if current_chunk_str:
-                         chunks.append(current_chunk_str.strip())
-                     chunks.append(sentence.strip())
-                     current_chunk_str = ""
-                     current_word_count = 0
-                else:
-                    chunks.append(current_chunk_str.strip())
-                    current_chunk_str = sentence + " "
-                    current_word_count = sentence_word_count
-        
-        if current_chunk_str:
-            chunks.append(current_chunk_str.strip())
-            
-        return chunks
+        reason = self._recycle_reason()
+        if not reason:
+            return False
+        self.restart(reason)
+        return True
 
-    def _clear_input(self, input_element):
-        """Clears the input element using JavaScript events."""
+    def _apply_network_blocking(self):
+        """Blocks `blocked_urls` in the current tab via CDP. Each new tab needs its own call."""
+        if not self.blocked_urls:
+            return
         try:
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", input_element)
-            time.sleep(0.5)
-            
-            self.driver.execute_script("""
-                arguments[0].textContent = '';
-                arguments[0].innerHTML = '';
-                arguments[0].dispatchEvent(new Event('input', { bubbles: true }));
-                arguments[0].dispatchEvent(new Event('change', { bubbles: true }));
-            """, input_element)
-            time.sleep(0.5)
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls})
+        except Exception as e:
+            print(f"Could not block resources: {e}")
+
+    def close(self):
+        """Closes the browser and cleans up temporary directories."""
+        self._stop_driver()
+
+    def is_alive(self) -> bool:
+        """
+        Checks whether the underlying WebDriver session still responds.
+
+        Returns:
+            bool: True if the browser answered a trivial command, False otherwise.
+        """
+        if not self.driver:
+            return False
+        try:
+            self.driver.execute_script("return 1;")
+            return True
+        except Exception:
+            return False
+
+    def word_limit_for(self, tool: str, mode: str = "Basic") -> int:
+        """
+        Returns the number of words per chunk for `tool` and `mode`.
+
+        Uses the configured `word_limit`, then a limit already detected for this profile,
+        then the word counter of the tool page (loading it if needed; the chunk loop
+        reuses that page), then DEFAULT_WORD_LIMIT. Only a counter with a maximum is taken
+        as the limit and stored; for a counter without one (an unlimited plan) configure
+        `word_limit`, e.g. to UNLIMITED_WORD_LIMIT.
+
+        Args:
+            tool (str): "paraphrase" or "humanize".
+            mode (str): Humanizer mode, ignored for paraphrase.
+        """
+        limit = configured_limit(self.word_limit, tool, mode)
+        if limit:
+            return limit
+        key = limit_key(tool, mode)
+        if key in self._word_limits:
+            return self._word_limits[key]
+
+        profile = profile_key(self._user_data_dir, self._profile_directory, self.base_url)
+        limit = self._word_limit_cache.get(profile, tool, mode) if self._word_limit_cache else None
+        if limit is None and self.detect_word_limit:
+            limit = self._detect_word_limit(tool, mode)
+            if limit and self._word_limit_cache:
+                self._word_limit_cache.put(profile, tool, mode, limit)
+        self._word_limits[key] = limit or DEFAULT_WORD_LIMIT
+        return self._word_limits[key]
+
+    def _detect_word_limit(self, tool: str, mode: str, timeout: float = 5.0) -> Optional[int]:
+        """Reads the limit from the input editor's word counter, or None if it shows no maximum or is not found."""
+        try:
+            self._ensure_page(tool, mode)
+            deadline = time.monotonic() + timeout
+            while True:
+                found = self.driver.execute_script(WORD_LIMIT_JS)
+                if found or time.monotonic() >= deadline:
+                    break
+                time.sleep(self.poll_interval)
+        except Exception as e:
+            print(f"Could not detect the word limit: {e}")
+            return None
+        if not isinstance(found, dict):
+            print(f"No word counter found, using {DEFAULT_WORD_LIMIT} words per chunk")
+            return None
+        if found.get("unlimited"):
+            print(
+                f"The word counter shows no maximum, using {DEFAULT_WORD_LIMIT} words per chunk; "
+                f"set word_limit (e.g. {UNLIMITED_WORD_LIMIT}) for larger chunks"
+            )
+            return None
+        limit = int(found.get("limit") or 0)
+        if limit <= 0:
+            return None
+        print(f"Detected word limit for {limit_key(tool, mode)}: {limit}")
+        return limit
+
+    def _split_text(self, text: str, limit: int = DEFAULT_WORD_LIMIT) -> List[str]:
+        """Splits text into chunks of at most `limit` words. See `split_text`."""
+        return split_text(text, limit)
+
+    def _clear_input(self) -> bool:
+        """
+        Clears the input box using JavaScript events, in one script call.
+
+        Returns:
+            bool: False if the input box is not on the page (yet).
+        """
+        try:
+            return bool(self.driver.execute_script(_CLEAR_INPUT_JS))
         except Exception as e:
             print(f"Error clearing input: {e}")
+            return False
 
     def _input_text(self, input_element, text: str):
+        """
+        Inputs text into the element using `input_method`.
+
+        "paste" and "cdp" insert the whole chunk in one operation. If the editor does not
+        pick the text up, it is typed with ActionChains instead.
+
+        Args:
+            input_element (WebElement, optional): The input box; looked up in the page if None.
+        """
+        try:
+            if self.input_method == "paste":
+                inserted = self.driver.execute_script(_PASTE_TEXT_JS, input_element, text)
+                if not (inserted or "").strip():
+                    # The editor may apply a handled paste on its next tick.
+                    time.sleep(0.2)
+                    inserted = self.driver.execute_script(_INPUT_TEXT_JS, input_element, False)
+                if (inserted or "").strip():
+                    return
+                print("Paste input was ignored, falling back to typing")
+            elif self.input_method == "cdp":
+                self.driver.execute_script(_FOCUS_INPUT_JS, input_element)
+                self.driver.execute_cdp_cmd("Input.insertText", {"text": text})
+                inserted = self.driver.execute_script(_INPUT_TEXT_JS, input_element, True)
+                if (inserted or "").strip():
+                    return
+                print("CDP input was ignored, falling back to typing")
+        except Exception as e:
+            print(f"Bulk input failed ({e}), falling back to typing")
+        
+        if self.input_method != "keys":
+            self.metrics.count_retry("input_fallback")
+        self._type_text(input_element, text)
+
+    def _type_text(self, input_element, text: str):
         """Inputs text into the element using ActionChains to simulate real typing."""
         try:
+            if input_element is None:
+                input_element = self.driver.find_element(By.ID, "paraphraser-input-box")
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", input_element)
             
             actions = ActionChains(self.driver)
             actions.move_to_element(input_element).click().perform()
-            time.sleep(0.5)
             
             actions.send_keys(text).perform()
-            time.sleep(0.5)
             
             # Trigger input event just in case
             self.driver.execute_script("arguments[0].dispatchEvent(new Event('input', { bubbles: true }));", input_element)
@@ -184,31 +1054,87 @@ class Quillbot:
         except Exception as e:
             print(f"Error inputting text: {e}")
 
-    def _get_output(self) -> Optional[str]:
-        """Retrieves the text from the output box."""
+    def _output_probe(self, reset: bool = False) -> Optional[dict]:
+        """
+        Reads the output box state in a single script call.
+
+        Args:
+            reset (bool): Reset the mutation counter, marking the start of a new request.
+
+        Returns:
+            dict: `text`, `mutations`, `idle` (seconds since last change) and `busy`, or None
+            if the box is missing.
+        """
         try:
-            output_element = self.wait.until(EC.presence_of_element_located((By.ID, "paraphraser-output-box")))
-            
-            # Wait for processing to potentially finish/start
-            time.sleep(5)
-            
-            text = output_element.text
-            if not text:
-                # Try getting text from child div if exists (common in Quillbot's editor)
-                try:
-                    child = output_element.find_element(By.CSS_SELECTOR, "div[contenteditable='true']")
-                    text = child.text
-                except Exception:
-                    pass
-            
-            return text
-        except Exception as e:
-            print(f"Error getting output: {e}")
+            return self.driver.execute_script(_OUTPUT_PROBE_JS, reset)
+        except Exception:
             return None
 
+    def _timed_probe(self) -> Tuple[Optional[dict], float]:
+        """Runs `_output_probe()` and returns its result with the seconds it took."""
+        started = time.monotonic()
+        probe = self._output_probe()
+        return probe, time.monotonic() - started
+
+    def _record_output(self, timer: Optional[PhaseTimer], tracker: _OutputTracker, waited: float, last_probe: float):
+        """
+        Records the wait for a finished chunk: the final probe, which read the text, counts
+        as `extract` and everything before it as `wait_output`.
+        """
+        if tracker.timed_out:
+            self.metrics.count_retry("output_timeout")
+        if timer:
+            timer.record("wait_output", max(waited - last_probe, 0.0))
+            timer.record("extract", last_probe)
+
+    def _watch_response(self, button_text: str):
+        """Starts following the API request the next click of `button_text` sends, in network capture."""
+        self._response_watcher = None
+        tool = _BUTTON_TOOLS.get(button_text)
+        if self.output_capture != "network" or tool not in self.response_patterns:
+            return
+        try:
+            self._response_watcher = ResponseWatcher(self.driver, self.response_patterns[tool], self.response_extractor)
+        except Exception as e:
+            print(f"Error reading network events: {e}")
+
+    def _response_output(
+        self,
+        watcher: ResponseWatcher,
+        timer: Optional[PhaseTimer],
+        waited: float
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Turns a finished ResponseWatcher into the chunk's output.
+
+        Reading the response body counts as `extract` and the rest as `wait_output`.
+
+        Returns:
+            tuple: `(handled, output)`. `handled` is False when the output box should be read
+            instead: no matching request was seen, or its body held no recognisable text.
+            A request that failed is handled with output None, so the chunk is retried
+            without waiting for the box.
+        """
+        if watcher.text or watcher.failed:
+            if watcher.error:
+                print(f"Network capture: {watcher.error}")
+            if timer:
+                timer.record("wait_output", max(waited - watcher.body_seconds, 0.0))
+                timer.record("extract", watcher.body_seconds)
+            return True, watcher.text
+        if watcher.error:
+            print(f"Network capture: {watcher.error}; reading the output box instead")
+        self.metrics.count_retry("network_fallback")
+        return False, None
+
     def _click_button(self, xpath_text: str, css_selector: Optional[str] = None) -> bool:
         """
-        Robustly finds and clicks a button using multiple strategies.
+        Finds and clicks a visible button in a single script call.
+
+        Buttons are matched by their text, then by `css_selector`. Clicking also resets
+        the output probe, so only output produced after the click is accepted. A disabled
+        button is polled for up to `_BUTTON_ENABLE_TIMEOUT` seconds, since the editor may
+        enable it only after processing the new text.
         
         Args:
             xpath_text (str): Text to search for in the button (e.g., "Paraphrase").
@@ -217,134 +1143,814 @@ class Quillbot:
         Returns:
             bool: True if clicked successfully, False otherwise.
         """
-        button = None
+        deadline = time.monotonic() + _BUTTON_ENABLE_TIMEOUT
+        while True:
+            try:
+                state = self.driver.execute_script(_CLICK_BUTTON_JS, xpath_text, css_selector) or {}
+            except Exception as e:
+                print(f"Error clicking button '{xpath_text}': {e}")
+                return False
+            if state.get("clicked"):
+                if state.get("via") == "css":
+                    self.metrics.count_retry("button_fallback")
+                return True
+            if not state.get("disabled"):
+                return False
+            if time.monotonic() >= deadline:
+                print(f"Button '{xpath_text}' stayed disabled")
+                return False
+            time.sleep(self.poll_interval)
+
+    def _submit_chunk(
+        self,
+        chunk: str,
+        button_text: str,
+        css_selector: Optional[str] = None,
+        timer: Optional[PhaseTimer] = None,
+        watch_response: bool = True
+    ) -> bool:
+        """
+        Types a chunk into the input box of the current tab and clicks the action button.
+
+        Args:
+            timer (PhaseTimer, optional): Receives the `clear`, `input` and `click` phases.
+            watch_response (bool): In network capture, follow the request the click sends so
+                its response can be read. Tabs polled by their output box pass False.
+
+        Returns:
+            bool: True if the button was clicked.
+        """
+        with _phase(timer, "clear"):
+            if not self._clear_input():
+                # Only wait when the editor is not there yet, e.g. right after a load.
+                self.wait.until(EC.presence_of_element_located((By.ID, "paraphraser-input-box")))
+                self._clear_input()
+        with _phase(timer, "input"):
+            self._input_text(None, chunk)
         
-        # Strategy 1: XPath with text
+        with _phase(timer, "click"):
+            if watch_response:
+                self._watch_response(button_text)
+            clicked = self._click_button(button_text, css_selector)
+        if clicked:
+            return True
+        self._response_watcher = None
+        print(f"{button_text} button not found")
+        return False
+
+    def _open_paraphraser(self):
+        """Loads the paraphrasing tool in the current tab."""
+        timer = self.metrics.start_page("paraphrase")
+        with timer.phase("navigate"):
+            self.driver.get(self.base_url + PARAPHRASER_PATH)
+        timer.finish()
+
+    def _open_humanizer(self, mode: str):
+        """Loads the AI Humanizer in the current tab and selects `mode`."""
+        timer = self.metrics.start_page("humanize", mode)
+        with timer.phase("navigate"):
+            self.driver.get(self.base_url + HUMANIZER_PATH)
+        with timer.phase("select_mode"):
+            self._select_mode(mode)
+        timer.finish()
+
+    def _select_mode(self, mode: str):
+        """Selects the humanizer mode tab and warns if it needs an account."""
         try:
-            candidates = self.driver.find_elements(By.XPATH, f"//button[contains(., '{xpath_text}')]")
-            for btn in candidates:
-                if btn.is_displayed():
-                    button = btn
-                    break
+            mode_selector = _MODE_TABS.get(mode)
+            if mode_selector:
+                tab = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, mode_selector)))
+                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tab)
+                ActionChains(self.driver).move_to_element(tab).click().perform()
+                try:
+                    WebDriverWait(self.driver, 3).until(
+                        lambda d: tab.get_attribute("aria-selected") == "true"
+                    )
+                except Exception:
+                    pass
+                
+                # Check for "Sign up" popup
+                try:
+                    popup = self.driver.find_elements(By.XPATH, "//*[contains(text(), 'Sign up to use Advanced Humanize')]")
+                    if popup and any(p.is_displayed() for p in popup):
+                        print("WARNING: Advanced mode requires sign-up. The automation may fail or require manual intervention.")
+                except Exception:
+                    pass
+            else:
+                print(f"Unknown mode: {mode}. Using default.")
+        except Exception as e:
+            print(f"Error selecting mode: {e}")
+
+    def _page_is_ready(self, tool: str, mode: str) -> bool:
+        """Checks, in one script call, that the loaded page is still fresh and usable."""
+        if self.page_max_age is not None and time.monotonic() - self._page_loaded_at > self.page_max_age:
+            return False
+        path = PARAPHRASER_PATH if tool == "paraphrase" else HUMANIZER_PATH
+        mode_tab = _MODE_TABS.get(mode) if tool == "humanize" else None
+        try:
+            return bool(self.driver.execute_script(_PAGE_READY_JS, path, mode_tab))
         except Exception:
-            pass
+            return False
+
+    def _ensure_page(self, tool: str, mode: str = "Basic", force: bool = False):
+        """
+        Makes sure the current tab shows `tool` in `mode`, loading it only when needed.
+
+        The page is reused if it was the last one loaded, has not been invalidated by an
+        error, is younger than `page_max_age` and still passes a quick DOM check.
+
+        Args:
+            tool (str): "paraphrase" or "humanize".
+            mode (str): Humanizer mode, ignored for paraphrase.
+            force (bool): Always load, e.g. for a freshly opened tab.
+        """
+        key = (tool, mode if tool == "humanize" else "")
+        if not force and self._page_state == key and self._page_is_ready(tool, mode):
+            self.metrics.count_page(reused=True)
+            return
+        
+        self._page_state = None
+        if tool == "paraphrase":
+            self._open_paraphraser()
+        else:
+            self._open_humanizer(mode)
+        self._page_state = key
+        self._page_loaded_at = time.monotonic()
+        self.metrics.count_page(reused=False)
+
+    def _invalidate_page(self):
+        """Forgets the loaded page so the next chunk reloads it (after an error)."""
+        self._page_state = None
+
+    def _tool_spec(self, tool: str, mode: str = "Basic") -> Tuple[Callable[..., None], str, Optional[str]]:
+        """
+        Resolves a tool name to its page loader, button label and fallback selector.
+
+        The loader reuses the page already loaded in the tab where possible; call it with
+        `force=True` to load unconditionally.
+
+        Args:
+            tool (str): "paraphrase" or "humanize".
+            mode (str): Humanizer mode, ignored for paraphrase.
+        """
+        if tool not in ("paraphrase", "humanize"):
+            raise ValueError(f"Unknown tool: {tool}")
+        
+        def open_page(force: bool = False):
+            self._ensure_page(tool, mode, force)
+        
+        if tool == "paraphrase":
+            return open_page, "Paraphrase", "button.MuiButton-containedPrimary"
+        return open_page, "Humanize", None
+
+    def _acquire_slot(self):
+        """Waits for the controller, if any, to allow another chunk in flight."""
+        if self.controller is not None:
+            self.controller.acquire()
+
+    def _release_slot(self, success: bool, started: float):
+        """Reports a finished chunk attempt that started at `started` to the controller."""
+        if self.controller is not None:
+            self.controller.release(success, time.monotonic() - started)
+
+    def _backoff(self, failures: int) -> float:
+        """Seconds to wait before the next attempt of a chunk that failed `failures` times."""
+        return min(self.retry_backoff * 2 ** (failures - 1), self.max_backoff)
+
+    def chunk_task(
+        self,
+        tool: str,
+        mode: str,
+        chunk: str,
+        index: int = 0,
+        prepare: Optional[Callable[[bool], None]] = None,
+        watch_response: bool = True,
+        recycle: bool = True
+    ) -> ChunkTask:
+        """
+        Creates a ChunkTask for one chunk in this session; see `ChunkTask` for the arguments.
+
+        Drive it with `step()` until it returns True, or use `process_chunk()` to do so.
+        """
+        return ChunkTask(self, tool, mode, chunk, index, prepare, watch_response, recycle)
+
+    def process_chunk(
+        self,
+        tool: str,
+        mode: str,
+        chunk: str,
+        index: int = 0,
+        use_cache: bool = True
+    ) -> ChunkOutcome:
+        """
+        Processes one chunk in the session's tab, retrying failed attempts with backoff.
+        A blank chunk is returned unchanged without an attempt.
+
+        Args:
+            tool (str): "paraphrase" or "humanize".
+            mode (str): Humanizer mode, ignored for paraphrase.
+            chunk (str): Input text, within the word limit.
+            index (int): Position of the chunk in its document, for metrics and messages.
+            use_cache (bool): Return a cached output without touching the browser.
+
+        Returns:
+            ChunkOutcome: `(index, output, seconds, attempts, error)`; output is None if
+            every attempt failed.
+        """
+        if not chunk.strip():
+            return ChunkOutcome(index, chunk, 0.0, 0, None)
+        if use_cache:
+            output = self._cache_get(tool, mode, chunk)
+            if output is not None:
+                return ChunkOutcome(index, output, 0.0, 0, None)
+        task = self.chunk_task(tool, mode, chunk, index)
+        while not task.step(block=True):
+            if task.running:
+                time.sleep(self.poll_interval)
+        return task.outcome()
+
+    def _run_chunks(
+        self,
+        chunks: List[str],
+        tool: str,
+        mode: str = "Basic",
+        parallel_tabs: int = 1
+    ) -> List[Optional[str]]:
+        """
+        Processes chunks on the current session and returns their outputs in order.
+
+        Args:
+            chunks (List[str]): Input chunks.
+            tool (str): "paraphrase" or "humanize".
+            mode (str): Humanizer mode, ignored for paraphrase.
+            parallel_tabs (int): Number of browser tabs to keep busy at once.
+
+        Returns:
+            List[Optional[str]]: One entry per chunk, None where the chunk failed.
+        """
+        outputs: List[Optional[str]] = [None] * len(chunks)
+        for result in self._iter_run_chunks(chunks, tool, mode, parallel_tabs):
+            outputs[result.index] = result.output
+        return outputs
+
+    def _iter_run_chunks(
+        self,
+        chunks: List[str],
+        tool: str,
+        mode: str = "Basic",
+        parallel_tabs: int = 1,
+        indices: Optional[List[int]] = None
+    ) -> Iterator[ChunkOutcome]:
+        """
+        Like `_run_chunks`, but yields a ChunkOutcome as soon as each chunk is done,
+        without consulting the cache.
+
+        Args:
+            indices (List[int], optional): Position of each chunk in its document, reported
+                as `ChunkOutcome.index`. Defaults to the position in `chunks`.
+        """
+        indices = indices or list(range(len(chunks)))
+        self._recycle_if_needed()
+        if parallel_tabs > 1 and len(chunks) > 1:
+            yield from self._iter_run_chunks_in_tabs(chunks, tool, mode, indices, min(parallel_tabs, len(chunks)))
+            return
+        for index, chunk in zip(indices, chunks):
+            yield self.process_chunk(tool, mode, chunk, index, use_cache=False)
+
+    def _iter_run_chunks_in_tabs(
+        self,
+        chunks: List[str],
+        tool: str,
+        mode: str,
+        indices: List[int],
+        tabs: int
+    ) -> Iterator[ChunkOutcome]:
+        """
+        Spreads chunks over several tabs of the same browser, yielding in completion order.
+
+        All tabs take chunks from one queue; see `_run_tasks_in_tabs`.
+        """
+        open_page = self._tool_spec(tool, mode)[0]
+        queue = [
+            self.chunk_task(tool, mode, chunk, index, watch_response=False, recycle=False)
+            for index, chunk in zip(indices, chunks)
+        ]
+        lanes = [(open_page, queue) for _ in range(tabs)]
+        yield from self._run_tasks_in_tabs(lanes, lambda task: [task.outcome()])
+
+    def _run_tasks_in_tabs(
+        self,
+        lanes: List[Tuple[Callable[[bool], None], List[ChunkTask]]],
+        on_done: Callable[[ChunkTask], Iterable[ChunkOutcome]]
+    ) -> Iterator[ChunkOutcome]:
+        """
+        Steps chunk tasks in one tab per lane, round-robin, yielding what `on_done` returns.
+
+        WebDriver only talks to one tab at a time, so each tab is given a task and clicked
+        in turn; the tabs are then polled while QuillBot works on all of them concurrently.
+        A tab that finishes takes the next ready task from its lane's queue right away.
+
+        Each lane is `(load, queue)`: `load(force)` shows the lane's tool in the current tab
+        and `queue` holds the tasks the lane may run (lanes may share a queue). The first
+        lane uses the session's own tab. A task whose attempt failed goes back into its
+        queue for its backoff delay, and the tab it failed in is reloaded before it is used
+        again. `on_done(task)` is called for every finished task and may queue new ones.
+        """
+        origin = self.driver.current_window_handle
+        handles = [origin]
+        stale = set()
+        # handle -> running task
+        active: Dict[str, ChunkTask] = {}
+        
+        def run(handle: str, queue: List[ChunkTask], task: ChunkTask) -> List[ChunkOutcome]:
+            """Steps a task in the current tab and files it: running, requeued or finished."""
+            was_running, attempts = task.running, task.attempts
+            task.step()
+            if task.running:
+                active[handle] = task
+                return []
+            attempted = was_running or task.attempts != attempts
+            if attempted and task.output is None:
+                stale.add(handle)
+            if task.done:
+                return list(on_done(task))
+            if not attempted:
+                # No controller slot yet; keep its place in the queue.
+                queue.insert(0, task)
+            else:
+                queue.append(task)
+            return []
+        
+        try:
+            lanes[0][0](False)
+            for load, _ in lanes[1:]:
+                self.driver.switch_to.new_window('tab')
+                handles.append(self.driver.current_window_handle)
+                self._apply_network_blocking()
+                load(True)
             
-        # Strategy 2: CSS Selector fallback
-        if not button and css_selector:
+            while active or any(queue for _, queue in lanes):
+                for handle, (load, queue) in zip(handles, lanes):
+                    self.driver.switch_to.window(handle)
+                    finished: List[ChunkOutcome] = []
+                    if handle in active:
+                        finished += run(handle, queue, active.pop(handle))
+                    if handle not in active:
+                        task = next((t for t in queue if t.ready()), None)
+                        if task is not None:
+                            queue.remove(task)
+                            
+                            def prepare(force: bool, handle: str = handle, load: Callable[[bool], None] = load):
+                                # Only the tab an attempt failed in needs reloading.
+                                if handle in stale:
+                                    load(True)
+                                    stale.discard(handle)
+                            
+                            task.prepare = prepare
+                            finished += run(handle, queue, task)
+                    if finished:
+                        yield from finished
+                        self.driver.switch_to.window(handle)
+                
+                if active or any(queue for _, queue in lanes):
+                    time.sleep(self.poll_interval)
+        finally:
+            # Chunks still running when the loop is abandoned hold a controller slot each.
+            for task in active.values():
+                task.abandon()
+            if origin in stale:
+                self._invalidate_page()
+            for handle in handles[1:]:
+                try:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                except Exception:
+                    pass
             try:
-                candidates = self.driver.find_elements(By.CSS_SELECTOR, css_selector)
-                for btn in candidates:
-                    if xpath_text in btn.text and btn.is_displayed():
-                        button = btn
-                        break
+                self.driver.switch_to.window(origin)
             except Exception:
                 pass
-                
-        if button:
-            try:
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
-                actions = ActionChains(self.driver)
-                actions.move_to_element(button).click().perform()
-                return True
-            except Exception as e:
-                print(f"Error clicking button '{xpath_text}': {e}")
-                return False
+
+    def _iter_run_pipeline(
+        self,
+        chunks: List[str],
+        stages: List[Tuple[str, str]]
+    ) -> Iterator[ChunkOutcome]:
+        """
+        Runs every chunk through all stages, one tab per stage, yielding in completion order.
+
+        Each stage is a lane of `_run_tasks_in_tabs`. A chunk that finishes a stage is
+        queued for the next stage's tab right away, so stage 2 of chunk i runs while stage 1
+        works on chunk i+1. Intermediate outputs are served from and stored in the cache per
+        stage. A failed stage attempt is retried with backoff on a reloaded tab; a chunk that
+        runs out of attempts at any stage is yielded with output None.
+        """
+        open_first = self._tool_spec(*stages[0])[0]
+        # Per stage: tasks waiting for that stage's tab.
+        queues: List[List[ChunkTask]] = [[] for _ in stages]
+        stage_of: Dict[ChunkTask, int] = {}
+        attempts = [0] * len(chunks)
+        first_started: Dict[int, float] = {}
         
-        return False
+        def enqueue(stage: int, index: int, text: str):
+            task = self.chunk_task(*stages[stage], text, index, watch_response=False, recycle=False)
+            task.fields["stage"] = stage
+            stage_of[task] = stage
+            queues[stage].append(task)
+        
+        def load(stage: int, force: bool = False):
+            if stage == 0:
+                # The first tab is the session's own, so its page state is tracked as usual.
+                open_first(force)
+            elif stages[stage][0] == "paraphrase":
+                self._open_paraphraser()
+            else:
+                self._open_humanizer(stages[stage][1])
+        
+        def advance(stage: int, index: int, output: Optional[str], error: Optional[str] = None) -> List[ChunkOutcome]:
+            """Moves a chunk on to the next stage (or out of the pipeline) after `stage`."""
+            while output is not None and stage + 1 < len(stages):
+                stage += 1
+                cached = output if not output.strip() else self._cache_get(*stages[stage], output)
+                if cached is None:
+                    enqueue(stage, index, output)
+                    return []
+                output = cached
+            if output is None:
+                tool, mode = stages[stage]
+                label = tool if tool == "paraphrase" else f"{tool} ({mode})"
+                error = f"stage {stage + 1} ({label}): {error or 'No output received'}"
+            seconds = time.monotonic() - first_started.get(index, time.monotonic())
+            return [ChunkOutcome(index, output, seconds, attempts[index], error)]
+        
+        def on_done(task: ChunkTask) -> List[ChunkOutcome]:
+            stage = stage_of.pop(task)
+            attempts[task.index] += task.attempts
+            if task.started is not None:
+                first_started.setdefault(task.index, task.started)
+            return advance(stage, task.index, task.output, task.error)
+        
+        for index, chunk in enumerate(chunks):
+            output = chunk if not chunk.strip() else self._cache_get(*stages[0], chunk)
+            if output is None:
+                enqueue(0, index, chunk)
+            else:
+                yield from advance(0, index, output)
+        if not any(queues):
+            return
+        
+        self._recycle_if_needed()
+        lanes = [(lambda force, stage=stage: load(stage, force), queue) for stage, queue in enumerate(queues)]
+        yield from self._run_tasks_in_tabs(lanes, on_done)
+
+    def _cache_get(self, tool: str, mode: str, chunk: str) -> Optional[str]:
+        """Returns a cached output for the chunk, or None if caching is off or it is a miss."""
+        if not self.cache:
+            return None
+        try:
+            return self.cache.get(tool, mode if tool == "humanize" else "", chunk)
+        except Exception as e:
+            print(f"Error reading cache: {e}")
+            return None
+
+    def _cache_put(self, tool: str, mode: str, chunk: str, output: str):
+        """Stores a chunk output if caching is enabled."""
+        if not self.cache:
+            return
+        try:
+            self.cache.put(tool, mode if tool == "humanize" else "", chunk, output)
+        except Exception as e:
+            print(f"Error writing cache: {e}")
+
+    def _iter_chunks(
+        self,
+        chunks: List[str],
+        tool: str,
+        mode: str = "Basic",
+        parallel_tabs: int = 1,
+        journal: Optional[JobJournal] = None,
+        report: Optional[ProcessReport] = None
+    ) -> Iterator[ChunkResult]:
+        """
+        Yields a ChunkResult per chunk as soon as it is available.
+
+        Chunks already in the journal or the cache cost nothing; they are yielded just before
+        the next chunk from the browser so that sequential runs stay in input order.
+
+        Args:
+            journal (JobJournal, optional): Serves completed chunks and records new ones.
+            report (ProcessReport, optional): Receives the failures and the resumed count.
+        """
+        cached: Dict[int, str] = {}
+        missing: List[int] = []
+        for i, chunk in enumerate(chunks):
+            if not chunk.strip():
+                # Nothing to rewrite; a blank chunk is returned as it is.
+                cached[i] = chunk
+                continue
+            output = journal.get(chunk) if journal else None
+            if output is not None and report:
+                report.resumed += 1
+            if output is None:
+                output = self._cache_get(tool, mode, chunk)
+            if output is None:
+                missing.append(i)
+            else:
+                cached[i] = output
+        
+        ready = sorted(cached)
+        
+        def flush_cached(before: int) -> Iterator[ChunkResult]:
+            while ready and ready[0] < before:
+                i = ready.pop(0)
+                yield ChunkResult(i, chunks[i], cached.pop(i), 0.0)
+        
+        if missing:
+            results = self._iter_run_chunks([chunks[i] for i in missing], tool, mode, parallel_tabs, missing)
+            for result in results:
+                i = result.index
+                yield from flush_cached(i)
+                if journal:
+                    journal.record(i, chunks[i], result.output, result.attempts, result.error)
+                if report and result.output is None:
+                    report.failures.append(ChunkFailure(i, chunks[i], result.attempts, result.error or "No output received"))
+                yield ChunkResult(i, chunks[i], result.output, result.seconds)
+        
+        yield from flush_cached(len(chunks))
+
+    def _process_chunks(
+        self,
+        chunks: List[str],
+        tool: str,
+        mode: str = "Basic",
+        parallel_tabs: int = 1,
+        journal: Optional[JobJournal] = None,
+        report: Optional[ProcessReport] = None
+    ) -> List[Optional[str]]:
+        """
+        Serves what it can from the journal and cache and sends the rest to the browser.
 
-    def paraphrase(self, text: str) -> str:
+        Returns:
+            List[Optional[str]]: One output per chunk, None where the chunk failed.
+        """
+        outputs: List[Optional[str]] = [None] * len(chunks)
+        for result in self._iter_chunks(chunks, tool, mode, parallel_tabs, journal, report):
+            outputs[result.index] = result.output
+        return outputs
+
+    def _process_markdown(
+        self,
+        text: str,
+        tool: str,
+        mode: str = "Basic",
+        parallel_tabs: int = 1,
+        journal: Optional[JobJournal] = None,
+        report: Optional[ProcessReport] = None
+    ) -> str:
+        """
+        Rewrites only the prose of a markdown document and rebuilds its structure around it.
+
+        Prose spans are packed into budget-sized chunks, one paragraph per span. If QuillBot
+        merges or splits paragraphs so the output cannot be mapped back, the pieces of that
+        chunk are resent one by one. Only pieces that still fail are reported, indexed by
+        their prose span.
+        """
+        document = MarkdownDocument(text)
+        groups = pack_spans(document.spans, self.word_limit_for(tool, mode))
+        first_pass = ProcessReport()
+        outputs = self._process_chunks([join_group(g) for g in groups], tool, mode, parallel_tabs, journal, first_pass)
+        
+        split_outputs = [split_group_output(g, o) for g, o in zip(groups, outputs)]
+        retry = [(span_index, piece) for g, parts in zip(groups, split_outputs) if parts is None for span_index, piece in g]
+        retry_outputs = iter([])
+        retry_pass = ProcessReport()
+        if retry:
+            print(f"Resending {len(retry)} markdown pieces individually")
+            retry_outputs = iter(self._process_chunks([piece for _, piece in retry], tool, mode, parallel_tabs, journal, retry_pass))
+        if report:
+            report.total = len(document.spans)
+            report.resumed = first_pass.resumed + retry_pass.resumed
+            report.failures = [ChunkFailure(retry[f.index][0], f.chunk, f.attempts, f.error) for f in retry_pass.failures]
+        
+        # Pieces that still failed keep their original text so the structure stays intact.
+        pieces: List[List[str]] = [[] for _ in document.spans]
+        for group, parts in zip(groups, split_outputs):
+            for k, (span_index, piece) in enumerate(group):
+                part = parts[k] if parts is not None else next(retry_outputs)
+                pieces[span_index].append(part or piece)
+        
+        return document.render([" ".join(span_parts) for span_parts in pieces])
+
+    def _process(
+        self,
+        text: str,
+        tool: str,
+        mode: str = "Basic",
+        parallel_tabs: int = 1,
+        markdown: bool = False,
+        journal: Optional[str] = None,
+        strict: bool = False
+    ) -> str:
+        """
+        Splits the text, processes the chunks and joins the outputs in order.
+
+        The outcome is stored in `last_report`, and a summary is printed if chunks failed.
+
+        Returns:
+            str: The processed text.
+
+        Raises:
+            IncompleteOutputError: In strict mode, if any chunk failed.
+        """
+        report = ProcessReport(journal=journal)
+        job = self._open_journal(journal, tool, mode)
+        try:
+            if markdown:
+                result = self._process_markdown(text, tool, mode, parallel_tabs, job, report)
+            else:
+                chunks = self._split_text(text, self.word_limit_for(tool, mode))
+                report.total = len(chunks)
+                outputs = self._process_chunks(chunks, tool, mode, parallel_tabs, job, report)
+                result = " ".join(o for o in outputs if o).strip()
+        finally:
+            if job:
+                job.close()
+        
+        self.last_report = report
+        if not report.complete:
+            print(report.summary())
+            if strict:
+                raise IncompleteOutputError(report, result)
+        return result
+
+    def _open_journal(self, path: Optional[str], tool: str, mode: str) -> Optional[JobJournal]:
+        if not path:
+            return None
+        return JobJournal(path, tool, mode if tool == "humanize" else "")
+
+    def _iter_journaled(
+        self,
+        text: str,
+        tool: str,
+        mode: str,
+        parallel_tabs: int,
+        journal: Optional[str]
+    ) -> Iterator[ChunkResult]:
+        job = self._open_journal(journal, tool, mode)
+        try:
+            chunks = self._split_text(text, self.word_limit_for(tool, mode))
+            yield from self._iter_chunks(chunks, tool, mode, parallel_tabs, job)
+        finally:
+            if job:
+                job.close()
+
+    def paraphrase(
+        self,
+        text: str,
+        parallel_tabs: int = 1,
+        markdown: bool = False,
+        journal: Optional[str] = None,
+        strict: bool = False
+    ) -> str:
         """
         Paraphrases the given text.
         
         Args:
             text (str): Input text.
+            parallel_tabs (int): Number of tabs used to process chunks concurrently.
+            markdown (bool): Treat the input as markdown and only rewrite its prose.
+            journal (str, optional): Path of a job journal. Finished chunks are recorded there,
+                and a rerun with the same path only processes the chunks still missing.
+            strict (bool): Raise IncompleteOutputError instead of returning partial output.
             
         Returns:
-            str: Paraphrased text.
+            str: Paraphrased text. See `last_report` for failed chunks.
         """
-        chunks = self._split_text(text)
-        full_output = ""
-        
-        self.driver.get("https://quillbot.com/paraphrasing-tool")
-        time.sleep(2)
-        
-        for i, chunk in enumerate(chunks):
-            try:
-                input_box = self.wait.until(EC.presence_of_element_located((By.ID, "paraphraser-input-box")))
-                self._clear_input(input_box)
-                self._input_text(input_box, chunk)
-                
-                if self._click_button("Paraphrase", "button.MuiButton-containedPrimary"):
-                    time.sleep(15) # Wait for processing
-                    output = self._get_output()
-                    if output:
-                        full_output += output + " "
-                else:
-                    print("Paraphrase button not found")
-                    
-            except Exception as e:
-                print(f"Error processing chunk {i+1}: {e}")
-                
-        return full_output.strip()
+        return self._process(text, "paraphrase", parallel_tabs=parallel_tabs, markdown=markdown, journal=journal, strict=strict)
 
-    def humanize(self, text: str, mode: str = "Basic") -> str:
+    def humanize(
+        self,
+        text: str,
+        mode: str = "Basic",
+        parallel_tabs: int = 1,
+        markdown: bool = False,
+        journal: Optional[str] = None,
+        strict: bool = False
+    ) -> str:
         """
         Humanizes the given text using the AI Humanizer.
         
         Args:
             text (str): Input text.
             mode (str): "Basic" or "Advanced". Note: Advanced requires a logged-in session.
+            parallel_tabs (int): Number of tabs used to process chunks concurrently.
+            markdown (bool): Treat the input as markdown and only rewrite its prose.
+            journal (str, optional): Path of a job journal; see `paraphrase()`.
+            strict (bool): Raise IncompleteOutputError instead of returning partial output.
             
         Returns:
-            str: Humanized text.
+            str: Humanized text. See `last_report` for failed chunks.
+        """
+        return self._process(text, "humanize", mode, parallel_tabs=parallel_tabs, markdown=markdown, journal=journal, strict=strict)
+
+    def _iter_pipeline(
+        self,
+        text: str,
+        stages: List[Tuple[str, str]],
+        report: Optional[ProcessReport] = None
+    ) -> Iterator[ChunkResult]:
+        # Every stage must accept every chunk, so cut at the smallest limit. Rewrites come
+        # back at about the same length, which leaves intermediate outputs within it too.
+        limit = min(self.word_limit_for(tool, mode) for tool, mode in stages)
+        chunks = self._split_text(text, limit)
+        if report:
+            report.total = len(chunks)
+        for result in self._iter_run_pipeline(chunks, stages):
+            if report and result.output is None:
+                report.failures.append(ChunkFailure(result.index, chunks[result.index], result.attempts, result.error or "No output received"))
+            yield ChunkResult(result.index, chunks[result.index], result.output, result.seconds)
+
+    def pipeline(self, text: str, stages: Sequence[Stage] = ("paraphrase", "humanize"), strict: bool = False) -> str:
+        """
+        Runs the text through several tools in a row, e.g. paraphrase and then humanize.
+
+        Each stage gets its own tab, and each chunk moves on to the next stage as soon as it
+        has finished the previous one. Stages therefore overlap across chunks and a job
+        takes about as long as its slowest stage rather than the sum of all of them.
+
+        Args:
+            text (str): Input text.
+            stages (Sequence): Tools in order, each a name ("paraphrase", "humanize") or a
+                `(tool, mode)` pair such as `("humanize", "Advanced")`.
+            strict (bool): Raise IncompleteOutputError instead of returning partial output.
+
+        Returns:
+            str: Output of the last stage. Chunks that failed at any stage are left out;
+            see `last_report`.
+
+        Raises:
+            IncompleteOutputError: In strict mode, if any chunk failed.
         """
-        chunks = self._split_text(text)
-        full_output = ""
+        report = ProcessReport()
+        outputs: Dict[int, str] = {}
+        for result in self._iter_pipeline(text, _normalize_stages(stages), report):
+            if result.output:
+                outputs[result.index] = result.output
+        result = " ".join(outputs[i] for i in sorted(outputs)).strip()
         
-        self.driver.get("https://quillbot.com/ai-humanizer")
-        time.sleep(2)
+        self.last_report = report
+        if not report.complete:
+            print(report.summary())
+            if strict:
+                raise IncompleteOutputError(report, result)
+        return result
+
+    def iter_pipeline(self, text: str, stages: Sequence[Stage] = ("paraphrase", "humanize")) -> Iterator[ChunkResult]:
+        """
+        Like `pipeline()`, but yields each chunk as soon as it has passed the last stage.
+
+        Chunks are yielded in completion order; use `ChunkResult.index` to place them.
+
+        Yields:
+            ChunkResult: `(index, chunk, output, seconds)`, where `chunk` is the original input
+            and `output` the last stage's result, or None if the chunk failed at any stage.
+        """
+        yield from self._iter_pipeline(text, _normalize_stages(stages))
+
+    def iter_paraphrase(self, text: str, parallel_tabs: int = 1, journal: Optional[str] = None) -> Iterator[ChunkResult]:
+        """
+        Paraphrases the given text, yielding each chunk as soon as it is done.
+
+        Sequential runs yield in input order; with `parallel_tabs` > 1 chunks are yielded
+        in completion order, so use `ChunkResult.index` to place them.
         
-        # Select mode
-        try:
-            mode_selector = None
-            if mode == "Basic":
-                mode_selector = "#Paraphraser-mode-tab-0"
-            elif mode == "Advanced":
-                mode_selector = "#Paraphraser-mode-tab-1"
+        Args:
+            text (str): Input text.
+            parallel_tabs (int): Number of tabs used to process chunks concurrently.
+            journal (str, optional): Path of a job journal; see `paraphrase()`.
             
-            if mode_selector:
-                tab = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, mode_selector)))
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tab)
-                ActionChains(self.driver).move_to_element(tab).click().perform()
-                time.sleep(1)
-                
-                # Check for "Sign up" popup
-                try:
-                    popup = self.driver.find_elements(By.XPATH, "//*[contains(text(), 'Sign up to use Advanced Humanize')]")
-                    if popup and any(p.is_displayed() for p in popup):
-                        print("WARNING: Advanced mode requires sign-up. The automation may fail or require manual intervention.")
-                except Exception:
-                    pass
-            else:
-                print(f"Unknown mode: {mode}. Using default.")
-        except Exception as e:
-            print(f"Error selecting mode: {e}")
+        Yields:
+            ChunkResult: `(index, chunk, output, seconds)`; output is None if the chunk failed.
+        """
+        yield from self._iter_journaled(text, "paraphrase", "Basic", parallel_tabs, journal)
 
-        for i, chunk in enumerate(chunks):
-            try:
-                input_box = self.wait.until(EC.presence_of_element_located((By.ID, "paraphraser-input-box")))
-                self._clear_input(input_box)
-                self._input_text(input_box, chunk)
-                
-                if self._click_button("Humanize"):
-                    time.sleep(15)
-                    output = self._get_output()
-                    if output:
-                        full_output += output + " "
-                else:
-                    print("Humanize button not found")
-                    
-            except Exception as e:
-                print(f"Error processing chunk {i+1}: {e}")
-                
-        return full_output.strip()
+    def iter_humanize(
+        self,
+        text: str,
+        mode: str = "Basic",
+        parallel_tabs: int = 1,
+        journal: Optional[str] = None
+    ) -> Iterator[ChunkResult]:
+        """
+        Humanizes the given text, yielding each chunk as soon as it is done.
+        
+        Args:
+            text (str): Input text.
+            mode (str): "Basic" or "Advanced". Note: Advanced requires a logged-in session.
+            parallel_tabs (int): Number of tabs used to process chunks concurrently.
+            journal (str, optional): Path of a job journal; see `paraphrase()`.
+            
+        Yields:
+            ChunkResult: `(index, chunk, output, seconds)`; output is None if the chunk failed.
+        """
+        yield from self._iter_journaled(text, "humanize", mode, parallel_tabs, journal)
@@ -0,0 +1,123 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+
+class ChunkCache:
+    """
+    On-disk cache of chunk results, keyed by a hash of the chunk text, tool and mode.
+
+    Backed by SQLite so it survives restarts and can be shared by several processes.
+    Supports a maximum entry count with least-recently-used eviction and an optional TTL.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: Optional[int] = 10000,
+        ttl: Optional[float] = None
+    ):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path (str): Path to the SQLite file. Parent directories are created.
+            max_entries (int, optional): Evict least recently used entries beyond this count.
+            ttl (float, optional): Seconds after which an entry is treated as missing.
+        """
+        self.path = os.path.expanduser(path)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS chunks (
+                key TEXT PRIMARY KEY,
+                output TEXT NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS chunks_accessed ON chunks (accessed)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(tool: str, mode: str, chunk: str) -> str:
+        """Returns the cache key for a chunk processed with `tool` in `mode`."""
+        h = hashlib.sha256()
+        for part in (tool, mode, chunk):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def get(self, tool: str, mode: str, chunk: str) -> Optional[str]:
+        """
+        Looks up a cached result.
+
+        Returns:
+            str: The cached output, or None on a miss or an expired entry.
+        """
+        key = self.make_key(tool, mode, chunk)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT output, created FROM chunks WHERE key = ?", (key,)).fetchone()
+            if row and self.ttl is not None and now - row[1] > self.ttl:
+                self._conn.execute("DELETE FROM chunks WHERE key = ?", (key,))
+                self._conn.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE chunks SET accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, tool: str, mode: str, chunk: str, output: str):
+        """Stores a result and evicts the least recently used entries if over `max_entries`."""
+        key = self.make_key(tool, mode, chunk)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO chunks (key, output, created, accessed) VALUES (?, ?, ?, ?)",
+                (key, output, now, now)
+            )
+            if self.max_entries is not None:
+                self._conn.execute(
+                    """
+                    DELETE FROM chunks WHERE key IN (
+                        SELECT key FROM chunks ORDER BY accessed DESC LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (self.max_entries,)
+                )
+            self._conn.commit()
+
+    def clear(self):
+        """Removes every entry and resets the counters."""
+        with self._lock:
+            self._conn.execute("DELETE FROM chunks")
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Returns hit/miss counters for this process and the current entry count."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+            return {"hits": self.hits, "misses": self.misses, "entries": entries}
+
+    def close(self):
+        """Closes the database connection."""
+        with self._lock:
+            self._conn.close()
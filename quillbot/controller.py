@@ -0,0 +1,221 @@
+import math
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from .metrics import BotMetrics
+
+
+class ConcurrencyController:
+    """
+    Shared limit on in-flight chunks and requests per minute, adapted to how QuillBot copes.
+
+    Every chunk attempt takes a slot with `acquire()` (or `try_acquire()`) and gives it
+    back with `release(success, seconds)`. The number of slots follows AIMD: it grows by
+    one after a full round of successful chunks and is multiplied by `decrease_factor`
+    after a failure or a chunk slower than `latency_target`, at most once per `cooldown`.
+    Independently, chunks are started at least `60 / rpm` seconds apart.
+
+    One instance can be shared by every session of a QuillbotPool, QuillbotService,
+    AsyncQuillbot or parallel-tab run (pass it as `controller=`). `paraphrase_many` and
+    `humanize_many` share it between worker processes through a manager.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        min_concurrency: int = 1,
+        initial: Optional[int] = None,
+        rpm: Optional[float] = None,
+        latency_target: Optional[float] = None,
+        decrease_factor: float = 0.5,
+        cooldown: float = 10.0,
+        window: int = 50
+    ):
+        """
+        Args:
+            max_concurrency (int): Upper bound on in-flight chunks.
+            min_concurrency (int): Lower bound; the limit never drops below it.
+            initial (int, optional): Starting limit. Defaults to `min_concurrency`.
+            rpm (float, optional): Ceiling on chunks started per minute, across all users.
+            latency_target (float, optional): Chunks slower than this (seconds) count as a
+                congestion signal, like failures.
+            decrease_factor (float): Multiplier applied to the limit on congestion.
+            cooldown (float): Minimum seconds between two decreases, so a burst of failures
+                from chunks that were already in flight only counts once.
+            window (int): Number of recent results the reported error rate is computed over.
+        """
+        if min_concurrency < 1 or max_concurrency < min_concurrency:
+            raise ValueError("Need 1 <= min_concurrency <= max_concurrency")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.rpm = rpm
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self._cond = threading.Condition()
+        self._limit = min(max(initial or min_concurrency, min_concurrency), max_concurrency)
+        # Successes since the limit last changed; a full round (one per slot) adds a slot.
+        self._round = 0
+        self._in_flight = 0
+        self._next_start = 0.0
+        self._last_decrease = -math.inf
+        self._results: Deque[bool] = deque(maxlen=window)
+        self._starts: Deque[float] = deque()
+        self._latency: Optional[float] = None
+        self._counts = {"successes": 0, "failures": 0, "increases": 0, "decreases": 0}
+        self._waited = 0.0
+        self._metrics: List["BotMetrics"] = []
+
+    @property
+    def limit(self) -> int:
+        """Current number of chunks allowed in flight."""
+        return self._limit
+
+    def attach(self, metrics: "BotMetrics"):
+        """Adds the controller's gauges to `metrics.to_prometheus()` and its limit changes to the events."""
+        if any(m is metrics for m in self._metrics):
+            return
+        self._metrics.append(metrics)
+        metrics.add_collector(self.to_prometheus)
+
+    def _start_delay(self, now: float) -> float:
+        """Seconds until a slot may be taken, or 0 if one is free now. Caller holds the lock."""
+        if self._in_flight >= self._limit:
+            return math.inf
+        return max(0.0, self._next_start - now) if self.rpm else 0.0
+
+    def _take(self, now: float):
+        self._in_flight += 1
+        if self.rpm:
+            self._next_start = max(self._next_start, now) + 60.0 / self.rpm
+        self._starts.append(now)
+        while self._starts and now - self._starts[0] > 60.0:
+            self._starts.popleft()
+
+    def try_acquire(self) -> bool:
+        """Takes a slot if one is free right now, without waiting."""
+        with self._cond:
+            now = time.monotonic()
+            if self._start_delay(now) > 0:
+                return False
+            self._take(now)
+            return True
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits for a free slot and takes it.
+
+        Args:
+            timeout (float, optional): Give up after this many seconds.
+
+        Returns:
+            bool: True if a slot was taken; every True must be matched by a `release()`.
+        """
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                delay = self._start_delay(now)
+                if delay <= 0:
+                    self._take(now)
+                    self._waited += now - started
+                    return True
+                if deadline is not None:
+                    if now >= deadline:
+                        self._waited += now - started
+                        return False
+                    delay = min(delay, deadline - now)
+                self._cond.wait(None if math.isinf(delay) else delay)
+
+    def release(self, success: bool, seconds: float):
+        """
+        Gives a slot back and adapts the limit.
+
+        Args:
+            success (bool): Whether the chunk produced output.
+            seconds (float): How long the chunk took.
+        """
+        change = None
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._results.append(success)
+            self._counts["successes" if success else "failures"] += 1
+            if success:
+                self._latency = seconds if self._latency is None else 0.8 * self._latency + 0.2 * seconds
+            slow = success and self.latency_target is not None and seconds > self.latency_target
+            now = time.monotonic()
+            if not success or slow:
+                if now - self._last_decrease >= self.cooldown and self._limit > self.min_concurrency:
+                    self._limit = max(self.min_concurrency, math.floor(self._limit * self.decrease_factor))
+                    self._last_decrease = now
+                    self._round = 0
+                    self._counts["decreases"] += 1
+                    change = "failure" if not success else "latency"
+            elif self._limit < self.max_concurrency:
+                self._round += 1
+                if self._round >= self._limit:
+                    self._limit += 1
+                    self._round = 0
+                    self._counts["increases"] += 1
+                    change = "increase"
+            limit = self._limit
+            self._cond.notify_all()
+        if change:
+            for metrics in self._metrics:
+                metrics._emit({"event": "concurrency", "limit": limit, "reason": change})
+
+    def cancel(self):
+        """Gives a slot back without a result, e.g. when a run is abandoned mid-chunk."""
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._cond.notify_all()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns the current state.
+
+        Returns:
+            dict: `limit`, `in_flight`, `rpm_limit`, `started_last_minute`, `latency_ewma`,
+            `error_rate` (over the last `window` results), `waited_seconds` and the
+            `successes`, `failures`, `increases` and `decreases` counters.
+        """
+        with self._cond:
+            now = time.monotonic()
+            return {
+                "limit": self._limit,
+                "in_flight": self._in_flight,
+                "rpm_limit": self.rpm,
+                "started_last_minute": sum(1 for t in self._starts if now - t <= 60.0),
+                "latency_ewma": round(self._latency, 4) if self._latency is not None else None,
+                "error_rate": round(self._results.count(False) / len(self._results), 4) if self._results else 0.0,
+                "waited_seconds": round(self._waited, 4),
+                **self._counts,
+            }
+
+    def to_prometheus(self, prefix: str = "quillbot") -> str:
+        """Renders the state in the Prometheus text exposition format."""
+        state = self.snapshot()
+        lines = [
+            f"# TYPE {prefix}_concurrency_limit gauge",
+            f"{prefix}_concurrency_limit {state['limit']}",
+            f"# TYPE {prefix}_concurrency_in_flight gauge",
+            f"{prefix}_concurrency_in_flight {state['in_flight']}",
+            f"# TYPE {prefix}_chunk_latency_ewma_seconds gauge",
+            f"{prefix}_chunk_latency_ewma_seconds {state['latency_ewma'] or 0.0}",
+            f"# TYPE {prefix}_chunk_error_rate gauge",
+            f"{prefix}_chunk_error_rate {state['error_rate']}",
+            f"# TYPE {prefix}_chunks_started_last_minute gauge",
+            f"{prefix}_chunks_started_last_minute {state['started_last_minute']}",
+            f"# TYPE {prefix}_concurrency_changes_total counter",
+            f'{prefix}_concurrency_changes_total{{direction="increase"}} {state["increases"]}',
+            f'{prefix}_concurrency_changes_total{{direction="decrease"}} {state["decreases"]}',
+            f"# TYPE {prefix}_concurrency_wait_seconds_total counter",
+            f"{prefix}_concurrency_wait_seconds_total {state['waited_seconds']}",
+        ]
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,143 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+from typing import Dict, Optional
+
+DEFAULT_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "quillbot", "chromedriver.json")
+
+_VERSION_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)\.(\d+)")
+
+# Cache key for a driver installed while the Chrome version could not be detected.
+UNKNOWN_VERSION = "unknown"
+
+# Drivers already resolved in this process, by cache file, so further sessions skip both
+# the `chrome --version` subprocess and the cache file.
+_resolved: Dict[str, str] = {}
+_resolve_lock = threading.Lock()
+
+_CHROME_BINARIES = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+
+
+def detect_chrome_version() -> Optional[str]:
+    """
+    Returns the installed Chrome version (e.g. "120.0.6099.109") without any network access.
+
+    Checks `CHROME_BINARY`, the usual binaries on Linux/macOS and the registry on Windows.
+    """
+    if sys.platform.startswith("win"):
+        for key in (
+            r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon",
+            r"HKEY_LOCAL_MACHINE\Software\Google\Chrome\BLBeacon",
+        ):
+            try:
+                out = subprocess.run(
+                    ["reg", "query", key, "/v", "version"],
+                    capture_output=True, text=True, timeout=5
+                ).stdout
+            except Exception:
+                continue
+            match = _VERSION_RE.search(out)
+            if match:
+                return match.group(0)
+        return None
+
+    binaries = [os.getenv("CHROME_BINARY")] + _CHROME_BINARIES
+    for binary in binaries:
+        if not binary:
+            continue
+        path = binary if os.path.isabs(binary) else shutil.which(binary)
+        if not path or not os.path.exists(path):
+            continue
+        try:
+            out = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=5).stdout
+        except Exception:
+            continue
+        match = _VERSION_RE.search(out)
+        if match:
+            return match.group(0)
+    return None
+
+
+def _load_cache(cache_file: str) -> Dict[str, str]:
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def _save_cache(cache_file: str, data: Dict[str, str]):
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        tmp = cache_file + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp, cache_file)
+    except Exception as e:
+        print(f"Error saving driver cache: {e}")
+
+
+def resolve_driver_path(driver_path: Optional[str] = None, cache_file: str = DEFAULT_CACHE_FILE) -> Optional[str]:
+    """
+    Finds a chromedriver binary, downloading one only when nothing suitable is cached.
+
+    Resolution order:
+        1. `driver_path`, or the `CHROMEDRIVER_PATH` environment variable.
+        2. The driver already resolved in this process.
+        3. The cached driver for the installed Chrome version (or for UNKNOWN_VERSION if
+           the version cannot be detected).
+        4. `ChromeDriverManager().install()`; the result is cached under the same key.
+        5. A cached driver for the same Chrome major version (e.g. when offline).
+
+    Returns:
+        str: Path to chromedriver, or None to let Selenium Manager resolve it.
+    """
+    explicit = driver_path or os.getenv("CHROMEDRIVER_PATH")
+    if explicit:
+        return explicit
+
+    with _resolve_lock:
+        path = _resolved.get(cache_file)
+        if path and os.path.exists(path):
+            return path
+        path = _resolve_uncached(cache_file)
+        if path:
+            _resolved[cache_file] = path
+        return path
+
+
+def _resolve_uncached(cache_file: str) -> Optional[str]:
+    version = detect_chrome_version()
+    key = version or UNKNOWN_VERSION
+    cache = _load_cache(cache_file)
+    if os.path.exists(cache.get(key, "")):
+        return cache[key]
+
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        path = ChromeDriverManager().install()
+        cache[key] = path
+        _save_cache(cache_file, cache)
+        return path
+    except Exception as e:
+        print(f"Could not install chromedriver ({e})")
+
+    if version:
+        major = version.split(".")[0]
+        for cached_version, path in cache.items():
+            if cached_version.split(".")[0] == major and os.path.exists(path):
+                print(f"Using cached chromedriver for Chrome {cached_version}")
+                return path
+    return None
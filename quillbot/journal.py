@@ -0,0 +1,148 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+def chunk_hash(chunk: str) -> str:
+    """Short, stable hash of a chunk's text."""
+    return hashlib.sha256(chunk.encode("utf-8")).hexdigest()[:32]
+
+
+@dataclass
+class ChunkFailure:
+    """A chunk that produced no output after all attempts."""
+
+    index: int
+    chunk: str
+    attempts: int
+    error: str = "No output received"
+
+
+@dataclass
+class ProcessReport:
+    """Outcome of one `paraphrase()` / `humanize()` call."""
+
+    total: int = 0
+    failures: List[ChunkFailure] = field(default_factory=list)
+    resumed: int = 0
+    journal: Optional[str] = None
+
+    @property
+    def complete(self) -> bool:
+        return not self.failures
+
+    def summary(self) -> str:
+        if self.complete:
+            return f"All {self.total} chunks done ({self.resumed} resumed from journal)"
+        failed = ", ".join(str(f.index + 1) for f in self.failures)
+        text = f"{len(self.failures)} of {self.total} chunks failed: {failed}"
+        if self.journal:
+            text += f" (rerun with journal {self.journal} to retry only these)"
+        return text
+
+
+class IncompleteOutputError(RuntimeError):
+    """Raised in strict mode when some chunks failed; carries the partial output and report."""
+
+    def __init__(self, report: ProcessReport, partial: str):
+        super().__init__(report.summary())
+        self.report = report
+        self.partial = partial
+
+
+class JobJournal:
+    """
+    Append-only record of one job's chunks, so an interrupted job can be resumed.
+
+    Every finished chunk is written as one JSON line with the hash of its input and its
+    output (or the error), and flushed to disk straight away. Reopening the same path
+    loads the completed chunks; they are served from the journal instead of the browser,
+    so a rerun only does the chunks that are missing or failed.
+    """
+
+    def __init__(self, path: str, tool: str, mode: str = ""):
+        """
+        Open (or create) the journal.
+
+        Args:
+            path (str): Path to the JSON-lines file. Parent directories are created.
+            tool (str): "paraphrase" or "humanize".
+            mode (str): Humanizer mode ("" for paraphrase).
+
+        Raises:
+            ValueError: If the journal belongs to a different tool or mode.
+        """
+        self.path = os.path.expanduser(path)
+        self.tool = tool
+        self.mode = mode
+        self.outputs: Dict[str, str] = {}
+        self.failed: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        header = None
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A line cut short by a crash; everything before it is intact.
+                        continue
+                    if entry.get("type") == "job":
+                        header = entry
+                    elif entry.get("output"):
+                        self.outputs[entry["hash"]] = entry["output"]
+                        self.failed.pop(entry["hash"], None)
+                    elif entry.get("hash") not in self.outputs:
+                        self.failed[entry["hash"]] = entry
+        if header and (header.get("tool"), header.get("mode", "")) != (tool, mode):
+            raise ValueError(
+                f"Journal {self.path} is for {header.get('tool')} ({header.get('mode') or 'no mode'}), "
+                f"not {tool} ({mode or 'no mode'})"
+            )
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        if header is None:
+            self._write({"type": "job", "tool": tool, "mode": mode, "created": time.time()})
+
+    def _write(self, entry: Dict[str, Any]):
+        with self._lock:
+            self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def get(self, chunk: str) -> Optional[str]:
+        """Returns the recorded output for a chunk, or None if it is not done yet."""
+        return self.outputs.get(chunk_hash(chunk))
+
+    def record(self, index: int, chunk: str, output: Optional[str], attempts: int = 1, error: Optional[str] = None):
+        """
+        Records a finished chunk.
+
+        Args:
+            index (int): Position of the chunk in the job.
+            chunk (str): Input text.
+            output (str, optional): Result, or None if the chunk failed.
+            attempts (int): How many times the chunk was tried.
+            error (str, optional): Why it failed.
+        """
+        h = chunk_hash(chunk)
+        entry: Dict[str, Any] = {"type": "chunk", "index": index, "hash": h, "attempts": attempts}
+        if output:
+            entry["output"] = output
+            self.outputs[h] = output
+            self.failed.pop(h, None)
+        else:
+            entry["error"] = error or "No output received"
+            self.failed[h] = entry
+        entry["time"] = time.time()
+        self._write(entry)
+
+    def close(self):
+        with self._lock:
+            self._file.close()
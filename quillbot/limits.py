@@ -0,0 +1,142 @@
+import json
+import os
+import time
+from typing import Any, Dict, Optional, Union
+
+# The free-tier input limit; used until a session's real limit is known.
+DEFAULT_WORD_LIMIT = 125
+# Suggested `word_limit` for plans without a maximum. It is never inferred from the page:
+# larger chunks are accepted, but they take longer to render and to retry.
+UNLIMITED_WORD_LIMIT = 1000
+DEFAULT_LIMITS_FILE = os.path.join(os.path.expanduser("~"), ".cache", "quillbot", "word_limits.json")
+# Detected limits are re-checked after this long, e.g. in case the plan changed.
+LIMIT_TTL = 24 * 3600
+
+WordLimit = Union[int, Dict[str, int]]
+
+# Reads the input editor's word counter: the first "12/125 Words" or "12 Words" element
+# after #paraphraser-input-box and before #paraphraser-output-box in document order, so
+# the output pane's counter and text typed into the editor are never mistaken for it.
+# Returns {limit: 125}, {unlimited: true} for a counter without a maximum, or null while
+# the counter is not rendered yet.
+WORD_LIMIT_JS = """
+var input = document.querySelector('#paraphraser-input-box');
+if (!input) return null;
+var output = document.querySelector('#paraphraser-output-box');
+var limited = /^\\s*[\\d,.]+\\s*\\/\\s*([\\d,.]+)\\s*words?\\s*$/i;
+var plain = /^\\s*[\\d,.]+\\s*words?\\s*$/i;
+var nodes = document.querySelectorAll('body *');
+for (var i = 0; i < nodes.length; i++) {
+    var node = nodes[i];
+    if (!(input.compareDocumentPosition(node) & Node.DOCUMENT_POSITION_FOLLOWING)) continue;
+    if (input.contains(node)) continue;
+    if (output && (node === output || output.contains(node) || node.contains(output))) break;
+    if (output && (output.compareDocumentPosition(node) & Node.DOCUMENT_POSITION_FOLLOWING)) break;
+    var text = node.textContent || '';
+    if (text.length > 40) continue;
+    var match = limited.exec(text);
+    if (match) return {limit: parseInt(match[1].replace(/[,.]/g, ''), 10)};
+    if (plain.test(text)) return {unlimited: true};
+}
+return null;
+"""
+
+
+def limit_key(tool: str, mode: str = "Basic") -> str:
+    """Key of a tool and mode in limit tables, e.g. "paraphrase" or "humanize:Advanced"."""
+    return tool if tool == "paraphrase" else f"{tool}:{mode}"
+
+
+def profile_key(
+    user_data_dir: Optional[str],
+    profile_directory: str = "Default",
+    base_url: str = "https://quillbot.com"
+) -> str:
+    """
+    Identifies the account a session runs as on a site. Sessions without a profile share
+    "anonymous"; other sites (e.g. a local mock) get their own entries.
+    """
+    profile = "anonymous"
+    if user_data_dir:
+        profile = f"{os.path.abspath(os.path.expanduser(user_data_dir))}|{profile_directory}"
+    return f"{base_url.rstrip('/')}|{profile}"
+
+
+def configured_limit(word_limit: Optional[WordLimit], tool: str, mode: str = "Basic") -> Optional[int]:
+    """
+    Looks up a configured limit.
+
+    Args:
+        word_limit (int or dict, optional): One limit for everything, or a dict keyed by
+            `limit_key()` ("humanize:Advanced") or by tool name ("humanize").
+    """
+    if word_limit is None:
+        return None
+    if isinstance(word_limit, int):
+        return word_limit
+    value = word_limit.get(limit_key(tool, mode), word_limit.get(tool))
+    return int(value) if value else None
+
+
+class WordLimitCache:
+    """
+    Detected word limits per profile, tool and mode, stored as JSON so that new sessions
+    and other processes (e.g. batch workers) can size their chunks without detecting again.
+    """
+
+    def __init__(self, path: str = DEFAULT_LIMITS_FILE, ttl: float = LIMIT_TTL):
+        self.path = path
+        self.ttl = ttl
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception:
+            return {}
+
+    def get(self, profile: str, tool: str, mode: str = "Basic") -> Optional[int]:
+        """Returns the cached limit, or None if unknown or older than `ttl`."""
+        entry = self._load().get(profile, {}).get(limit_key(tool, mode))
+        if not entry or time.time() - entry.get("detected", 0) > self.ttl:
+            return None
+        return entry.get("limit")
+
+    def put(self, profile: str, tool: str, mode: str, limit: int):
+        data = self._load()
+        data.setdefault(profile, {})[limit_key(tool, mode)] = {"limit": limit, "detected": time.time()}
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp, self.path)
+        except Exception as e:
+            print(f"Error saving word limit cache: {e}")
+
+
+def resolve_word_limit(
+    tool: str,
+    mode: str = "Basic",
+    word_limit: Optional[WordLimit] = None,
+    user_data_dir: Optional[str] = None,
+    profile_directory: str = "Default",
+    word_limit_cache: Optional[str] = DEFAULT_LIMITS_FILE,
+    base_url: str = "https://quillbot.com"
+) -> int:
+    """
+    Chunk size for a session without asking the browser: the configured limit, else the
+    cached limit for the profile, else DEFAULT_WORD_LIMIT. Takes the same arguments as
+    Quillbot, so it can be called with a bot's kwargs.
+    """
+    limit = configured_limit(word_limit, tool, mode)
+    if limit is None and word_limit_cache:
+        limit = WordLimitCache(word_limit_cache).get(profile_key(user_data_dir, profile_directory, base_url), tool, mode)
+    return limit or DEFAULT_WORD_LIMIT
+
+
+def word_limit_from_kwargs(tool: str, mode: str, bot_kwargs: Dict[str, Any]) -> int:
+    """`resolve_word_limit()` for the keyword arguments a Quillbot is (or will be) created with."""
+    names = ("word_limit", "user_data_dir", "profile_directory", "word_limit_cache", "base_url")
+    return resolve_word_limit(tool, mode, **{name: bot_kwargs[name] for name in names if name in bot_kwargs})
@@ -0,0 +1,181 @@
+import re
+from typing import List, Optional, Tuple, Union
+
+from .text import split_text
+
+_FENCE_RE = re.compile(r"^\s{0,3}(`{3,}|~{3,})")
+_HEADING_RE = re.compile(r"^\s{0,3}#{1,6}(\s|$)")
+_RULE_RE = re.compile(r"^\s{0,3}([-*_])(\s*\1){2,}\s*$")
+_LIST_ITEM_RE = re.compile(r"^(\s*(?:[*+-]|\d+[.)])\s+)(.*)$")
+_QUOTE_RE = re.compile(r"^(\s*>\s?)(.*)$")
+# A bold label at the start of a list item, e.g. "**Cost savings:**" or "**Speed**: ".
+_LABEL_RE = re.compile(r"^(\*\*[^*]+\*\*\s*:?\s*|__[^_]+__\s*:?\s*)")
+_WORD_RE = re.compile(r"\b[\w']+\b")
+_LINE_BREAK_RE = re.compile(r"\s*\n\s*")
+
+
+def _is_block_start(line: str) -> bool:
+    return bool(
+        not line.strip()
+        or _FENCE_RE.match(line)
+        or _HEADING_RE.match(line)
+        or _RULE_RE.match(line)
+        or _LIST_ITEM_RE.match(line)
+        or _QUOTE_RE.match(line)
+        or line.lstrip().startswith(("|", "<"))
+    )
+
+
+class MarkdownDocument:
+    """
+    A markdown document split into literal markup and prose spans.
+
+    Only the prose spans (paragraphs, list item bodies, quote bodies) need rewriting;
+    headings, code blocks, tables, bullets and bold labels are kept verbatim.
+    """
+
+    def __init__(self, text: str):
+        self.parts: List[Union[str, int]] = []
+        self.spans: List[str] = []
+        self._parse(text)
+
+    def _literal(self, text: str):
+        if not text:
+            return
+        if self.parts and isinstance(self.parts[-1], str):
+            self.parts[-1] += text
+        else:
+            self.parts.append(text)
+
+    def _prose(self, prefix: str, body: str, newline: str):
+        """Adds `prefix` verbatim and `body` as a prose span if it has any words."""
+        self._literal(prefix)
+        stripped = body.strip()
+        if _WORD_RE.search(stripped):
+            lead = body[:len(body) - len(body.lstrip())]
+            trail = body[len(body.rstrip()):]
+            self._literal(lead)
+            self.parts.append(len(self.spans))
+            # Soft line breaks inside a paragraph are just spaces in markdown.
+            self.spans.append(_LINE_BREAK_RE.sub(" ", stripped))
+            self._literal(trail)
+        else:
+            self._literal(body)
+        self._literal(newline)
+
+    def _parse(self, text: str):
+        lines = text.splitlines(keepends=True)
+        i = 0
+        while i < len(lines):
+            raw = lines[i]
+            line = raw.rstrip("\r\n")
+            newline = raw[len(line):]
+
+            fence = _FENCE_RE.match(line)
+            if fence:
+                # Copy the fenced block through to its closing fence.
+                marker = fence.group(1)[0] * 3
+                self._literal(raw)
+                i += 1
+                while i < len(lines):
+                    self._literal(lines[i])
+                    i += 1
+                    if lines[i - 1].strip().startswith(marker):
+                        break
+                continue
+
+            if (
+                not line.strip()
+                or _HEADING_RE.match(line)
+                or _RULE_RE.match(line)
+                or line.lstrip().startswith(("|", "<"))
+            ):
+                self._literal(raw)
+                i += 1
+                continue
+
+            item = _LIST_ITEM_RE.match(line)
+            if item:
+                prefix, body = item.group(1), item.group(2)
+                label = _LABEL_RE.match(body)
+                if label:
+                    prefix += label.group(1)
+                    body = body[label.end():]
+                self._prose(prefix, body, newline)
+                i += 1
+                continue
+
+            quote = _QUOTE_RE.match(line)
+            if quote:
+                self._prose(quote.group(1), quote.group(2), newline)
+                i += 1
+                continue
+
+            # Plain paragraph: gather lines until the next block starts.
+            start = i
+            i += 1
+            while i < len(lines) and not _is_block_start(lines[i].rstrip("\r\n")):
+                i += 1
+            paragraph = "".join(lines[start:i])
+            body = paragraph.rstrip("\r\n")
+            self._prose("", body, paragraph[len(body):])
+
+    def render(self, outputs: List[Optional[str]]) -> str:
+        """
+        Rebuilds the document, replacing each prose span with its output.
+
+        Spans whose output is None or empty keep their original text.
+        """
+        result = []
+        for part in self.parts:
+            if isinstance(part, str):
+                result.append(part)
+            else:
+                result.append(outputs[part] or self.spans[part])
+        return "".join(result)
+
+
+def pack_spans(spans: List[str], limit: int = 125) -> List[List[Tuple[int, str]]]:
+    """
+    Groups prose spans into chunks of at most `limit` words.
+
+    Spans longer than the limit are first split with `split_text`. Each group is a list of
+    (span_index, piece) pairs; pieces of one group are sent together, one paragraph each.
+    """
+    groups: List[List[Tuple[int, str]]] = []
+    current: List[Tuple[int, str]] = []
+    words = 0
+    for index, span in enumerate(spans):
+        for piece in split_text(span, limit):
+            count = len(_WORD_RE.findall(piece))
+            if current and words + count > limit:
+                groups.append(current)
+                current, words = [], 0
+            current.append((index, piece))
+            words += count
+    if current:
+        groups.append(current)
+    return groups
+
+
+def join_group(group: List[Tuple[int, str]]) -> str:
+    """Returns the text sent to QuillBot for one group."""
+    return "\n\n".join(piece for _, piece in group)
+
+
+def split_group_output(group: List[Tuple[int, str]], output: Optional[str]) -> Optional[List[str]]:
+    """
+    Splits a group's output back into one string per piece, relying on QuillBot keeping
+    one output paragraph per input paragraph.
+
+    Returns:
+        List[str]: One output per piece, or None if the paragraph count does not match.
+    """
+    if not output:
+        return None
+    if len(group) == 1:
+        return [output.strip()]
+    paragraphs = [p.strip() for p in output.strip().split("\n") if p.strip()]
+    if len(paragraphs) != len(group):
+        return None
+    return paragraphs
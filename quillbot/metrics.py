@@ -0,0 +1,270 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+# Phases timed for every page load and chunk.
+PAGE_PHASES = ("navigate", "select_mode")
+CHUNK_PHASES = ("clear", "input", "click", "wait_output", "extract")
+PHASES = PAGE_PHASES + CHUNK_PHASES
+
+# Histogram bucket upper bounds, in seconds.
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+Hook = Callable[[Dict[str, Any]], None]
+
+
+class _Histogram:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+
+class PhaseTimer:
+    """
+    Collects the phase timings of one page load or chunk.
+
+    Created by `BotMetrics.start_page()` / `BotMetrics.start_chunk()`; `finish()` emits the event.
+    """
+
+    def __init__(self, metrics: "BotMetrics", event: str, fields: Dict[str, Any]):
+        self.metrics = metrics
+        self.event = event
+        self.fields = fields
+        self.started = time.monotonic()
+        self.phases: Dict[str, float] = {}
+        self.finished = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Times the enclosed block as phase `name`."""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(name, time.monotonic() - started)
+
+    def record(self, name: str, seconds: float):
+        """Adds `seconds` to phase `name` (a phase may run more than once, e.g. after a fallback)."""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+        self.metrics.observe(name, seconds)
+
+    def finish(self, success: bool = True):
+        """Emits the event. Later calls are ignored."""
+        if self.finished:
+            return
+        self.finished = True
+        self.metrics._finish(self, success)
+
+
+class BotMetrics:
+    """
+    Thread-safe timing and counter store for one or more Quillbot sessions.
+
+    Records a histogram per phase (see PHASES), WebDriver commands by name, retries and
+    fallbacks by kind, and chunk outcomes. Every page load and chunk also produces an
+    event dict that is passed to each hook and, if `json_log` is set, written as one JSON
+    line. `to_prometheus()` renders everything in the Prometheus text format.
+
+    Share one instance between sessions (e.g. through QuillbotPool's bot kwargs) to get
+    totals across them.
+    """
+
+    def __init__(
+        self,
+        hooks: Optional[List[Hook]] = None,
+        json_log: Optional[Union[str, IO[str]]] = None,
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ):
+        """
+        Args:
+            hooks (List[callable], optional): Called with every event dict.
+            json_log (str or file, optional): Path or open text stream for JSON-lines events.
+            buckets (tuple): Histogram bucket upper bounds in seconds.
+        """
+        self.hooks: List[Hook] = list(hooks or [])
+        self.collectors: List[Callable[[str], str]] = []
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._owns_log = isinstance(json_log, str)
+        # Kept so the log can be reopened elsewhere, e.g. by batch worker processes.
+        self.json_log_path: Optional[str] = json_log if isinstance(json_log, str) else None
+        self._log: Optional[IO[str]] = open(json_log, "a", encoding="utf-8") if isinstance(json_log, str) else json_log
+        self.reset()
+
+    def reset(self):
+        """Clears all recorded values."""
+        with self._lock:
+            self._phases: Dict[str, _Histogram] = {}
+            self._commands: Dict[str, int] = {}
+            self._retries: Dict[str, int] = {}
+            self._chunks = {"ok": 0, "failed": 0}
+            self._pages = {"loaded": 0, "reused": 0}
+            self._restarts: Dict[str, int] = {}
+            self._chunk_seconds = _Histogram(self.buckets)
+
+    def add_hook(self, hook: Hook):
+        """Registers a callable that receives every event dict."""
+        self.hooks.append(hook)
+
+    def add_collector(self, collector: Callable[[str], str]):
+        """Registers a callable that returns extra Prometheus text for a metric prefix."""
+        self.collectors.append(collector)
+
+    def observe(self, phase: str, seconds: float):
+        """Records one duration for `phase`."""
+        with self._lock:
+            hist = self._phases.get(phase)
+            if hist is None:
+                hist = self._phases[phase] = _Histogram(self.buckets)
+            hist.observe(seconds)
+
+    def count_command(self, command: str):
+        """Counts one WebDriver command."""
+        with self._lock:
+            self._commands[command] = self._commands.get(command, 0) + 1
+
+    def count_retry(self, kind: str):
+        """Counts one retry or fallback, e.g. "input_fallback" or "output_timeout"."""
+        with self._lock:
+            self._retries[kind] = self._retries.get(kind, 0) + 1
+        self._emit({"event": "retry", "kind": kind})
+
+    def count_page(self, reused: bool):
+        """Counts one tool page request, either served by a load or by reusing the open page."""
+        with self._lock:
+            self._pages["reused" if reused else "loaded"] += 1
+
+    def count_restart(self, reason: str):
+        """Counts one browser restart, e.g. "chunks", "rss", "heap" or "failures"."""
+        with self._lock:
+            self._restarts[reason] = self._restarts.get(reason, 0) + 1
+        self._emit({"event": "restart", "reason": reason})
+
+    def instrument(self, driver):
+        """Wraps `driver.execute` so every WebDriver command is counted by name."""
+        execute = driver.execute
+
+        def counting_execute(command, params=None):
+            self.count_command(command)
+            return execute(command, params)
+
+        driver.execute = counting_execute
+
+    def start_page(self, tool: str, mode: str = "") -> PhaseTimer:
+        """Starts timing the load of a tool page (`navigate`, `select_mode`)."""
+        return PhaseTimer(self, "page", {"tool": tool, "mode": mode})
+
+    def start_chunk(self, tool: str, index: int) -> PhaseTimer:
+        """Starts timing one chunk (`clear`, `input`, `click`, `wait_output`, `extract`)."""
+        return PhaseTimer(self, "chunk", {"tool": tool, "index": index})
+
+    def _finish(self, timer: PhaseTimer, success: bool):
+        seconds = time.monotonic() - timer.started
+        if timer.event == "chunk":
+            with self._lock:
+                self._chunks["ok" if success else "failed"] += 1
+                self._chunk_seconds.observe(seconds)
+        self._emit({
+            "event": timer.event,
+            **timer.fields,
+            "success": success,
+            "seconds": round(seconds, 4),
+            "phases": {k: round(v, 4) for k, v in timer.phases.items()},
+        })
+
+    def _emit(self, event: Dict[str, Any]):
+        event["ts"] = round(time.time(), 3)
+        for hook in list(self.hooks):
+            try:
+                hook(event)
+            except Exception as e:
+                print(f"Error in metrics hook: {e}")
+        if self._log:
+            line = json.dumps(event)
+            with self._lock:
+                try:
+                    self._log.write(line + "\n")
+                    self._log.flush()
+                except Exception as e:
+                    print(f"Error writing metrics log: {e}")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns the current totals.
+
+        Returns:
+            dict: `phases` ({phase: {count, sum, mean}}), `commands`, `retries`, `chunks`,
+            `pages` ({loaded, reused}; "reused" is the number of reloads avoided), `restarts`.
+        """
+        with self._lock:
+            return {
+                "phases": {
+                    name: {
+                        "count": h.count,
+                        "sum": round(h.sum, 4),
+                        "mean": round(h.sum / h.count, 4) if h.count else 0.0,
+                    }
+                    for name, h in self._phases.items()
+                },
+                "commands": dict(self._commands),
+                "retries": dict(self._retries),
+                "chunks": dict(self._chunks),
+                "pages": dict(self._pages),
+                "restarts": dict(self._restarts),
+            }
+
+    def to_prometheus(self, prefix: str = "quillbot") -> str:
+        """Renders all metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+
+        def histogram(name: str, hist: _Histogram, labels: str = ""):
+            sep = "," if labels else ""
+            for bound, count in zip(hist.buckets, hist.counts):
+                lines.append(f'{name}_bucket{{{labels}{sep}le="{bound}"}} {count}')
+            lines.append(f'{name}_bucket{{{labels}{sep}le="+Inf"}} {hist.count}')
+            suffix = f"{{{labels}}}" if labels else ""
+            lines.append(f"{name}_sum{suffix} {hist.sum:.4f}")
+            lines.append(f"{name}_count{suffix} {hist.count}")
+
+        with self._lock:
+            lines.append(f"# TYPE {prefix}_phase_seconds histogram")
+            for name in sorted(self._phases, key=lambda p: (PHASES.index(p) if p in PHASES else len(PHASES), p)):
+                histogram(f"{prefix}_phase_seconds", self._phases[name], f'phase="{name}"')
+            lines.append(f"# TYPE {prefix}_bot_chunk_seconds histogram")
+            histogram(f"{prefix}_bot_chunk_seconds", self._chunk_seconds)
+            lines.append(f"# TYPE {prefix}_bot_chunks_total counter")
+            for status, count in self._chunks.items():
+                lines.append(f'{prefix}_bot_chunks_total{{status="{status}"}} {count}')
+            lines.append(f"# TYPE {prefix}_page_requests_total counter")
+            for result, count in self._pages.items():
+                lines.append(f'{prefix}_page_requests_total{{result="{result}"}} {count}')
+            lines.append(f"# TYPE {prefix}_browser_restarts_total counter")
+            for reason, count in sorted(self._restarts.items()):
+                lines.append(f'{prefix}_browser_restarts_total{{reason="{reason}"}} {count}')
+            lines.append(f"# TYPE {prefix}_webdriver_commands_total counter")
+            for command, count in sorted(self._commands.items()):
+                lines.append(f'{prefix}_webdriver_commands_total{{command="{command}"}} {count}')
+            lines.append(f"# TYPE {prefix}_retries_total counter")
+            for kind, count in sorted(self._retries.items()):
+                lines.append(f'{prefix}_retries_total{{kind="{kind}"}} {count}')
+        text = "\n".join(lines) + "\n"
+        for collector in list(self.collectors):
+            text += collector(prefix)
+        return text
+
+    def close(self):
+        """Closes the JSON log if it was opened from a path."""
+        if self._owns_log and self._log:
+            self._log.close()
+            self._log = None
@@ -0,0 +1,160 @@
+import base64
+import json
+import re
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+OUTPUT_CAPTURES = ("dom", "network")
+
+# Regexes matched against request URLs to find the API call behind each tool's button.
+NETWORK_RESPONSE_PATTERNS: Dict[str, List[str]] = {
+    "paraphrase": [r"/api/[^?]*paraphras"],
+    "humanize": [r"/api/[^?]*humani[sz]"],
+}
+
+# Keys searched, in order of preference, for the rewritten text in a JSON response.
+RESPONSE_TEXT_KEYS = ("text", "output", "result", "paraphrased", "humanized", "alt")
+
+ResponseExtractor = Callable[[Any], Optional[str]]
+
+
+def extract_response_text(payload: Any, keys: Sequence[str] = RESPONSE_TEXT_KEYS) -> Optional[str]:
+    """
+    Finds the output text in a decoded JSON response.
+
+    Looks for the first key of `keys` that holds a non-empty string, searching the whole
+    payload breadth-first for each key before trying the next one.
+
+    Returns:
+        str: The text, or None if no such key exists.
+    """
+    for key in keys:
+        queue = [payload]
+        while queue:
+            node = queue.pop(0)
+            if isinstance(node, dict):
+                value = node.get(key)
+                if isinstance(value, str) and value.strip():
+                    return value.strip()
+                queue.extend(v for v in node.values() if isinstance(v, (dict, list)))
+            elif isinstance(node, list):
+                queue.extend(v for v in node if isinstance(v, (dict, list)))
+    return None
+
+
+class ResponseWatcher:
+    """
+    Follows Chrome's performance log after a button click until the matching API response
+    has been received, then reads its body with Network.getResponseBody.
+
+    The browser must be started with performance logging (see `enable_performance_log`);
+    reading the log also clears it, so create the watcher right before clicking.
+    """
+
+    def __init__(
+        self,
+        driver,
+        patterns: Iterable[str],
+        extractor: ResponseExtractor = extract_response_text,
+        grace: float = 3.0
+    ):
+        """
+        Args:
+            driver: The WebDriver session.
+            patterns (Iterable[str]): Regexes for the request URL.
+            extractor (callable): Turns the decoded JSON body into the output text.
+            grace (float): Seconds to wait for a matching request before giving up on it.
+        """
+        self.driver = driver
+        self.patterns = [re.compile(p) for p in patterns]
+        self.extractor = extractor
+        self.grace = grace
+        self.started = time.monotonic()
+        self.request_id: Optional[str] = None
+        self.url: Optional[str] = None
+        self.status: Optional[int] = None
+        self.text: Optional[str] = None
+        self.error: Optional[str] = None
+        self.matched = False
+        # The request itself failed (HTTP error or network error), as opposed to the body
+        # not containing recognisable text.
+        self.failed = False
+        self.done = False
+        self.body_seconds = 0.0
+        # Discard everything logged before the click.
+        self._read_log()
+
+    def _read_log(self) -> List[Dict[str, Any]]:
+        events = []
+        for entry in self.driver.get_log("performance") or []:
+            try:
+                events.append(json.loads(entry["message"])["message"])
+            except (KeyError, TypeError, ValueError):
+                continue
+        return events
+
+    def _matches(self, request: Dict[str, Any]) -> bool:
+        if request.get("method") in ("GET", "OPTIONS", "HEAD"):
+            return False
+        url = request.get("url", "")
+        return any(p.search(url) for p in self.patterns)
+
+    def _read_body(self):
+        started = time.monotonic()
+        try:
+            result = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": self.request_id})
+            body = result.get("body", "")
+            if result.get("base64Encoded"):
+                body = base64.b64decode(body).decode("utf-8", "replace")
+            self.text = self.extractor(json.loads(body))
+            if not self.text:
+                self.error = "No text in response"
+        except Exception as e:
+            self.error = f"Could not read response: {e}"
+        self.body_seconds = time.monotonic() - started
+
+    def poll(self) -> bool:
+        """
+        Reads new log entries.
+
+        Returns:
+            bool: True once the response has completed or failed, or no matching request
+            appeared within `grace` seconds (`matched` is then False).
+        """
+        if self.done:
+            return True
+        for event in self._read_log():
+            method = event.get("method")
+            params = event.get("params", {})
+            if method == "Network.requestWillBeSent":
+                if self.request_id is None and self._matches(params.get("request", {})):
+                    self.request_id = params.get("requestId")
+                    self.url = params["request"].get("url")
+                    self.matched = True
+                continue
+            if self.request_id is None or params.get("requestId") != self.request_id:
+                continue
+            if method == "Network.responseReceived":
+                self.status = params.get("response", {}).get("status")
+            elif method == "Network.loadingFinished":
+                if self.status is not None and self.status >= 400:
+                    self.error = f"HTTP {self.status} from {self.url}"
+                    self.failed = True
+                else:
+                    self._read_body()
+                self.done = True
+                return True
+            elif method == "Network.loadingFailed":
+                self.error = f"Request failed: {params.get('errorText', 'unknown error')}"
+                self.failed = True
+                self.done = True
+                return True
+        if not self.matched and time.monotonic() - self.started > self.grace:
+            self.done = True
+        return self.done
+
+
+def enable_performance_log(options):
+    """Turns on Chrome's performance log with network events only, for ResponseWatcher."""
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
@@ -0,0 +1,191 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from .bot import Quillbot
+
+
+def _new_bot(bot_kwargs: Dict[str, Any]) -> "Quillbot":
+    from .bot import Quillbot
+
+    return Quillbot(**bot_kwargs)
+
+
+class QuillbotPool:
+    """
+    Keeps a set of warm Quillbot sessions so repeated requests reuse already-launched browsers.
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        max_size: Optional[int] = None,
+        factory: Optional[Callable[[], "Quillbot"]] = None,
+        **bot_kwargs: Any
+    ):
+        """
+        Initialize the pool and launch `size` browsers up front.
+
+        Args:
+            size (int): Number of sessions to start immediately and keep warm.
+            max_size (int, optional): Upper bound on sessions alive at once. Defaults to `size`.
+            factory (callable, optional): Zero-argument callable returning a new Quillbot.
+                When omitted, `Quillbot(**bot_kwargs)` is used.
+            **bot_kwargs: Keyword arguments forwarded to Quillbot (headless, user_data_dir, ...).
+        """
+        if size < 0:
+            raise ValueError("size must be >= 0")
+        self.max_size = max_size if max_size is not None else max(size, 1)
+        if self.max_size < max(size, 1):
+            raise ValueError("max_size must be >= size and >= 1")
+
+        self._factory = factory or (lambda: _new_bot(bot_kwargs))
+        self._idle: List["Quillbot"] = []
+        self._in_use: List["Quillbot"] = []
+        self._starting = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        try:
+            for _ in range(size):
+                self._idle.append(self._factory())
+        except BaseException:
+            # Don't leak the browsers that did start.
+            for bot in self._idle:
+                self._dispose(bot)
+            self._idle.clear()
+            raise
+
+    @property
+    def total(self) -> int:
+        """Number of sessions currently alive (idle, checked out, or starting)."""
+        with self._cond:
+            return len(self._idle) + len(self._in_use) + self._starting
+
+    def stats(self) -> Dict[str, int]:
+        """Returns a snapshot of the pool occupancy."""
+        with self._cond:
+            return {
+                "idle": len(self._idle),
+                "in_use": len(self._in_use),
+                "starting": self._starting,
+                "max_size": self.max_size,
+            }
+
+    def checkout(self, timeout: Optional[float] = None) -> "Quillbot":
+        """
+        Takes a healthy session out of the pool, starting a new one if there is room.
+
+        Args:
+            timeout (float, optional): Seconds to wait for a free session. Waits forever if None.
+
+        Returns:
+            Quillbot: A session reserved for the caller until `checkin()`.
+
+        Raises:
+            TimeoutError: If no session became available within `timeout`.
+            RuntimeError: If the pool has been closed.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("QuillbotPool is closed")
+                    if self._idle:
+                        bot = self._idle.pop()
+                        break
+                    if len(self._in_use) + self._starting < self.max_size:
+                        bot = None
+                        self._starting += 1
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("No Quillbot session available in pool")
+                    self._cond.wait(remaining)
+
+            if bot is None:
+                # Launch outside the lock; browser startup takes seconds.
+                try:
+                    bot = self._factory()
+                finally:
+                    with self._cond:
+                        self._starting -= 1
+                        self._cond.notify()
+            elif not bot.is_alive():
+                print("Discarding dead Quillbot session from pool")
+                self._dispose(bot)
+                with self._cond:
+                    self._cond.notify()
+                continue
+
+            with self._cond:
+                if self._closed:
+                    self._dispose(bot)
+                    raise RuntimeError("QuillbotPool is closed")
+                self._in_use.append(bot)
+            return bot
+
+    def checkin(self, bot: "Quillbot", discard: bool = False):
+        """
+        Returns a session to the pool.
+
+        Args:
+            bot (Quillbot): A session previously obtained from `checkout()`.
+            discard (bool): Close the session instead of keeping it warm (e.g. after an error).
+        """
+        with self._cond:
+            if bot in self._in_use:
+                self._in_use.remove(bot)
+            keep = not discard and not self._closed
+        if keep and bot.is_alive():
+            with self._cond:
+                if not self._closed:
+                    self._idle.append(bot)
+                    self._cond.notify()
+                    return
+        self._dispose(bot)
+        with self._cond:
+            self._cond.notify()
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None) -> Iterator["Quillbot"]:
+        """
+        Context manager wrapping checkout/checkin. The session is discarded if the block raises.
+
+        Args:
+            timeout (float, optional): Seconds to wait for a free session.
+        """
+        bot = self.checkout(timeout=timeout)
+        failed = False
+        try:
+            yield bot
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self.checkin(bot, discard=failed)
+
+    def close(self):
+        """Closes every idle session and marks the pool closed. Checked-out sessions close on checkin."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for bot in idle:
+            self._dispose(bot)
+
+    def _dispose(self, bot: "Quillbot"):
+        try:
+            bot.close()
+        except Exception as e:
+            print(f"Error closing pooled session: {e}")
+
+    def __enter__(self) -> "QuillbotPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
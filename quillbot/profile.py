@@ -0,0 +1,213 @@
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+from typing import Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_SNAPSHOT_ROOT = os.path.join(os.path.expanduser("~"), ".cache", "quillbot", "profiles")
+
+# Files and folders at the top of the User Data directory that Chrome needs to decrypt
+# cookies and recognise the profile.
+USER_DATA_FILES = ["Local State"]
+
+# Files and folders inside the profile directory that hold the logged-in session.
+PROFILE_FILES = [
+    "Cookies",
+    "Cookies-journal",
+    "Network/Cookies",
+    "Network/Cookies-journal",
+    "Login Data",
+    "Login Data-journal",
+    "Web Data",
+    "Web Data-journal",
+    "Preferences",
+    "Secure Preferences",
+    "Local Storage",
+    "Session Storage",
+]
+
+_FICLONE = 0x40049409
+
+
+def _clone_file(src: str, dst: str):
+    """
+    Copies a file as a copy-on-write clone where the filesystem supports it
+    (FICLONE on Linux btrfs/xfs, clonefile on APFS), otherwise as a regular copy.
+
+    Hardlinks are deliberately not used: Chrome rewrites its SQLite files in place,
+    which would leak changes from one instance into the snapshot and every other instance.
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            import fcntl
+
+            with open(src, "rb") as fs, open(dst, "wb") as fd:
+                fcntl.ioctl(fd.fileno(), _FICLONE, fs.fileno())
+            shutil.copystat(src, dst)
+            return
+        except Exception:
+            pass
+    elif sys.platform == "darwin":
+        try:
+            import ctypes
+
+            libc = ctypes.CDLL("libc.dylib", use_errno=True)
+            if os.path.exists(dst):
+                os.unlink(dst)
+            if libc.clonefile(src.encode(), dst.encode(), 0) == 0:
+                return
+        except Exception:
+            pass
+    shutil.copy2(src, dst)
+
+
+def _copy_tree(src: str, dst: str):
+    os.makedirs(dst, exist_ok=True)
+    for root, dirs, files in os.walk(src):
+        rel = os.path.relpath(root, src)
+        target = os.path.join(dst, rel) if rel != "." else dst
+        for d in dirs:
+            os.makedirs(os.path.join(target, d), exist_ok=True)
+        for f in files:
+            if f in ("LOCK", "lockfile"):
+                continue
+            try:
+                _clone_file(os.path.join(root, f), os.path.join(target, f))
+            except OSError as e:
+                print(f"Skipping {os.path.join(root, f)}: {e}")
+
+
+class ProfileSnapshotManager:
+    """
+    Builds a minimal snapshot of a Chrome profile and hands out cheap per-instance clones.
+
+    Only the session-relevant files (see USER_DATA_FILES and PROFILE_FILES) are copied, into
+    one shared snapshot that is rebuilt only when those source files change. Each browser
+    instance then gets its own clone of the snapshot, made with copy-on-write clones when
+    the filesystem supports them.
+    """
+
+    def __init__(
+        self,
+        user_data_dir: str,
+        profile_directory: str = "Default",
+        snapshot_root: str = DEFAULT_SNAPSHOT_ROOT,
+        extra_files: Optional[List[str]] = None
+    ):
+        """
+        Args:
+            user_data_dir (str): Source Chrome User Data directory.
+            profile_directory (str): Profile folder inside it (e.g. "Default").
+            snapshot_root (str): Where snapshots are stored.
+            extra_files (List[str], optional): Additional paths, relative to the profile folder, to include.
+        """
+        self.user_data_dir = os.path.abspath(os.path.expanduser(user_data_dir))
+        self.profile_directory = profile_directory
+        self.profile_files = PROFILE_FILES + list(extra_files or [])
+        key = hashlib.sha256(f"{self.user_data_dir}\0{profile_directory}".encode("utf-8")).hexdigest()[:16]
+        self.base_dir = os.path.join(os.path.expanduser(snapshot_root), key)
+        self.snapshot_dir = os.path.join(self.base_dir, "snapshot")
+        self.manifest_file = os.path.join(self.base_dir, "manifest.json")
+
+    def _sources(self) -> Iterator[Tuple[str, str]]:
+        """Yields (source path, path relative to the User Data root) for every included item."""
+        for name in USER_DATA_FILES:
+            yield os.path.join(self.user_data_dir, name), name
+        for name in self.profile_files:
+            rel = os.path.join(self.profile_directory, *name.split("/"))
+            yield os.path.join(self.user_data_dir, rel), rel
+
+    def fingerprint(self) -> str:
+        """Hash of the size and mtime of every included source file."""
+        h = hashlib.sha256()
+        for src, rel in self._sources():
+            if os.path.isdir(src):
+                for root, _, files in os.walk(src):
+                    for f in sorted(files):
+                        try:
+                            st = os.stat(os.path.join(root, f))
+                        except OSError:
+                            continue
+                        h.update(f"{os.path.relpath(os.path.join(root, f), self.user_data_dir)}:{st.st_size}:{st.st_mtime_ns}\n".encode())
+            elif os.path.exists(src):
+                st = os.stat(src)
+                h.update(f"{rel}:{st.st_size}:{st.st_mtime_ns}\n".encode())
+        return h.hexdigest()
+
+    def _manifest(self) -> Dict[str, str]:
+        try:
+            with open(self.manifest_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def ensure_snapshot(self) -> str:
+        """
+        Returns the snapshot directory, (re)building it if the source profile changed.
+        """
+        fingerprint = self.fingerprint()
+        if self._manifest().get("fingerprint") == fingerprint and os.path.isdir(self.snapshot_dir):
+            return self.snapshot_dir
+
+        print(f"Building profile snapshot for {self.user_data_dir} ({self.profile_directory})...")
+        os.makedirs(self.base_dir, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix="building-", dir=self.base_dir)
+        try:
+            for src, rel in self._sources():
+                dst = os.path.join(staging, rel)
+                if os.path.isdir(src):
+                    _copy_tree(src, dst)
+                elif os.path.exists(src):
+                    os.makedirs(os.path.dirname(dst), exist_ok=True)
+                    try:
+                        _clone_file(src, dst)
+                    except OSError as e:
+                        print(f"Skipping {src}: {e}")
+
+            # Swap the new snapshot in; running instances use their own clones.
+            old = None
+            if os.path.exists(self.snapshot_dir):
+                old = tempfile.mkdtemp(prefix="old-", dir=self.base_dir)
+                try:
+                    os.replace(self.snapshot_dir, os.path.join(old, "snapshot"))
+                except OSError:
+                    pass
+            try:
+                os.replace(staging, self.snapshot_dir)
+                staging = None
+            except OSError:
+                # Another process installed a snapshot at the same time; use theirs.
+                pass
+            if old:
+                shutil.rmtree(old, ignore_errors=True)
+
+            tmp = f"{self.manifest_file}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"fingerprint": fingerprint, "source": self.user_data_dir, "profile": self.profile_directory}, f)
+            os.replace(tmp, self.manifest_file)
+        finally:
+            if staging:
+                shutil.rmtree(staging, ignore_errors=True)
+        return self.snapshot_dir
+
+    def create_instance(self) -> str:
+        """
+        Creates a private User Data directory for one browser, cloned from the snapshot.
+
+        Returns:
+            str: Path to pass as `--user-data-dir`. Delete it with `remove_instance()`.
+        """
+        snapshot = self.ensure_snapshot()
+        # Next to the snapshot, so the clone stays on one filesystem and can use reflinks.
+        instances = os.path.join(self.base_dir, "instances")
+        os.makedirs(instances, exist_ok=True)
+        instance = tempfile.mkdtemp(prefix="quillbot-profile-", dir=instances)
+        _copy_tree(snapshot, instance)
+        return instance
+
+    @staticmethod
+    def remove_instance(path: str):
+        """Deletes an instance directory created by `create_instance()`."""
+        shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,63 @@
+import os
+from typing import Dict, Optional
+
+
+def _parent_map() -> Dict[int, int]:
+    """Maps every pid to its parent pid using /proc (Linux)."""
+    parents = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                parents[int(entry)] = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+    return parents
+
+
+def process_tree_rss(root_pid: Optional[int]) -> Optional[int]:
+    """
+    Resident memory of a process and all of its descendants, in bytes.
+
+    For a chromedriver pid this covers Chrome and its renderers. Uses psutil when installed,
+    otherwise /proc. Returns None if neither is available or the process is gone.
+    """
+    if not root_pid:
+        return None
+    try:
+        import psutil
+
+        proc = psutil.Process(root_pid)
+        total = proc.memory_info().rss
+        for child in proc.children(recursive=True):
+            try:
+                total += child.memory_info().rss
+            except psutil.Error:
+                pass
+        return total
+    except ImportError:
+        pass
+    except Exception:
+        return None
+
+    if not os.path.isdir(f"/proc/{root_pid}"):
+        return None
+    parents = _parent_map()
+    pids = {root_pid}
+    changed = True
+    while changed:
+        changed = False
+        for pid, ppid in parents.items():
+            if ppid in pids and pid not in pids:
+                pids.add(pid)
+                changed = True
+    page = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/statm", "r") as f:
+                total += int(f.read().split()[1]) * page
+        except (OSError, IndexError, ValueError):
+            continue
+    return total
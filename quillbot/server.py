@@ -0,0 +1,398 @@
+import json
+import os
+import queue
+import socket
+import socketserver
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+from .controller import ConcurrencyController
+from .metrics import BotMetrics
+from .pool import QuillbotPool
+
+OPERATIONS = ("paraphrase", "humanize")
+HUMANIZER_MODES = ("Basic", "Advanced")
+
+
+class Job:
+    """A single paraphrase/humanize request and its progress."""
+
+    def __init__(self, text: str, operation: str, mode: str = "Basic", markdown: bool = False):
+        self.id = uuid.uuid4().hex
+        self.text = text
+        self.operation = operation
+        self.mode = mode
+        self.markdown = markdown
+        self.status = "queued"
+        self.result: Optional[str] = None
+        self.error: Optional[str] = None
+        self.chunks: List[Dict[str, Any]] = []
+        self.submitted = time.time()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.changed = threading.Condition()
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("done", "failed")
+
+    def to_dict(self, include_chunks: bool = False) -> Dict[str, Any]:
+        data = {
+            "id": self.id,
+            "status": self.status,
+            "operation": self.operation,
+            "mode": self.mode,
+            "success": self.status == "done",
+            "result": self.result,
+            "error": self.error,
+            "chunks_done": len(self.chunks),
+            "submitted": self.submitted,
+            "started": self.started,
+            "finished": self.finished,
+        }
+        if include_chunks:
+            data["chunks"] = self.chunks
+        return data
+
+
+class QuillbotService:
+    """
+    Job queue in front of a pool of warm Quillbot sessions.
+
+    A fixed number of worker threads each check out a session, run one job and return it.
+    The queue is bounded; `submit()` refuses new work when it is full so callers can back off.
+    """
+
+    def __init__(
+        self,
+        workers: int = 1,
+        queue_size: int = 100,
+        keep_jobs: int = 1000,
+        **bot_kwargs: Any
+    ):
+        """
+        Args:
+            workers (int): Number of concurrent jobs, and browsers kept warm.
+            queue_size (int): Maximum number of queued (not yet running) jobs.
+            keep_jobs (int): Finished jobs remembered for polling before they are dropped.
+            **bot_kwargs: Keyword arguments forwarded to Quillbot. All sessions share one
+                `metrics` store, which is created if not given.
+        """
+        self.bot_metrics: BotMetrics = bot_kwargs.setdefault("metrics", BotMetrics())
+        if isinstance(bot_kwargs.get("controller"), ConcurrencyController):
+            bot_kwargs["controller"].attach(self.bot_metrics)
+        self.pool = QuillbotPool(size=workers, max_size=workers, **bot_kwargs)
+        self.queue: "queue.Queue[Optional[Job]]" = queue.Queue(maxsize=queue_size)
+        self.keep_jobs = keep_jobs
+        self.jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self.started = time.time()
+        self.counters = {
+            "jobs_submitted": 0,
+            "jobs_rejected": 0,
+            "jobs_completed": 0,
+            "jobs_failed": 0,
+            "chunks_processed": 0,
+            "chunk_seconds": 0.0,
+        }
+        self._lock = threading.Lock()
+        self._threads = [
+            threading.Thread(target=self._work, name=f"quillbot-worker-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for t in self._threads:
+            t.start()
+
+    def submit(self, text: str, operation: str, mode: str = "Basic", markdown: bool = False) -> Optional[Job]:
+        """
+        Queues a job.
+
+        Returns:
+            Job: The queued job, or None if the queue is full.
+
+        Raises:
+            ValueError: For an unknown operation, or an unknown mode for humanize.
+        """
+        if operation not in OPERATIONS:
+            raise ValueError(f"Invalid operation: {operation}")
+        if operation == "humanize" and mode not in HUMANIZER_MODES:
+            raise ValueError(f"Invalid mode: {mode} (expected one of {', '.join(HUMANIZER_MODES)})")
+        job = Job(text, operation, mode, markdown)
+        try:
+            self.queue.put_nowait(job)
+        except queue.Full:
+            with self._lock:
+                self.counters["jobs_rejected"] += 1
+            return None
+        with self._lock:
+            self.counters["jobs_submitted"] += 1
+            self.jobs[job.id] = job
+            while len(self.jobs) > self.keep_jobs:
+                oldest = next(iter(self.jobs.values()))
+                if not oldest.done:
+                    break
+                self.jobs.popitem(last=False)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def _work(self):
+        while True:
+            job = self.queue.get()
+            if job is None:
+                break
+            with job.changed:
+                job.status = "running"
+                job.started = time.time()
+                job.changed.notify_all()
+            try:
+                with self.pool.session() as bot:
+                    failed = self._run(bot, job)
+                status = "failed" if failed else "done"
+                if failed:
+                    job.error = f"Chunks failed: {', '.join(str(i + 1) for i in failed)}"
+            except Exception as e:
+                status = "failed"
+                job.error = str(e)
+            with self._lock:
+                self.counters["jobs_completed" if status == "done" else "jobs_failed"] += 1
+            with job.changed:
+                job.status = status
+                job.finished = time.time()
+                job.changed.notify_all()
+
+    def _run(self, bot, job: Job) -> List[int]:
+        """Runs a job on `bot` and returns the indices of the chunks that failed."""
+        if job.markdown:
+            if job.operation == "paraphrase":
+                job.result = bot.paraphrase(job.text, markdown=True)
+            else:
+                job.result = bot.humanize(job.text, job.mode, markdown=True)
+            # Failed markdown pieces keep their original text, so only the report shows them.
+            report = bot.last_report
+            return [f.index for f in report.failures] if report else []
+        if job.operation == "paraphrase":
+            results = bot.iter_paraphrase(job.text)
+        else:
+            results = bot.iter_humanize(job.text, job.mode)
+        outputs: Dict[int, Optional[str]] = {}
+        for r in results:
+            outputs[r.index] = r.output
+            with self._lock:
+                self.counters["chunks_processed"] += 1
+                self.counters["chunk_seconds"] += r.seconds
+            with job.changed:
+                job.chunks.append({"index": r.index, "output": r.output, "seconds": round(r.seconds, 3)})
+                job.changed.notify_all()
+        job.result = " ".join(outputs[i] for i in sorted(outputs) if outputs[i]).strip()
+        return [i for i in sorted(outputs) if outputs[i] is None]
+
+    def health(self) -> Dict[str, Any]:
+        stats = self.pool.stats()
+        return {
+            "status": "ok",
+            "uptime": round(time.time() - self.started, 1),
+            "queue_depth": self.queue.qsize(),
+            "queue_capacity": self.queue.maxsize,
+            "sessions": stats,
+        }
+
+    def metrics(self) -> str:
+        """Returns the service counters and the sessions' BotMetrics in Prometheus text format."""
+        with self._lock:
+            counters = dict(self.counters)
+        stats = self.pool.stats()
+        lines = [
+            "# TYPE quillbot_jobs_submitted_total counter",
+            f"quillbot_jobs_submitted_total {counters['jobs_submitted']}",
+            "# TYPE quillbot_jobs_rejected_total counter",
+            f"quillbot_jobs_rejected_total {counters['jobs_rejected']}",
+            "# TYPE quillbot_jobs_completed_total counter",
+            f"quillbot_jobs_completed_total {counters['jobs_completed']}",
+            "# TYPE quillbot_jobs_failed_total counter",
+            f"quillbot_jobs_failed_total {counters['jobs_failed']}",
+            "# TYPE quillbot_chunk_seconds summary",
+            f"quillbot_chunk_seconds_sum {counters['chunk_seconds']:.3f}",
+            f"quillbot_chunk_seconds_count {counters['chunks_processed']}",
+            "# TYPE quillbot_queue_depth gauge",
+            f"quillbot_queue_depth {self.queue.qsize()}",
+            "# TYPE quillbot_sessions gauge",
+            f'quillbot_sessions{{state="idle"}} {stats["idle"]}',
+            f'quillbot_sessions{{state="in_use"}} {stats["in_use"]}',
+        ]
+        return "\n".join(lines) + "\n" + self.bot_metrics.to_prometheus()
+
+    def close(self):
+        for _ in self._threads:
+            try:
+                self.queue.put_nowait(None)
+            except queue.Full:
+                break
+        self.pool.close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """HTTP front-end: POST /jobs, GET /jobs/<id>, GET /jobs/<id>/stream, GET /health, GET /metrics."""
+
+    service: QuillbotService
+    protocol_version = "HTTP/1.1"
+
+    def address_string(self) -> str:
+        # Unix socket clients have no (host, port) address.
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def _send(self, status: int, body: Any, content_type: str = "application/json"):
+        data = body.encode("utf-8") if isinstance(body, str) else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path == "/health":
+            return self._send(200, self.service.health())
+        if path == "/metrics":
+            return self._send(200, self.service.metrics(), "text/plain; version=0.0.4")
+
+        parts = path.strip("/").split("/")
+        if len(parts) in (2, 3) and parts[0] == "jobs":
+            job = self.service.get(parts[1])
+            if not job:
+                return self._send(404, {"error": "Job not found"})
+            if len(parts) == 2:
+                return self._send(200, job.to_dict(include_chunks=True))
+            if parts[2] == "stream":
+                return self._stream(job)
+        self._send(404, {"error": "Not found"})
+
+    def do_POST(self):
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path != "/jobs":
+            return self._send(404, {"error": "Not found"})
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(payload, dict):
+                return self._send(400, {"success": False, "result": None, "error": "Request body must be a JSON object"})
+            text = payload.get("text")
+            if not text or not str(text).strip():
+                return self._send(400, {"success": False, "result": None, "error": "Missing required field: text"})
+            job = self.service.submit(
+                str(text),
+                payload.get("operation", "paraphrase"),
+                payload.get("mode", "Basic"),
+                bool(payload.get("markdown", False)),
+            )
+        except ValueError as e:
+            return self._send(400, {"success": False, "result": None, "error": str(e)})
+
+        if job is None:
+            self.send_response(429)
+            self.send_header("Retry-After", "5")
+            self.send_header("Content-Type", "application/json")
+            data = json.dumps({"success": False, "result": None, "error": "Queue is full"}).encode("utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+            return
+
+        if payload.get("wait"):
+            with job.changed:
+                while not job.done:
+                    job.changed.wait()
+            return self._send(200, job.to_dict())
+        self._send(202, job.to_dict())
+
+    def _stream(self, job: Job):
+        """Streams chunk results as newline-delimited JSON until the job finishes."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def write(obj: Dict[str, Any]):
+            line = (json.dumps(obj) + "\n").encode("utf-8")
+            self.wfile.write(f"{len(line):x}\r\n".encode("ascii") + line + b"\r\n")
+            self.wfile.flush()
+
+        sent = 0
+        try:
+            while True:
+                with job.changed:
+                    while len(job.chunks) == sent and not job.done:
+                        job.changed.wait()
+                    new = job.chunks[sent:]
+                    finished = job.done
+                for chunk in new:
+                    write({"type": "chunk", **chunk})
+                sent += len(new)
+                if finished and sent == len(job.chunks):
+                    write({"type": "result", **job.to_dict()})
+                    break
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        print(f"[{self.address_string()}] {format % args}")
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
+    address_family = socket.AF_UNIX
+    daemon_threads = True
+
+    def server_bind(self):
+        socketserver.TCPServer.server_bind(self)
+        self.server_name = "localhost"
+        self.server_port = 0
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    unix_socket: Optional[str] = None,
+    workers: int = 1,
+    queue_size: int = 100,
+    **bot_kwargs: Any
+):
+    """
+    Runs the HTTP daemon until interrupted.
+
+    Args:
+        host (str): Interface to bind when serving over TCP.
+        port (int): TCP port.
+        unix_socket (str, optional): Serve on this Unix socket path instead of TCP.
+        workers (int): Number of warm browsers / concurrent jobs.
+        queue_size (int): Maximum number of queued jobs before submissions get HTTP 429.
+        **bot_kwargs: Keyword arguments forwarded to Quillbot.
+    """
+    print(f"Starting {workers} Quillbot session(s)...")
+    service = QuillbotService(workers=workers, queue_size=queue_size, **bot_kwargs)
+    handler = type("Handler", (_Handler,), {"service": service})
+
+    if unix_socket:
+        if os.path.exists(unix_socket):
+            os.unlink(unix_socket)
+        httpd = _UnixHTTPServer(unix_socket, handler)
+        print(f"Quillbot daemon listening on unix:{unix_socket}")
+    else:
+        httpd = ThreadingHTTPServer((host, port), handler)
+        httpd.daemon_threads = True
+        print(f"Quillbot daemon listening on http://{host}:{port}")
+
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("Shutting down...")
+    finally:
+        httpd.server_close()
+        service.close()
+        if unix_socket and os.path.exists(unix_socket):
+            os.unlink(unix_socket)
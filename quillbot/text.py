@@ -0,0 +1,132 @@
+import re
+from bisect import bisect_left
+from typing import List, Tuple
+
+_WORD_RE = re.compile(r"\b[\w']+\b")
+_SENTENCE_BREAK_RE = re.compile(r"(?<=[.!?])\s+")
+_CLAUSE_PUNCTUATION = frozenset(",;:\u2013\u2014")
+
+
+def _split_long_sentence(
+    text: str,
+    starts: List[int],
+    ends: List[int],
+    first: int,
+    last: int,
+    seg_start: int,
+    limit: int
+) -> Tuple[List[Tuple[int, int]], int, int]:
+    """
+    Cuts the words `first`..`last` (exclusive) of one sentence into pieces of at most `limit`
+    words, preferring to cut after a clause mark (, ; : dashes) in the back half of a piece.
+
+    Returns:
+        Tuple: The (start, end) character spans of the full pieces, plus the character offset
+        and first word index of the remainder, which the caller keeps packing.
+    """
+    pieces = []
+    piece_start = seg_start
+    a = first
+    while last - a > limit:
+        b = a + limit
+        cut = b
+        for k in range(b, a + limit // 2, -1):
+            gap = text[ends[k - 1]:starts[k]]
+            if any(c in _CLAUSE_PUNCTUATION for c in gap):
+                cut = k
+                break
+        pieces.append((piece_start, starts[cut]))
+        piece_start = starts[cut]
+        a = cut
+    return pieces, piece_start, a
+
+
+def split_text(text: str, limit: int = 125) -> List[str]:
+    """
+    Splits text into chunks of at most `limit` words, respecting sentence boundaries where possible.
+
+    Word positions are computed once and sentences are packed greedily, so chunks come as
+    close to the budget as the sentence boundaries allow. Sentences longer than `limit` are
+    cut at clause marks, or at word boundaries, so no chunk ever exceeds the limit. Chunks
+    are slices of the original text, so line breaks inside a chunk are preserved.
+
+    Args:
+        text (str): The text to split.
+        limit (int): Maximum words per chunk.
+
+    Returns:
+        List[str]: A list of text chunks.
+    """
+    if limit < 1:
+        raise ValueError("limit must be >= 1")
+
+    spans = [m.span() for m in _WORD_RE.finditer(text)]
+    if len(spans) <= limit:
+        return [text]
+    starts = [a for a, _ in spans]
+    ends = [b for _, b in spans]
+
+    chunks: List[str] = []
+
+    def flush(start: int, end: int):
+        chunk = text[start:end].strip()
+        if chunk:
+            chunks.append(chunk)
+
+    chunk_start = 0
+    chunk_end = 0
+    chunk_words = 0
+    word = 0
+    seg_start = 0
+    breaks = [m.span() for m in _SENTENCE_BREAK_RE.finditer(text)]
+    breaks.append((len(text), len(text)))
+
+    for seg_end, next_start in breaks:
+        first = word
+        word = bisect_left(starts, seg_end, word)
+        count = word - first
+
+        if chunk_words + count <= limit:
+            chunk_end = seg_end
+            chunk_words += count
+        elif count > limit:
+            flush(chunk_start, chunk_end)
+            pieces, chunk_start, remainder_first = _split_long_sentence(
+                text, starts, ends, first, word, seg_start, limit
+            )
+            for piece_start, piece_end in pieces:
+                flush(piece_start, piece_end)
+            # Carry the remainder forward so following sentences can fill the chunk.
+            chunk_end = seg_end
+            chunk_words = word - remainder_first
+        else:
+            flush(chunk_start, chunk_end)
+            chunk_start = seg_start
+            chunk_end = seg_end
+            chunk_words = count
+
+        seg_start = next_start
+
+    flush(chunk_start, chunk_end)
+    return chunks
+
+
+def split_problems(text: str, chunks: List[str], limit: int) -> List[str]:
+    """
+    Checks the guarantees of `split_text`: no chunk has more than `limit` words, and the
+    chunks hold exactly the words of `text`, in order.
+
+    Returns:
+        List[str]: A description of each broken guarantee; empty if the split is sound.
+    """
+    problems = []
+    for i, chunk in enumerate(chunks):
+        count = len(_WORD_RE.findall(chunk))
+        if count > limit:
+            problems.append(f"chunk {i+1} has {count} words (limit {limit})")
+    expected = _WORD_RE.findall(text)
+    actual = [w for chunk in chunks for w in _WORD_RE.findall(chunk)]
+    if actual != expected:
+        position = next((k for k, (a, b) in enumerate(zip(actual, expected)) if a != b), min(len(actual), len(expected)))
+        problems.append(f"words differ from word {position+1} on ({len(actual)} in chunks, {len(expected)} in text)")
+    return problems